@@ -0,0 +1,196 @@
+"""
+Karşılaştırma (Baseline) Modelleri
+
+LSTM ile karşılaştırılan klasik modeller tek yerden kurulur; evaluate_models.py
+ve sweep.py aynı varsayılan parametreleri kullanır.
+
+- fit_predict     : modeli tüm çekirdeklerle (n_jobs) eğitir, fit / predict süresini ölçer
+- cross_validate  : k katlı çapraz doğrulama; (model, kat) işleri paralel koşar,
+                    çekirdekler katlar ile model içi iş parçacıkları arasında bölünür
+- summarize       : katlar üzerinden ortalama / standart sapma tablosu
+- save_baselines / load_baselines : eğitilmiş modeller models/baselines/ altında
+                    joblib dosyaları + metadata.json (veri özeti, parametreler, süreler)
+"""
+import os
+import json
+import time
+import importlib
+
+import numpy as np
+
+# --- AYARLAR ---
+# Sınıflar yol olarak tutulur: scikit-learn (~2 sn import) yalnızca model kurulurken yüklenir
+BASELINES = {
+    'logistic_regression': ('Logistic Regression', 'sklearn.linear_model.LogisticRegression'),
+    'random_forest': ('Random Forest', 'sklearn.ensemble.RandomForestClassifier'),
+}
+DEFAULT_PARAMS = {
+    'logistic_regression': {},
+    'random_forest': {'n_estimators': 100, 'random_state': 42},
+}
+# Tablolarda baseline olmayan modellerin adları (blok CV LSTM'i de aynı tabloda gösterir)
+DISPLAY_NAMES = {'lstm': 'LSTM (Deep Learning)'}
+# n_jobs parametresi olan (çok çekirdekli eğitilebilen) modeller
+PARALLEL_BASELINES = {'random_forest'}
+N_JOBS = -1          # -1: tüm çekirdekler
+CV_FOLDS = 5
+RANDOM_STATE = 42
+METRICS = ['accuracy', 'f1', 'auc', 'fit_seconds', 'predict_seconds']
+BASELINE_FOLDER = os.path.join('models', 'baselines')
+METADATA_FILE = 'metadata.json'
+
+
+def make_baseline(name, params=None, n_jobs=None):
+    """Varsayılan parametrelerin üzerine `params` uygulanmış, eğitilmemiş model döndürür."""
+    if name not in BASELINES:
+        raise ValueError(f"Bilinmeyen model: {name} (seçenekler: {', '.join(BASELINES)})")
+    module, _, cls_name = BASELINES[name][1].rpartition('.')
+    cls = getattr(importlib.import_module(module), cls_name)
+    kwargs = {**DEFAULT_PARAMS[name], **(params or {})}
+    if n_jobs is not None and name in PARALLEL_BASELINES:
+        kwargs['n_jobs'] = n_jobs
+    return cls(**kwargs)
+
+
+def display_name(name):
+    return BASELINES[name][0] if name in BASELINES else DISPLAY_NAMES.get(name, name)
+
+
+def _n_cpus(n_jobs):
+    from joblib import cpu_count
+    return cpu_count() if n_jobs is None or n_jobs < 0 else max(1, n_jobs)
+
+
+def fit_predict(name, X_train, y_train, X_test, params=None, n_jobs=N_JOBS):
+    """
+    Modeli eğitir ve test olasılıklarını üretir.
+    Dönüş: {'model', 'y_prob', 'fit_seconds', 'predict_seconds'}
+    """
+    model = make_baseline(name, params, n_jobs=n_jobs)
+    t0 = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    y_prob = model.predict_proba(X_test)[:, 1]
+    predict_seconds = time.perf_counter() - t0
+    return {'model': model, 'y_prob': y_prob, 'fit_seconds': fit_seconds,
+            'predict_seconds': predict_seconds}
+
+
+def score(y_true, y_prob, threshold=0.5):
+    from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+    y_pred = (y_prob > threshold).astype(int)
+    return {'accuracy': accuracy_score(y_true, y_pred), 'f1': f1_score(y_true, y_pred),
+            'auc': roc_auc_score(y_true, y_prob)}
+
+
+def _run_fold(name, params, X, y, fold, train_idx, test_idx, n_jobs):
+    result = fit_predict(name, X[train_idx], y[train_idx], X[test_idx], params, n_jobs)
+    return {'model': name, 'fold': fold, **score(y[test_idx], result['y_prob']),
+            'fit_seconds': result['fit_seconds'], 'predict_seconds': result['predict_seconds']}
+
+
+def cross_validate(names, X, y, folds=CV_FOLDS, n_jobs=N_JOBS, params=None,
+                   random_state=RANDOM_STATE, splits=None):
+    """
+    Her model için k katlı (StratifiedKFold) çapraz doğrulama. Tüm (model, kat) işleri
+    joblib ile paralel koşar; model içi n_jobs = çekirdek / eşzamanlı iş, böylece
+    toplam iş parçacığı çekirdek sayısını aşmaz.
+    splits: hazır (train_idx, test_idx) listesi verilirse katlar yerine kullanılır.
+    Dönüş: kat başına bir satırlık DataFrame
+    """
+    import pandas as pd
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+
+    params = params or {}
+    if splits is None:
+        splits = list(StratifiedKFold(n_splits=folds, shuffle=True,
+                                      random_state=random_state).split(np.zeros(len(y)), y))
+    jobs = [(name, fold, train_idx, test_idx) for name in names
+            for fold, (train_idx, test_idx) in enumerate(splits)]
+
+    cpus = _n_cpus(n_jobs)
+    workers = min(len(jobs), cpus)
+    inner_jobs = max(1, cpus // workers)
+    rows = Parallel(n_jobs=workers)(
+        delayed(_run_fold)(name, params.get(name), X, y, fold, train_idx, test_idx, inner_jobs)
+        for name, fold, train_idx, test_idx in jobs)
+    return pd.DataFrame(rows)
+
+
+def summarize(cv_results):
+    """Kat sonuçlarından model başına ortalama / standart sapma tablosu."""
+    summary = cv_results.groupby('model', sort=False)[METRICS].agg(['mean', 'std'])
+    summary.columns = [f'{metric}_{stat}' for metric, stat in summary.columns]
+    return summary
+
+
+def print_cv_table(summary, folds, title='ÇAPRAZ DOĞRULAMA'):
+    print(f"\n📐 {folds} KATLI {title} (ortalama ± std)")
+    print("=" * 95)
+    print(f"{'Model Adı':<22} | {'Accuracy':<15} | {'F1-Score':<15} | {'AUC Score':<15} | "
+          f"{'Fit (sn)':<8} | {'Predict (sn)':<8}")
+    print("-" * 95)
+    for name, row in summary.iterrows():
+        cells = [f"{row[f'{m}_mean']:.4f} ± {row[f'{m}_std']:.4f}" for m in ['accuracy', 'f1', 'auc']]
+        print(f"{display_name(name):<22} | {cells[0]:<15} | {cells[1]:<15} | {cells[2]:<15} | "
+              f"{row['fit_seconds_mean']:<8.3f} | {row['predict_seconds_mean']:<8.4f}")
+
+
+def baseline_path(name, folder=BASELINE_FOLDER):
+    return os.path.join(folder, f'{name}.joblib')
+
+
+def read_metadata(folder=BASELINE_FOLDER):
+    try:
+        with open(os.path.join(folder, METADATA_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(models, metadata, folder=BASELINE_FOLDER):
+    """
+    models   : {ad: eğitilmiş model}
+    metadata : {ad: kayıt} -> metadata.json (diğer modellerin kayıtları korunur)
+    """
+    import joblib
+
+    os.makedirs(folder, exist_ok=True)
+    for name, model in models.items():
+        tmp_path = f'{baseline_path(name, folder)}.tmp'
+        joblib.dump(model, tmp_path)
+        os.replace(tmp_path, baseline_path(name, folder))
+
+    merged = {**read_metadata(folder), **metadata}
+    tmp_path = os.path.join(folder, f'{METADATA_FILE}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(merged, f, indent=2)
+    os.replace(tmp_path, os.path.join(folder, METADATA_FILE))
+    return folder
+
+
+def load_baselines(names, expected=None, folder=BASELINE_FOLDER):
+    """
+    Kayıtlı modelleri yükler. expected ({alan: değer}, örn. data_hash) kayıttakiyle
+    uyuşmazsa ya da model yoksa ValueError verir: eski veriyle eğitilmiş model puanlanmaz.
+    Dönüş: ({ad: model}, {ad: kayıt})
+    """
+    import joblib
+
+    metadata = read_metadata(folder)
+    models = {}
+    for name in names:
+        record = metadata.get(name)
+        if record is None or not os.path.exists(baseline_path(name, folder)):
+            raise ValueError(f"{display_name(name)} modeli bulunamadı ({baseline_path(name, folder)}). "
+                             "Önce 'python -m src.train_baselines' çalıştırın.")
+        for field, value in (expected or {}).items():
+            if record.get(field) != value:
+                raise ValueError(f"{display_name(name)} modeli farklı bir {field} ile eğitilmiş. "
+                                 "'python -m src.train_baselines' ile yeniden eğitin.")
+        models[name] = joblib.load(baseline_path(name, folder))
+    return models, {name: metadata[name] for name in names}
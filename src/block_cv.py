@@ -0,0 +1,326 @@
+"""
+Mekânsal / Zamansal Blok Çapraz Doğrulama
+
+Rastgele bölmede aynı yangına ve aynı güne ait komşu noktalar eğitim ve test
+kümelerine birlikte düşer; model komşusunu ezberleyerek yüksek skor alır ve
+bölge genelinde (risk_map) hangi modelin kullanılacağına bu skorlarla karar verilemez.
+
+Bu modül satırları bloklara ayırır ve her bloğu bütünüyle tek bir kata koyar:
+- spatial        : ROI, TILE_DEGREES boyutunda karolara bölünür (lon / lat gerekir)
+- temporal       : ACQ_DATE, BLOCK_DAYS günlük bloklara bölünür
+- spatiotemporal : (karo, zaman bloğu) çiftleri
+- random         : karşılaştırma için eski davranış (StratifiedKFold)
+
+Bloklar StratifiedGroupKFold ile katlara dağıtılır (sınıf oranları korunur).
+buffer > 0 ise test bloklarına komşu (her blok boyutunda ±buffer) bloklar eğitimden
+çıkarılır. Aynı katlar hem karşılaştırma modellerine (baselines.cross_validate, joblib)
+hem LSTM'e (süreç havuzu, her işçi bir kat) verilir; sonuçlar tek tabloda toplanır.
+
+    python -m src.block_cv --strategy spatial --folds 5
+    python -m src.block_cv --strategy temporal --models random_forest lstm --buffer 1
+"""
+import os
+import time
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from src.dataset_store import open_dataset, read_arrays
+from src.prepared_data import fit_scaled, fit_sequences, FEATURES, TEST_SIZE, RANDOM_STATE
+
+# raster_backend (pandas) yalnızca bloklar kurulurken yüklenir: evaluate_models ve
+# train_baselines bu modülü içe aktarır, --help hızlı kalır.
+
+# --- AYARLAR ---
+DATA_NAME = 'Antalya_Merged_Dataset'
+DATA_PATH = 'data/Antalya_Merged_Dataset.csv'
+RESULTS_FOLDER = 'results'
+BLOCK_CV_RESULTS_PATH = os.path.join(RESULTS_FOLDER, 'block_cv.csv')
+
+STRATEGIES = ('random', 'spatial', 'temporal', 'spatiotemporal')
+TILE_DEGREES = 0.25   # ~25 km karolar: ROI (3.3° x 1.5°) ~ 14 x 6 karo
+BLOCK_DAYS = 30       # Zaman bloğu uzunluğu
+BUFFER = 0            # Test bloklarının çevresinde eğitimden çıkarılan blok sayısı
+CV_FOLDS = 5
+MODELS = ['logistic_regression', 'random_forest', 'lstm']
+
+# LSTM katları (train_model.py varsayılanları; erken durdurma eğitim katından ayrılan kümede)
+LSTM_PARAMS = {'units': [64, 32], 'dropout': 0.2, 'batch_size': 32, 'epochs': 50}
+LSTM_VAL_SIZE = 0.1
+
+# İşçi süreç durumu (initializer ile bir kez doldurulur)
+_WORKER = {}
+
+
+def block_coordinates(arrays, strategy, tile_degrees=TILE_DEGREES, block_days=BLOCK_DAYS):
+    """
+    Satır başına blok koordinatları (n, d): spatial -> (karo satırı, karo sütunu),
+    temporal -> (zaman bloğu), spatiotemporal -> üçü birden.
+    """
+    if strategy not in STRATEGIES or strategy == 'random':
+        raise ValueError(f"Bilinmeyen blok stratejisi: {strategy} (geçerli: {', '.join(STRATEGIES[1:])})")
+
+    from src.raster_backend import ROI_BOUNDS, DAY_MS
+
+    columns = []
+    if strategy in ('spatial', 'spatiotemporal'):
+        if 'lon' not in arrays or 'lat' not in arrays:
+            raise ValueError("Veri setinde 'lon' / 'lat' sütunları yok. Mekânsal bloklar için veriyi "
+                             "koordinatlarla yeniden oluşturun (python -m src.ingest fire nonfire).")
+        west, _, _, north = ROI_BOUNDS
+        columns.append(np.floor((north - np.asarray(arrays['lat'], dtype=np.float64)) / tile_degrees))
+        columns.append(np.floor((np.asarray(arrays['lon'], dtype=np.float64) - west) / tile_degrees))
+    if strategy in ('temporal', 'spatiotemporal'):
+        columns.append(np.asarray(arrays['ACQ_DATE'], dtype=np.int64) // (block_days * DAY_MS))
+    return np.column_stack(columns).astype(np.int64)
+
+
+def _encode(coords, low, size):
+    """Blok koordinatlarını tek bir tam sayı anahtara çevirir (karışık taban)."""
+    key = np.zeros(len(coords), dtype=np.int64)
+    for d in range(coords.shape[1]):
+        key = key * size[d] + (coords[:, d] - low[d])
+    return key
+
+
+def _apply_buffer(train_idx, test_idx, coords, buffer):
+    """Test bloklarına her boyutta en fazla `buffer` blok uzaklıktaki eğitim satırlarını atar."""
+    if buffer <= 0:
+        return train_idx
+    low = coords.min(axis=0) - buffer
+    size = coords.max(axis=0) + buffer - low + 1
+    test_blocks = np.unique(coords[test_idx], axis=0)
+    near = [_encode(test_blocks + np.array(offset), low, size)
+            for offset in itertools.product(range(-buffer, buffer + 1), repeat=coords.shape[1])]
+    return train_idx[~np.isin(_encode(coords[train_idx], low, size), np.concatenate(near))]
+
+
+def block_splits(arrays, y, strategy='spatial', folds=CV_FOLDS, rows=None, tile_degrees=TILE_DEGREES,
+                 block_days=BLOCK_DAYS, buffer=BUFFER, random_state=RANDOM_STATE):
+    """
+    arrays: en az ACQ_DATE (ve mekânsal stratejilerde lon / lat) içeren {sütun: dizi}
+    rows: yalnızca bu satırlar katlara dağıtılır (örn. zaman serisi kurulabilen satırlar)
+    Dönüş: [(train_idx, test_idx)] - indeksler tüm veri setine göredir
+    """
+    from sklearn.model_selection import StratifiedKFold, StratifiedGroupKFold
+
+    y = np.asarray(y)
+    rows = np.arange(len(y)) if rows is None else np.asarray(rows)
+    if strategy == 'random':
+        splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state)
+        return [(rows[a], rows[b]) for a, b in splitter.split(np.zeros(len(rows)), y[rows])]
+
+    coords = block_coordinates(arrays, strategy, tile_degrees, block_days)
+    groups = np.unique(coords[rows], axis=0, return_inverse=True)[1].ravel()
+    n_blocks = groups.max() + 1 if len(groups) else 0
+    if n_blocks < folds:
+        raise ValueError(f"{strategy} stratejisi yalnızca {n_blocks} blok üretti, {folds} kat için yetersiz. "
+                         f"Blokları küçültün (--tile-degrees / --block-days) ya da kat sayısını azaltın.")
+
+    splitter = StratifiedGroupKFold(n_splits=folds, shuffle=True, random_state=random_state)
+    splits = []
+    for a, b in splitter.split(np.zeros(len(rows)), y[rows], groups):
+        train_idx, test_idx = rows[a], rows[b]
+        train_idx = _apply_buffer(train_idx, test_idx, coords, buffer)
+        if len(np.unique(y[train_idx])) < 2:
+            raise ValueError(f"{strategy} katlarından birinde eğitim kümesi tek sınıf içeriyor "
+                             f"(tampon: {buffer}). Tamponu ya da blok boyutunu küçültün.")
+        splits.append((train_idx, test_idx))
+    return splits
+
+
+def holdout_split(data_path, n_rows, strategy, test_size=TEST_SIZE, random_state=RANDOM_STATE,
+                  tile_degrees=TILE_DEGREES, block_days=BLOCK_DAYS, buffer=BUFFER):
+    """
+    Tek eğitim / test bölmesi: round(1 / test_size) katlı blok bölmenin ilk katı test kümesidir.
+    Dönüş: {'train_idx', 'test_idx'} (prepared_data.split_indices ile aynı biçim)
+    """
+    arrays = block_arrays(data_path, strategy)
+    y = np.asarray(read_arrays(data_path, ['label'])['label'])
+    if len(y) != n_rows:
+        raise ValueError(f"{data_path}: {len(y)} satır var, {n_rows} bekleniyordu.")
+    folds = max(2, int(round(1 / test_size)))
+    train_idx, test_idx = block_splits(arrays, y, strategy, folds, tile_degrees=tile_degrees,
+                                       block_days=block_days, buffer=buffer, random_state=random_state)[0]
+    return {'train_idx': train_idx, 'test_idx': test_idx}
+
+
+def block_arrays(data_path, strategy):
+    """Blok koordinatları için gereken sütunlar (mmap)."""
+    if strategy == 'random':
+        return {}
+    if strategy == 'temporal':
+        return read_arrays(data_path, ['ACQ_DATE'])
+    try:
+        return read_arrays(data_path, ['lon', 'lat', 'ACQ_DATE'])
+    except (FileNotFoundError, KeyError, ValueError):
+        # Eski veri setlerinde lon / lat yok: block_coordinates anlaşılır bir hata verir
+        return read_arrays(data_path, ['ACQ_DATE'])
+
+
+def describe_splits(splits, y):
+    """Kat başına eğitim / test boyutu ve test kümesindeki yangın oranı."""
+    for fold, (train_idx, test_idx) in enumerate(splits):
+        print(f"  Kat {fold}: eğitim {len(train_idx):>7} | test {len(test_idx):>7} | "
+              f"test yangın oranı {np.mean(y[test_idx]):.3f}")
+
+
+# --- LSTM katları (süreç havuzu) ---
+
+def _init_worker(data_path, sequence_steps, raster_folder, threads):
+    """Her işçide bir kez: iş parçacığı sınırları + önbellekten veri (mmap)."""
+    from src.sweep import limit_threads
+
+    limit_threads(threads, use_tf=True)
+    scaled = fit_scaled(data_path)
+    _WORKER['y'] = scaled['y']
+    if sequence_steps > 1:
+        _WORKER['X'] = fit_sequences(data_path, raster_folder, sequence_steps)['X_seq']
+    else:
+        _WORKER['X'] = scaled['X_scaled'].reshape(-1, 1, len(FEATURES))
+
+
+def _run_lstm_fold(fold, train_idx, test_idx, params, random_state):
+    from sklearn.model_selection import train_test_split
+    from src.sweep import fit_predict_lstm
+    from src.baselines import score
+
+    X, y = _WORKER['X'], _WORKER['y']
+    # Erken durdurma test katını görmez: eğitim katının bir kısmı doğrulama için ayrılır
+    fit_idx, val_idx = train_test_split(train_idx, test_size=LSTM_VAL_SIZE, random_state=random_state)
+    result = fit_predict_lstm(params, X[fit_idx], y[fit_idx], X[val_idx], y[val_idx], X_test=X[test_idx])
+    return {'model': 'lstm', 'fold': fold, **score(y[test_idx], result['y_prob']),
+            'fit_seconds': result['fit_seconds'], 'predict_seconds': result['predict_seconds'],
+            'epochs_run': result['epochs_run']}
+
+
+def cross_validate_lstm(data_path, splits, sequence_steps=1, raster_folder=None,
+                        params=None, max_workers=None, random_state=RANDOM_STATE):
+    """
+    Her kat ayrı bir işçi süreçte eğitilir. Çekirdekler işçilere bölünür
+    (işçi başına CPU / işçi sayısı TensorFlow iş parçacığı).
+    Dönüş: kat başına bir satırlık DataFrame (baselines.cross_validate ile aynı sütunlar)
+    """
+    import pandas as pd
+    from src.raster_backend import LOCAL_RASTER_FOLDER
+
+    raster_folder = raster_folder or LOCAL_RASTER_FOLDER
+    params = {**LSTM_PARAMS, **(params or {})}
+    cpus = os.cpu_count() or 1
+    max_workers = min(max_workers or cpus, len(splits)) or 1
+    threads = max(1, cpus // max_workers)
+    print(f"🧠 LSTM: {len(splits)} kat | {max_workers} işçi x {threads} iş parçacığı")
+
+    rows = []
+    # spawn: TensorFlow fork sonrası güvenli değil
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                             initargs=(data_path, sequence_steps, raster_folder, threads)) as pool:
+        futures = [pool.submit(_run_lstm_fold, fold, train_idx, test_idx, params, random_state)
+                   for fold, (train_idx, test_idx) in enumerate(splits)]
+        for future in as_completed(futures):
+            row = future.result()
+            rows.append(row)
+            print(f"  LSTM kat {row['fold']}: AUC {row['auc']:.4f} ({row['epochs_run']} epoch)")
+    return pd.DataFrame(rows).sort_values('fold').reset_index(drop=True)
+
+
+def run_block_cv(models=MODELS, strategy='spatial', folds=CV_FOLDS, tile_degrees=TILE_DEGREES,
+                 block_days=BLOCK_DAYS, buffer=BUFFER, sequence_steps=1, raster_folder=None,
+                 lstm_params=None, max_workers=None, n_jobs=None, data_path=None,
+                 output_path=BLOCK_CV_RESULTS_PATH, random_state=RANDOM_STATE):
+    """
+    Tüm modelleri AYNI blok katlarında çapraz doğrular.
+    Zaman serisi (sequence_steps > 1) kurulamayan satırlar tüm modellerden çıkarılır.
+    Dönüş: (kat sonuçları, model başına özet) ya da veri yoksa None
+    """
+    import pandas as pd
+    from src.baselines import cross_validate, summarize, print_cv_table, N_JOBS
+    from src.raster_backend import LOCAL_RASTER_FOLDER
+
+    raster_folder = raster_folder or LOCAL_RASTER_FOLDER
+
+    if data_path is None:
+        try:
+            data_path = open_dataset(DATA_NAME, DATA_PATH)
+        except FileNotFoundError:
+            print(f"❌ HATA: {DATA_PATH} bulunamadı!")
+            return None
+
+    print(f"🧱 Blok çapraz doğrulama: {strategy} | {folds} kat | karo {tile_degrees}° | "
+          f"blok {block_days} gün | tampon {buffer}")
+    # Önbellek ana süreçte doldurulur, LSTM işçileri yalnızca okur
+    scaled = fit_scaled(data_path)
+    X, y = scaled['X_scaled'], np.asarray(scaled['y'])
+    rows = None
+    if 'lstm' in models and sequence_steps > 1:
+        rows = np.flatnonzero(fit_sequences(data_path, raster_folder, sequence_steps)['valid'])
+
+    try:
+        splits = block_splits(block_arrays(data_path, strategy), y, strategy, folds, rows,
+                              tile_degrees, block_days, buffer, random_state)
+    except ValueError as e:
+        print(f"❌ HATA: {e}")
+        return None
+    describe_splits(splits, y)
+
+    t0 = time.perf_counter()
+    results = []
+    baselines = [name for name in models if name != 'lstm']
+    if baselines:
+        results.append(cross_validate(baselines, X, y, n_jobs=N_JOBS if n_jobs is None else n_jobs,
+                                      splits=splits))
+    if 'lstm' in models:
+        results.append(cross_validate_lstm(data_path, splits, sequence_steps, raster_folder,
+                                           lstm_params, max_workers, random_state))
+    cv_results = pd.concat(results, ignore_index=True)
+    cv_results['strategy'] = strategy
+
+    if output_path:
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        cv_results.to_csv(output_path, index=False)
+    summary = summarize(cv_results)
+    print_cv_table(summary, folds, title=f"BLOK ÇAPRAZ DOĞRULAMA [{strategy}]")
+    print(f"\n⏱️ Toplam süre: {time.perf_counter() - t0:.1f} sn")
+    if output_path:
+        print(f"📁 Kat sonuçları: {output_path}")
+    return cv_results, summary
+
+
+def add_block_arguments(parser):
+    """Blok ayarları; block_cv, train_model, train_baselines ve evaluate_models ortak kullanır."""
+    parser.add_argument('--tile-degrees', type=float, default=TILE_DEGREES,
+                        help="spatial / spatiotemporal: karo kenarı (derece)")
+    parser.add_argument('--block-days', type=int, default=BLOCK_DAYS,
+                        help="temporal / spatiotemporal: zaman bloğu uzunluğu (gün)")
+    parser.add_argument('--buffer', type=int, default=BUFFER,
+                        help="Test bloklarına bu kadar blok yakın eğitim satırlarını çıkar")
+    return parser
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LSTM ve karşılaştırma modelleri için blok çapraz doğrulama.")
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=MODELS)
+    parser.add_argument('--strategy', choices=STRATEGIES, default='spatial')
+    parser.add_argument('--folds', type=int, default=CV_FOLDS)
+    add_block_arguments(parser)
+    parser.add_argument('--sequence-steps', type=int, default=1,
+                        help="LSTM için zaman adımı sayısı")
+    parser.add_argument('--raster-folder', default=None,
+                        help="Zaman serileri için yerel raster klasörü (varsayılan: data/rasters)")
+    parser.add_argument('--epochs', type=int, default=LSTM_PARAMS['epochs'], help="LSTM en fazla epoch")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="LSTM kat süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help="Karşılaştırma modelleri için çekirdek sayısı (-1: tümü)")
+    parser.add_argument('--output', default=BLOCK_CV_RESULTS_PATH)
+    args = parser.parse_args()
+
+    run_block_cv(models=args.models, strategy=args.strategy, folds=args.folds,
+                 tile_degrees=args.tile_degrees, block_days=args.block_days, buffer=args.buffer,
+                 sequence_steps=args.sequence_steps, raster_folder=args.raster_folder,
+                 lstm_params={'epochs': args.epochs}, max_workers=args.workers, n_jobs=args.n_jobs,
+                 output_path=args.output)
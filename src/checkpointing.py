@@ -0,0 +1,132 @@
+"""
+Erken Durdurma, Ara Kayıt (Checkpoint) ve Kaldığı Yerden Devam
+
+Eğitim sabit 50 epoch yerine doğrulama kaybı (val_loss) iyileşmeyi bırakana kadar
+sürer. TrainingCheckpoint callback'i models/checkpoints/ altına şunları yazar:
+
+- last.keras        : son ara kayıt (optimizer durumu dahil), her `save_every` epoch'ta
+- best.weights.h5   : en düşük val_loss'lu ağırlıklar (eğitim sonunda geri yüklenir)
+- state.json        : epoch, en iyi değer, sabır sayacı ve çalıştırma anahtarı
+
+Çalıştırma anahtarı (veri özeti + model / girdi ayarları) farklıysa eski ara kayıt
+kullanılmaz; başka bir veriyle eğitilmiş ağırlıklardan devam edilmez.
+"""
+import os
+import json
+import shutil
+
+import numpy as np
+import tensorflow as tf
+
+# --- AYARLAR ---
+CHECKPOINT_FOLDER = os.path.join('models', 'checkpoints')
+LAST_MODEL = 'last.keras'
+BEST_WEIGHTS = 'best.weights.h5'
+STATE_FILE = 'state.json'
+MONITOR = 'val_loss'
+PATIENCE = 5         # İyileşme olmadan beklenecek epoch sayısı
+MIN_DELTA = 1e-4     # Bundan küçük düşüş iyileşme sayılmaz
+SAVE_EVERY = 1       # Kaç epoch'ta bir last.keras yazılır
+
+
+class TrainingCheckpoint(tf.keras.callbacks.Callback):
+    """val_loss'a göre erken durdurma + periyodik ara kayıt. Durumu diske yazıldığı için
+    eğitim yarıda kesilse de sabır sayacı ve en iyi değer ile birlikte devam edilebilir."""
+
+    def __init__(self, run_key, folder=CHECKPOINT_FOLDER, monitor=MONITOR, patience=PATIENCE,
+                 min_delta=MIN_DELTA, save_every=SAVE_EVERY):
+        super().__init__()
+        self.run_key = run_key
+        self.folder = folder
+        self.monitor = monitor
+        self.patience = patience
+        self.min_delta = min_delta
+        self.save_every = max(1, save_every)
+        self.best = np.inf
+        self.best_epoch = None
+        self.wait = 0
+        self.stopped = False
+
+    def _path(self, name):
+        return os.path.join(self.folder, name)
+
+    def _read_state(self):
+        try:
+            with open(self._path(STATE_FILE)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_state(self, epoch):
+        state = {'run_key': self.run_key, 'epoch': epoch, 'best': float(self.best),
+                 'best_epoch': self.best_epoch, 'wait': self.wait, 'stopped': self.stopped}
+        tmp_path = self._path(f'{STATE_FILE}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self._path(STATE_FILE))
+
+    def _save_last(self, epoch):
+        # Önce geçici dosyaya: yazım sırasında çökme eski ara kaydı bozmasın
+        tmp_path = self._path(f'tmp_{LAST_MODEL}')
+        self.model.save(tmp_path)
+        os.replace(tmp_path, self._path(LAST_MODEL))
+        self._write_state(epoch)
+
+    def reset(self):
+        """Yeni eğitim: eski ara kayıtları siler."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.makedirs(self.folder, exist_ok=True)
+
+    def restore(self):
+        """
+        Uyumlu bir ara kayıt varsa (model, başlangıç epoch'u) döndürür, yoksa None.
+        Başlangıç epoch'u model.fit(initial_epoch=...) için kullanılır.
+        """
+        state = self._read_state()
+        if state is None or not os.path.exists(self._path(LAST_MODEL)):
+            print("ℹ️ Ara kayıt bulunamadı, eğitim baştan başlıyor.")
+            return None
+        if state['run_key'] != self.run_key:
+            print("⚠️ Ara kayıt farklı veri / ayarlarla oluşturulmuş, eğitim baştan başlıyor.")
+            return None
+
+        model = tf.keras.models.load_model(self._path(LAST_MODEL))
+        self.best = state['best']
+        self.best_epoch = state['best_epoch']
+        self.wait = state['wait']
+        self.stopped = state['stopped']
+        print(f"🔁 Ara kayıttan devam: {state['epoch'] + 1}. epoch tamamlanmış ({self._best_text()})")
+        return model, state['epoch'] + 1
+
+    def on_epoch_end(self, epoch, logs=None):
+        current = (logs or {}).get(self.monitor)
+        if current is None:
+            raise ValueError(f"'{self.monitor}' metriği yok; validation_data verilmeli.")
+
+        if current < self.best - self.min_delta:
+            self.best, self.best_epoch, self.wait = float(current), epoch, 0
+            self.model.save_weights(self._path(BEST_WEIGHTS))
+        else:
+            self.wait += 1
+            if self.wait >= self.patience:
+                self.stopped = True
+                self.model.stop_training = True
+                print(f"\n🛑 Erken durdurma: {self.patience} epoch boyunca {self.monitor} iyileşmedi "
+                      f"({self._best_text()})")
+
+        if self.stopped or (epoch + 1) % self.save_every == 0:
+            self._save_last(epoch)
+
+    def _best_text(self):
+        if self.best_epoch is None:
+            return f"{self.monitor} hiç sonlu / iyileşen bir değer almadı"
+        return f"en iyi: {self.best_epoch + 1}. epoch, {self.monitor}: {self.best:.4f}"
+
+    def restore_best(self, model):
+        """En iyi ağırlıkları modele yükler (varsa). Hiç iyileşme olmadıysa model olduğu gibi kalır."""
+        if self.best_epoch is None:
+            print(f"⚠️ En iyi ağırlık kaydı yok ({self._best_text()}); son epoch'un ağırlıkları kullanılıyor.")
+        elif os.path.exists(self._path(BEST_WEIGHTS)):
+            model.load_weights(self._path(BEST_WEIGHTS))
+            print(f"✅ En iyi ağırlıklar yüklendi ({self._best_text()})")
+        return model
@@ -1,5 +1,13 @@
 import pandas as pd
+import numpy as np
 import os
+import shutil
+import tempfile
+import argparse
+
+from src.raster_backend import EXPORT_SELECTORS
+from src.dataset_store import write_table, store_path, read_table, exists, StoreWriter, STORE_FOLDER, DTYPES
+from src.stage_cache import stage_key, read_stamp, write_stamp
 
 # --- AYARLAR ---
 # Verilerin olduğu klasör
@@ -9,10 +17,30 @@ DATA_FOLDER = 'data'
 FIRE_DATA_PATH = os.path.join(DATA_FOLDER, 'Antalya_Yangin_Verisi_Tam.csv')
 NON_FIRE_DATA_PATH = os.path.join(DATA_FOLDER, 'Antalya_NonFire_Verisi_Final.csv')
 
-# Kaydedilecek Dosya (Bu da Data klasörüne gidecek)
+# Kaydedilecek Veri Seti (tipli sütunlu depo: data/store/Antalya_Merged_Dataset)
+OUTPUT_NAME = 'Antalya_Merged_Dataset'
+OUTPUT_STORE_PATH = store_path(OUTPUT_NAME)
+# İsteğe bağlı CSV dışa aktarımı
 OUTPUT_PATH = os.path.join(DATA_FOLDER, 'Antalya_Merged_Dataset.csv')
 
-def load_and_process_data():
+# Akış (streaming) modu ayarları
+CHUNK_SIZE = 100_000  # Bir seferde okunacak CSV satırı
+N_BUCKETS = 16        # Diskteki karıştırma kovası sayısı (kova başına ~toplam/N_BUCKETS satır bellekte)
+
+
+def merge_columns(paths=None):
+    """
+    Birleştirilen sütunlar: EXPORT_SELECTORS içinden her iki CSV başlığında da bulunanlar.
+    Yalnızca bir tabloda olan sütunlar (ör. yangın tablosundaki kova istatistikleri ya da
+    eski dışa aktarımlarda olmayan lon / lat) öbür tabloda boş kalıp dropna ile o tablonun
+    bütün satırlarını silerdi. label her tabloda ayrıca atanır.
+    """
+    headers = [set(pd.read_csv(path, nrows=0).columns) for path in paths or (FIRE_DATA_PATH, NON_FIRE_DATA_PATH)]
+    return [c for c in EXPORT_SELECTORS if c != 'label' and all(c in header for header in headers)]
+
+
+def load_and_process_data(export_to_csv=False):
+    """Yangın / yangın olmayan CSV'leri birleştirip depoya yazar. Dönüş: yazıldıysa True."""
     print(f"📂 Çalışma dizini: {os.getcwd()}")
     print(f"📂 '{DATA_FOLDER}' klasöründeki veriler işleniyor...")
 
@@ -26,8 +54,9 @@ def load_and_process_data():
 
     # 2. Verileri Oku
     try:
-        df_fire = pd.read_csv(FIRE_DATA_PATH)
-        df_non_fire = pd.read_csv(NON_FIRE_DATA_PATH)
+        columns = merge_columns()
+        df_fire = pd.read_csv(FIRE_DATA_PATH, usecols=columns)
+        df_non_fire = pd.read_csv(NON_FIRE_DATA_PATH, usecols=columns)
         print(f"✅ Yangın Verisi Okundu: {len(df_fire)} satır")
         print(f"✅ Normal Veri Okundu: {len(df_non_fire)} satır")
     except Exception as e:
@@ -50,15 +79,136 @@ def load_and_process_data():
     df_final = df_shuffled.dropna()
     print(f"✨ Temizlik sonrası toplam: {len(df_final)}")
 
-    # 7. Kaydet (Data klasörüne)
-    df_final.to_csv(OUTPUT_PATH, index=False)
+    # 7. Kaydet (Tipli sütunlu depo; CSV yalnızca istenirse)
+    # CSV önce yazılır ki depo daha yeni kalsın ve sonraki aşamalar CSV'yi tekrar içe aktarmasın
+    if export_to_csv:
+        df_final.to_csv(OUTPUT_PATH, index=False)
+    write_table(df_final, OUTPUT_STORE_PATH)
     
     print("-" * 40)
     print(f"🚀 İŞLEM BAŞARILI!")
-    print(f"📂 Dosya şuraya kaydedildi: {OUTPUT_PATH}")
+    print(f"📂 Veri deposu: {OUTPUT_STORE_PATH}")
+    if export_to_csv:
+        print(f"📂 CSV: {OUTPUT_PATH}")
     print("-" * 40)
     print("İlk 5 satır örneği:")
     print(df_final.head())
+    return True
+
+def load_and_process_data_streaming(export_to_csv=False, chunksize=CHUNK_SIZE, n_buckets=N_BUCKETS,
+                                    random_state=42):
+    """
+    Sınırlı bellekte birleştirme + temizlik + karıştırma (out-of-core).
+
+    1. Geçiş: CSV'ler `chunksize` satırlık parçalarla okunur, etiketlenir, boş satırlar
+       atılır ve her satır rastgele bir kovaya (diskte sütunlu depo) yazılır.
+    2. Geçiş: Her kova tek başına belleğe alınır, kendi içinde karıştırılır ve çıktıya eklenir.
+
+    Rastgele kova ataması + kova içi karıştırma, tüm veriyi bellekte sample(frac=1)
+    yapmakla aynı dağılımda bir karışım verir. Bellek ~ max(chunksize, toplam / n_buckets).
+    Dönüş: depo yazıldıysa True.
+    """
+    print(f"📂 '{DATA_FOLDER}' klasöründeki veriler akış modunda işleniyor "
+          f"(parça: {chunksize}, kova: {n_buckets})...")
+
+    if not os.path.exists(FIRE_DATA_PATH) or not os.path.exists(NON_FIRE_DATA_PATH):
+        print("❌ HATA: CSV dosyaları bulunamadı!")
+        print(f" - {FIRE_DATA_PATH}")
+        print(f" - {NON_FIRE_DATA_PATH}")
+        return
+
+    rng = np.random.default_rng(random_state)
+    os.makedirs(STORE_FOLDER, exist_ok=True)
+    bucket_root = tempfile.mkdtemp(prefix='buckets_', dir=STORE_FOLDER)
+    buckets = [StoreWriter(os.path.join(bucket_root, str(i))) for i in range(n_buckets)]
+
+    try:
+        # 1. GEÇİŞ: Oku -> Etiketle -> Temizle -> Kovalara dağıt
+        total_rows, kept_rows = 0, 0
+        columns = merge_columns()
+        dtypes = {c: t for c, t in DTYPES.items() if c in columns}
+        for path, label in [(FIRE_DATA_PATH, 1), (NON_FIRE_DATA_PATH, 0)]:
+            for chunk in pd.read_csv(path, chunksize=chunksize, dtype=dtypes, usecols=columns):
+                total_rows += len(chunk)
+                chunk['label'] = label
+                chunk = chunk.dropna()
+                kept_rows += len(chunk)
+
+                assignment = rng.integers(0, n_buckets, len(chunk))
+                for i in np.unique(assignment):
+                    buckets[i].append(chunk[assignment == i])
+            print(f"✅ {path} okundu")
+
+        for bucket in buckets:
+            bucket.close()
+        print(f"🧹 Temizlik öncesi toplam: {total_rows}")
+        print(f"✨ Temizlik sonrası toplam: {kept_rows}")
+
+        # 2. GEÇİŞ: Her kovayı karıştır ve çıktıya ekle
+        if export_to_csv and os.path.exists(OUTPUT_PATH):
+            os.remove(OUTPUT_PATH)
+        with StoreWriter(OUTPUT_STORE_PATH) as writer:
+            for bucket in buckets:
+                df_bucket = read_table(bucket.path, mmap=False)
+                if df_bucket.empty:
+                    continue
+                df_bucket = df_bucket.iloc[rng.permutation(len(df_bucket))]
+                if export_to_csv:
+                    df_bucket.to_csv(OUTPUT_PATH, mode='a', index=False,
+                                     header=not os.path.exists(OUTPUT_PATH))
+                writer.append(df_bucket)
+    finally:
+        shutil.rmtree(bucket_root, ignore_errors=True)
+
+    print("-" * 40)
+    print(f"🚀 İŞLEM BAŞARILI!")
+    print(f"📂 Veri deposu: {OUTPUT_STORE_PATH}")
+    if export_to_csv:
+        print(f"📂 CSV: {OUTPUT_PATH}")
+    print("-" * 40)
+    return True
+
+def run_merge_stage(export_to_csv=False, streaming=False, chunksize=CHUNK_SIZE, n_buckets=N_BUCKETS,
+                    force=False):
+    """
+    Birleştirme aşamasını yalnızca gerekirse çalıştırır. Anahtar: girdi CSV'lerinin
+    içerik özetleri + mod parametreleri. Çıktı deposundaki damga aynıysa aşama atlanır.
+    """
+    if not os.path.exists(FIRE_DATA_PATH) or not os.path.exists(NON_FIRE_DATA_PATH):
+        # Hata mesajını asıl fonksiyon versin
+        key = None
+    else:
+        params = {'streaming': streaming, 'random_state': 42}
+        if streaming:
+            params.update(chunksize=chunksize, n_buckets=n_buckets)
+        key = stage_key('merge', [FIRE_DATA_PATH, NON_FIRE_DATA_PATH], params)
+
+        up_to_date = exists(OUTPUT_STORE_PATH) and read_stamp(OUTPUT_STORE_PATH) == key
+        if up_to_date and not force and (not export_to_csv or os.path.exists(OUTPUT_PATH)):
+            print(f"⚡ Girdiler değişmedi ({key}), birleştirilmiş veri zaten güncel: {OUTPUT_STORE_PATH}")
+            return True
+
+    if streaming:
+        written = load_and_process_data_streaming(export_to_csv=export_to_csv, chunksize=chunksize,
+                                                  n_buckets=n_buckets)
+    else:
+        written = load_and_process_data(export_to_csv=export_to_csv)
+
+    # Yalnızca bu çalıştırmada yazılan depo damgalanır: okuma hatasında eski depo yeni
+    # girdilerin anahtarıyla damgalanırsa sonraki çalıştırmalar onu güncel sanırdı
+    if key is not None and written:
+        write_stamp(OUTPUT_STORE_PATH, key)
+    return bool(written)
 
 if __name__ == "__main__":
-    load_and_process_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Yangın ve yangın olmayan verileri birleştirir.")
+    parser.add_argument('--csv', action='store_true', help=f"Sonucu ayrıca {OUTPUT_PATH} olarak dışa aktar")
+    parser.add_argument('--streaming', action='store_true',
+                        help="Büyük veri için sınırlı bellekte (parçalı okuma + kovalı karıştırma) çalış")
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--buckets', type=int, default=N_BUCKETS)
+    parser.add_argument('--force', action='store_true', help="Girdiler değişmemiş olsa da yeniden hesapla")
+    args = parser.parse_args()
+
+    run_merge_stage(export_to_csv=args.csv, streaming=args.streaming, chunksize=args.chunksize,
+                    n_buckets=args.buckets, force=args.force)
@@ -0,0 +1,208 @@
+"""
+Sütunlu (Columnar) Veri Deposu
+
+Aşamalar arası CSV gidiş-dönüşleri (her adımda float metnini yeniden ayrıştırmak)
+yerine tipli, sütun bazlı bir depo kullanılır:
+
+- Varsayılan: NumPy sütun deposu. Her sütun ayrı bir .npy dosyasıdır ve
+  bellek eşlemeli (mmap) açılır; yalnızca gereken sütunlar okunur.
+- Parquet / Feather: yol '.parquet' ya da '.feather' ile bitiyorsa (pyarrow gerekir).
+
+Şema: float32 öznitelikler ve koordinatlar, int64 milisaniye tarih, int8 etiket.
+CSV yalnızca içe / dışa aktarma seçeneği olarak tutulur (import_csv, export_csv).
+"""
+import os
+import json
+
+import numpy as np
+
+# --- AYARLAR ---
+STORE_FOLDER = os.path.join('data', 'store')
+
+DTYPES = {
+    'label': np.int8,
+    'LST': np.float32,
+    'NDVI': np.float32,
+    'elevation': np.float32,
+    'ACQ_DATE': np.int64,
+    'lon': np.float32,
+    'lat': np.float32,
+}
+SCHEMA_FILE = 'schema.json'
+
+
+def store_path(name):
+    """Veri seti adından depo yolunu üretir: data/store/<ad>"""
+    return os.path.join(STORE_FOLDER, name)
+
+
+def _format(path):
+    if path.endswith('.parquet'):
+        return 'parquet'
+    if path.endswith('.feather'):
+        return 'feather'
+    return 'npy'
+
+
+def cast_schema(df):
+    """Bilinen sütunları şemadaki tiplere çevirir (diğer sütunlar olduğu gibi kalır)."""
+    return df.astype({c: t for c, t in DTYPES.items() if c in df.columns}, copy=False)
+
+
+def exists(path):
+    if _format(path) == 'npy':
+        return os.path.exists(os.path.join(path, SCHEMA_FILE))
+    return os.path.exists(path)
+
+
+def write_table(df, path):
+    """DataFrame'i tipli sütunlu depoya yazar."""
+    df = cast_schema(df.reset_index(drop=True))
+    fmt = _format(path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    elif fmt == 'feather':
+        df.to_feather(path)
+    else:
+        os.makedirs(path, exist_ok=True)
+        if exists(path):
+            os.remove(os.path.join(path, SCHEMA_FILE))
+        for column in df.columns:
+            np.save(os.path.join(path, f'{column}.npy'), df[column].to_numpy())
+        # Şema en son yazılır: yarım kalan yazım exists() ile geçerli sayılmaz
+        schema = {'columns': list(df.columns), 'dtypes': {c: str(df[c].dtype) for c in df.columns},
+                  'rows': len(df)}
+        with open(os.path.join(path, SCHEMA_FILE), 'w') as f:
+            json.dump(schema, f, indent=2)
+    return path
+
+
+def read_arrays(path, columns=None, mmap=True):
+    """
+    Sütunları {ad: numpy dizisi} olarak döndürür. NumPy deposunda diziler
+    bellek eşlemelidir (mmap=True), yani kopyalanmadan diskten okunur.
+    """
+    fmt = _format(path)
+    if fmt == 'npy':
+        with open(os.path.join(path, SCHEMA_FILE)) as f:
+            schema = json.load(f)
+        columns = columns or schema['columns']
+        mode = 'r' if mmap else None
+        return {c: np.load(os.path.join(path, f'{c}.npy'), mmap_mode=mode) for c in columns}
+
+    df = read_table(path, columns)
+    return {c: df[c].to_numpy() for c in df.columns}
+
+
+def read_table(path, columns=None, mmap=True):
+    """Depoyu DataFrame olarak okur (yalnızca istenen sütunlar)."""
+    import pandas as pd
+
+    fmt = _format(path)
+    if fmt == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    if fmt == 'feather':
+        return pd.read_feather(path, columns=columns)
+    return pd.DataFrame(read_arrays(path, columns, mmap=mmap))
+
+
+def import_csv(csv_path, path):
+    """CSV'yi tipli olarak okuyup depoya yazar (float metni yalnızca bir kez ayrıştırılır)."""
+    import pandas as pd
+
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {c: t for c, t in DTYPES.items() if c in header}
+    return write_table(pd.read_csv(csv_path, dtype=dtypes), path)
+
+
+def export_csv(path, csv_path):
+    """Depoyu CSV olarak dışa aktarır."""
+    read_table(path, mmap=False).to_csv(csv_path, index=False)
+    return csv_path
+
+
+def open_dataset(name, csv_path=None):
+    """
+    data/store/<ad> deposunun yolunu döndürür. Depo yoksa ya da CSV daha yeniyse
+    depo CSV'den (içe aktarma seçeneği) yeniden oluşturulur.
+    """
+    path = store_path(name)
+    if csv_path is not None and os.path.exists(csv_path):
+        stale = not exists(path) or \
+            os.path.getmtime(csv_path) > os.path.getmtime(os.path.join(path, SCHEMA_FILE)
+                                                          if _format(path) == 'npy' else path)
+        if stale:
+            print(f"📥 CSV içe aktarılıyor: {csv_path} -> {path}")
+            import_csv(csv_path, path)
+    if not exists(path):
+        raise FileNotFoundError(f"Veri deposu bulunamadı: {path}")
+    return path
+
+
+class StoreWriter:
+    """
+    NumPy sütun deposuna parça parça (append) yazım. Her parça sütun başına ham
+    .bin dosyalarının sonuna eklenir; close() ile .npy'ye çevrilir. Bellekte en
+    fazla bir parça tutulur.
+
+        with StoreWriter(path) as writer:
+            for chunk in chunks:
+                writer.append(chunk)
+    """
+
+    BLOCK_ROWS = 1_000_000  # .bin -> .npy kopyalama blok boyutu
+
+    def __init__(self, path):
+        if _format(path) != 'npy':
+            raise ValueError("StoreWriter yalnızca NumPy sütun deposunu destekler")
+        self.path = path
+        self.columns = None
+        self.dtypes = {}
+        self.rows = 0
+        os.makedirs(path, exist_ok=True)
+        if exists(path):
+            os.remove(os.path.join(path, SCHEMA_FILE))
+        for name in os.listdir(path):
+            if name.endswith('.bin'):
+                os.remove(os.path.join(path, name))
+
+    def append(self, df):
+        df = cast_schema(df)
+        if self.columns is None:
+            self.columns = list(df.columns)
+            self.dtypes = {c: df[c].dtype for c in self.columns}
+        for column in self.columns:
+            values = np.ascontiguousarray(df[column].to_numpy(), dtype=self.dtypes[column])
+            with open(os.path.join(self.path, f'{column}.bin'), 'ab') as f:
+                f.write(values.tobytes())
+        self.rows += len(df)
+
+    def close(self):
+        for column in self.columns or []:
+            bin_path = os.path.join(self.path, f'{column}.bin')
+            dtype = self.dtypes[column]
+            out = np.lib.format.open_memmap(os.path.join(self.path, f'{column}.npy'),
+                                            mode='w+', dtype=dtype, shape=(self.rows,))
+            if self.rows:
+                raw = np.memmap(bin_path, dtype=dtype, mode='r', shape=(self.rows,))
+                for start in range(0, self.rows, self.BLOCK_ROWS):
+                    out[start:start + self.BLOCK_ROWS] = raw[start:start + self.BLOCK_ROWS]
+                del raw
+            out.flush()
+            del out
+            os.remove(bin_path)
+
+        schema = {'columns': self.columns or [], 'dtypes': {c: str(t) for c, t in self.dtypes.items()},
+                  'rows': self.rows}
+        with open(os.path.join(self.path, SCHEMA_FILE), 'w') as f:
+            json.dump(schema, f, indent=2)
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
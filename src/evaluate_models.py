@@ -1,111 +1,107 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
-import joblib
+import json
+import time
+import argparse
 
-# Makine Öğrenmesi Kütüphaneleri
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, f1_score, roc_auc_score, roc_curve, confusion_matrix
+from src.dataset_store import open_dataset
+from src.prepared_data import (fit_scaled, transform_scaled, transform_sequences, split_indices, load_split,
+                               input_fingerprint)
+from src.baselines import load_baselines, score, BASELINE_FOLDER
+from src.block_cv import STRATEGIES, CV_FOLDS, add_block_arguments
+from src.timing import report_cold_starts
 
-# Derin Öğrenme (TensorFlow/Keras)
-import tensorflow as tf
-from tensorflow.keras.models import load_model
+# Ağır kütüphaneler (scikit-learn, matplotlib/seaborn, TensorFlow) yalnızca onları
+# kullanan adım çalışınca yüklenir: --help ya da --no-plots --no-lstm saniyeler sürmez.
 
 # --- AYARLAR ---
-DATA_PATH = 'data/Antalya_Merged_Dataset.csv'
+DATA_NAME = 'Antalya_Merged_Dataset'  # data/store/ altındaki tipli sütunlu depo
+DATA_PATH = 'data/Antalya_Merged_Dataset.csv'  # Depo yoksa buradan içe aktarılır
 MODEL_PATH = 'models/fire_prediction_model.h5'
 SCALER_PATH = 'models/scaler.pkl'
+SPLIT_PATH = 'models/split_indices.npz'
+MODEL_CONFIG_PATH = 'models/model_config.json'
 RESULTS_FOLDER = 'results'
 
-# Sonuçların kaydedileceği klasörü oluştur
-os.makedirs(RESULTS_FOLDER, exist_ok=True)
+# --benchmark-startup: her yolun yeni süreçteki import maliyeti
+STARTUP_PATHS = {
+    'modül (--help)': "import src.evaluate_models",
+    'yalnızca metrikler': (
+        "import numpy as np\n"
+        "from src.baselines import make_baseline, score\n"
+        "make_baseline('logistic_regression'), make_baseline('random_forest')\n"
+        "score(np.array([0, 1]), np.array([0.2, 0.8]))"),
+    'grafikler': "from src.evaluate_models import _plotting\n_plotting()",
+    'LSTM': "from src.evaluate_models import _keras_load_model\n_keras_load_model()",
+}
 
-def evaluate_all_models():
-    print("📊 MODELLERİN KARŞILAŞTIRMALI ANALİZİ BAŞLIYOR...")
-    print("-" * 50)
 
-    # 1. VERİYİ HAZIRLA
-    # ---------------------------------------------------------
-    if not os.path.exists(DATA_PATH):
-        print(f"❌ HATA: Veri dosyası bulunamadı: {DATA_PATH}")
-        return
-
-    df = pd.read_csv(DATA_PATH)
-    X = df[['LST', 'NDVI', 'elevation']].values
-    y = df['label'].values
-
-    # Scaler'ı yükle (Eğitimde kullanılanın aynısı olmalı)
-    if os.path.exists(SCALER_PATH):
-        scaler = joblib.load(SCALER_PATH)
-        X_scaled = scaler.transform(X)
-        print("✅ Kayıtlı Scaler yüklendi ve veri normalize edildi.")
-    else:
-        print("⚠️ UYARI: Kayıtlı Scaler bulunamadı, yeni scaler oluşturuluyor...")
-        scaler = MinMaxScaler()
-        X_scaled = scaler.fit_transform(X)
+def _plotting():
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
 
-    # Eğitim ve Test setini ayır (train_model.py ile AYNI random_state=42 olmalı)
-    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
-    
-    print(f"📊 Test Verisi Sayısı: {len(X_test)}")
 
-    # 2. MODELLERİ EĞİT VE TAHMİN AL
-    # ---------------------------------------------------------
-    
-    # --- A) Lojistik Regresyon (Klasik İstatistiksel Yöntem) ---
-    print("\n🔹 Model 1: Lojistik Regresyon (LR) eğitiliyor...")
-    lr_model = LogisticRegression()
-    lr_model.fit(X_train, y_train)
-    y_pred_lr = lr_model.predict(X_test)
-    y_prob_lr = lr_model.predict_proba(X_test)[:, 1] # Olasılık değerleri (ROC için)
+def _keras_load_model():
+    from tensorflow.keras.models import load_model
+    return load_model
 
-    # --- B) Random Forest (Güçlü Makine Öğrenmesi) ---
-    print("🔹 Model 2: Random Forest (RF) eğitiliyor...")
-    rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-    rf_model.fit(X_train, y_train)
-    y_pred_rf = rf_model.predict(X_test)
-    y_prob_rf = rf_model.predict_proba(X_test)[:, 1]
 
-    # --- C) LSTM (Senin Derin Öğrenme Modelin) ---
+def predict_lstm(data_path, split, X_test):
+    """LSTM test olasılıkları ve tahmin süresi; model yoksa None."""
     print("🔹 Model 3: LSTM Modeli yükleniyor...")
     if not os.path.exists(MODEL_PATH):
         print(f"❌ HATA: LSTM modeli bulunamadı: {MODEL_PATH}")
         print("Lütfen önce 'src/train_model.py' kodunu çalıştırın.")
-        return
+        return None
 
-    lstm_model = load_model(MODEL_PATH)
+    lstm_model = _keras_load_model()(MODEL_PATH)
     
     # LSTM 3 boyutlu veri ister: (Örnek, Zaman Adımı, Özellik)
-    X_test_lstm = X_test.reshape((X_test.shape[0], 1, X_test.shape[1]))
+    # Model zaman serisiyle eğitildiyse aynı geçmiş penceresi kurulur (models/model_config.json)
+    config = {'sequence_steps': 1}
+    if os.path.exists(MODEL_CONFIG_PATH):
+        with open(MODEL_CONFIG_PATH) as f:
+            config = json.load(f)
+
+    if config['sequence_steps'] > 1:
+        sequences = transform_sequences(data_path, config['raster_folder'], config['sequence_steps'], SCALER_PATH)
+        X_test_lstm = sequences['X_seq'][split['test_idx']]
+    else:
+        X_test_lstm = X_test.reshape((X_test.shape[0], 1, X_test.shape[1]))
     
+    t0 = time.perf_counter()
     y_prob_lstm = lstm_model.predict(X_test_lstm, verbose=0).flatten()
-    y_pred_lstm = (y_prob_lstm > 0.5).astype(int) # %50 üzerini 1 kabul et
+    return y_prob_lstm, time.perf_counter() - t0
 
-    # 3. SONUÇLARI HESAPLA VE TABLO OLUŞTUR
-    # ---------------------------------------------------------
-    models = {
-        'Logistic Regression': (y_test, y_pred_lr, y_prob_lr),
-        'Random Forest': (y_test, y_pred_rf, y_prob_rf),
-        'LSTM (Deep Learning)': (y_test, y_pred_lstm, y_prob_lstm)
-    }
 
-    print("\n🏆 PERFORMANS TABLOSU (TÜBİTAK Raporu İçin)")
-    print("=" * 75)
-    print(f"{'Model Adı':<25} | {'Accuracy':<10} | {'F1-Score':<10} | {'AUC Score':<10}")
-    print("-" * 75)
+def compare_block_cv(data_path, lstm, strategy, folds, block_options=None):
+    """
+    Modelleri AYNI mekânsal / zamansal blok katlarında yeniden eğitip karşılaştırır
+    (bkz. block_cv.py). LSTM, models/model_config.json'daki mimari ve zaman adımıyla kurulur.
+    """
+    from src.block_cv import run_block_cv
+
+    models = ['logistic_regression', 'random_forest']
+    config = {'sequence_steps': 1}
+    if lstm:
+        models.append('lstm')
+        if os.path.exists(MODEL_CONFIG_PATH):
+            with open(MODEL_CONFIG_PATH) as f:
+                config = json.load(f)
+    lstm_params = {key: config[key] for key in ['units', 'dropout'] if key in config}
+    kwargs = {'raster_folder': config['raster_folder']} if 'raster_folder' in config else {}
+    return run_block_cv(models, strategy, folds, sequence_steps=config['sequence_steps'],
+                        lstm_params=lstm_params, data_path=data_path, **kwargs, **(block_options or {}))
 
-    for name, (y_true, y_pred, y_prob) in models.items():
-        acc = accuracy_score(y_true, y_pred)
-        f1 = f1_score(y_true, y_pred)
-        auc = roc_auc_score(y_true, y_prob)
-        
-        print(f"{name:<25} | {acc:.4f}     | {f1:.4f}     | {auc:.4f}")
 
+def save_plots(models):
+    """Her model için confusion matrix + ortak ROC eğrisi. Dönüş: ROC grafiğinin yolu."""
+    from sklearn.metrics import roc_curve, confusion_matrix
+
+    plt, sns = _plotting()
+    os.makedirs(RESULTS_FOLDER, exist_ok=True)
+
+    for name, (y_true, y_pred, y_prob) in models.items():
         # Confusion Matrix Çiz
         cm = confusion_matrix(y_true, y_pred)
         plt.figure(figsize=(5, 4))
@@ -117,13 +113,12 @@ def evaluate_all_models():
         plt.savefig(f"{RESULTS_FOLDER}/cm_{name.replace(' ', '_')}.png")
         plt.close()
 
-    # 4. ROC EĞRİSİ ÇİZ (En Önemli Grafik)
-    # ---------------------------------------------------------
+    # ROC EĞRİSİ ÇİZ (En Önemli Grafik)
     plt.figure(figsize=(10, 8))
     
     for name, (y_true, y_pred, y_prob) in models.items():
         fpr, tpr, _ = roc_curve(y_true, y_prob)
-        auc_score = roc_auc_score(y_true, y_prob)
+        auc_score = score(y_true, y_prob)['auc']
         plt.plot(fpr, tpr, label=f'{name} (AUC = {auc_score:.3f})', linewidth=2)
     
     plt.plot([0, 1], [0, 1], 'k--', label='Rastgele Tahmin (Chance)', linestyle='--')
@@ -136,10 +131,154 @@ def evaluate_all_models():
     save_path = f"{RESULTS_FOLDER}/roc_curve_comparison.png"
     plt.savefig(save_path, dpi=300)
     plt.close()
+    return save_path
+
+
+def evaluate_all_models(plots=True, lstm=True, cv_strategy=None, cv_folds=CV_FOLDS, block_options=None):
+    print("📊 MODELLERİN KARŞILAŞTIRMALI ANALİZİ BAŞLIYOR...")
+    print("-" * 50)
+
+    # 1. VERİYİ HAZIRLA
+    # ---------------------------------------------------------
+    try:
+        data_path = open_dataset(DATA_NAME, DATA_PATH)
+    except FileNotFoundError:
+        print(f"❌ HATA: Veri dosyası bulunamadı: {DATA_PATH}")
+        return
+
+    # Scaler'ı yükle (Eğitimde kullanılanın aynısı olmalı)
+    # Veri ve scaler değişmediyse dönüştürülmüş diziler önbellekten (data/cache) gelir.
+    if os.path.exists(SCALER_PATH):
+        scaled = transform_scaled(data_path, SCALER_PATH)
+        print("✅ Kayıtlı Scaler yüklendi ve veri normalize edildi.")
+    else:
+        print("⚠️ UYARI: Kayıtlı Scaler bulunamadı, yeni scaler oluşturuluyor...")
+        scaled = fit_scaled(data_path)
+    X_scaled, y = scaled['X_scaled'], scaled['y']
+
+    # Eğitim ve Test seti: train_model.py'nin kaydettiği indeksler (yeniden bölme yok)
+    if os.path.exists(SPLIT_PATH):
+        try:
+            split = load_split(SPLIT_PATH, data_path)
+        except ValueError as e:
+            print(f"❌ HATA: {e}")
+            return
+        print(f"✅ Kayıtlı eğitim/test indeksleri yüklendi: {SPLIT_PATH}")
+    else:
+        # Eski modeller için: train_model.py ile AYNI random_state=42 ile yeniden böl
+        print(f"⚠️ UYARI: {SPLIT_PATH} bulunamadı, bölme random_state=42 ile yeniden hesaplanıyor...")
+        split = split_indices(data_path, len(y))
+    X_train, X_test = X_scaled[split['train_idx']], X_scaled[split['test_idx']]
+    y_train, y_test = y[split['train_idx']], y[split['test_idx']]
+    
+    print(f"📊 Test Verisi Sayısı: {len(X_test)}")
+
+    # 2. MODELLERİ YÜKLE VE TAHMİN AL (Eğitim yok: src/train_baselines.py ve src/train_model.py)
+    # ---------------------------------------------------------
+    # Karşılaştırma modelleri aynı veri / scaler / bölme ile eğitilmiş olmalı (metadata.json)
+    try:
+        baselines, baseline_meta = load_baselines(
+            ['logistic_regression', 'random_forest'],
+            expected=input_fingerprint(data_path, SCALER_PATH, SPLIT_PATH))
+    except ValueError as e:
+        print(f"❌ HATA: {e}")
+        return
+    print(f"✅ Karşılaştırma modelleri yüklendi: {BASELINE_FOLDER}")
+
+    def predict_timed(model):
+        t0 = time.perf_counter()
+        y_prob = model.predict_proba(X_test)[:, 1]
+        return y_prob, time.perf_counter() - t0
+
+    # --- A) Lojistik Regresyon (Klasik İstatistiksel Yöntem) ---
+    print("\n🔹 Model 1: Lojistik Regresyon (LR) tahmin ediyor...")
+    y_prob_lr, lr_predict_seconds = predict_timed(baselines['logistic_regression']) # Olasılıklar (ROC için)
+    y_pred_lr = (y_prob_lr > 0.5).astype(int)
+
+    # --- B) Random Forest (Güçlü Makine Öğrenmesi) ---
+    print("🔹 Model 2: Random Forest (RF) tahmin ediyor...")
+    y_prob_rf, rf_predict_seconds = predict_timed(baselines['random_forest'])
+    y_pred_rf = (y_prob_rf > 0.5).astype(int)
+
+    models = {
+        'Logistic Regression': (y_test, y_pred_lr, y_prob_lr),
+        'Random Forest': (y_test, y_pred_rf, y_prob_rf),
+    }
+    # (eğitim, tahmin) süreleri; eğitim süresi metadata'dan, LSTM için kayıt yok
+    timings = {
+        'Logistic Regression': (baseline_meta['logistic_regression']['fit_seconds'], lr_predict_seconds),
+        'Random Forest': (baseline_meta['random_forest']['fit_seconds'], rf_predict_seconds),
+    }
+
+    # --- C) LSTM (Senin Derin Öğrenme Modelin) ---
+    if lstm:
+        result = predict_lstm(data_path, split, X_test)
+        if result is None:
+            return
+        y_prob_lstm, lstm_predict_seconds = result
+        y_pred_lstm = (y_prob_lstm > 0.5).astype(int) # %50 üzerini 1 kabul et
+        models['LSTM (Deep Learning)'] = (y_test, y_pred_lstm, y_prob_lstm)
+        timings['LSTM (Deep Learning)'] = (None, lstm_predict_seconds)
+
+    # 3. SONUÇLARI HESAPLA VE TABLO OLUŞTUR
+    # ---------------------------------------------------------
+
+    print("\n🏆 PERFORMANS TABLOSU (TÜBİTAK Raporu İçin)")
+    print("=" * 100)
+    print(f"{'Model Adı':<25} | {'Accuracy':<10} | {'F1-Score':<10} | {'AUC Score':<10} | "
+          f"{'Fit (sn)':<10} | {'Predict (sn)':<10}")
+    print("-" * 100)
+
+    for name, (y_true, y_pred, y_prob) in models.items():
+        metrics = score(y_true, y_prob)
+        acc, f1, auc = metrics['accuracy'], metrics['f1'], metrics['auc']
+        fit_seconds, predict_seconds = timings[name]
+        fit_cell = f"{fit_seconds:.3f}" if fit_seconds is not None else "-"
+        
+        print(f"{name:<25} | {acc:.4f}     | {f1:.4f}     | {auc:.4f}     | "
+              f"{fit_cell:<10} | {predict_seconds:.4f}")
+
+    # 4. GRAFİKLER (Confusion Matrix + ROC eğrisi)
+    # ---------------------------------------------------------
+    save_path = save_plots(models) if plots else None
+
+    # 5. ÇAPRAZ DOĞRULAMA ÖZETİ (train_baselines.py --cv ile eğitildiyse metadata'da)
+    # ---------------------------------------------------------
+    for name, meta in baseline_meta.items():
+        if 'cv' in meta:
+            cv = meta['cv']
+            print(f"📐 {name}: {cv['folds']} kat ({cv.get('strategy', 'random')}) "
+                  f"AUC {cv['auc_mean']:.4f} ± {cv['auc_std']:.4f}, F1 {cv['f1_mean']:.4f} ± {cv['f1_std']:.4f}")
+
+    # 6. BLOK ÇAPRAZ DOĞRULAMA (--cv-strategy): tek test kümesi yerine mekânsal / zamansal katlar
+    # ---------------------------------------------------------
+    if cv_strategy:
+        try:
+            compare_block_cv(data_path, lstm, cv_strategy, cv_folds, block_options)
+        except ValueError as e:
+            print(f"❌ HATA: {e}")
 
     print("\n✅ ANALİZ TAMAMLANDI!")
-    print(f"📁 Grafikler '{RESULTS_FOLDER}' klasörüne kaydedildi.")
-    print(f"🖼️ Ana Grafik: {save_path}")
+    if save_path:
+        print(f"📁 Grafikler '{RESULTS_FOLDER}' klasörüne kaydedildi.")
+        print(f"🖼️ Ana Grafik: {save_path}")
 
 if __name__ == "__main__":
-    evaluate_all_models()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="LR, RF ve LSTM modellerini test setinde karşılaştırır.")
+    parser.add_argument('--no-plots', action='store_true', help="Grafik çizme (matplotlib/seaborn yüklenmez)")
+    parser.add_argument('--no-lstm', action='store_true', help="LSTM'i atla (TensorFlow yüklenmez)")
+    parser.add_argument('--benchmark-startup', action='store_true',
+                        help="Metrik / grafik / LSTM yollarının soğuk başlangıç sürelerini ölç")
+    parser.add_argument('--cv-strategy', choices=STRATEGIES, default=None,
+                        help="Modelleri ayrıca bu bloklarla çapraz doğrula (örn. spatial, temporal)")
+    parser.add_argument('--cv-folds', type=int, default=CV_FOLDS)
+    add_block_arguments(parser)
+    args = parser.parse_args()
+
+    if args.benchmark_startup:
+        report_cold_starts(STARTUP_PATHS, title='Değerlendirme Soğuk Başlangıcı')
+    else:
+        evaluate_all_models(plots=not args.no_plots, lstm=not args.no_lstm, cv_strategy=args.cv_strategy,
+                            cv_folds=args.cv_folds,
+                            block_options={'tile_degrees': args.tile_degrees, 'block_days': args.block_days,
+                                           'buffer': args.buffer})
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Parçalı (Chunked) Paralel Dışa Aktarma
+
+Tek bir büyük Export.table.toDrive görevi yerine tarih aralığını aylık ya da
+haftalık pencerelere böler, her pencere için ayrı görevi sınırlı sayıda iş
+parçacığıyla (thread pool) eşzamanlı başlatır.
+
+Her parçanın durumu bir manifest (JSON) dosyasında tutulur. Çalışma yarıda
+kesilirse tekrar çalıştırıldığında tamamlanan (COMPLETED) ya da hâlâ çalışan
+parçalar atlanır, yalnızca eksik / başarısız parçalar yeniden gönderilir.
+Her parça, kurulduğu parametrelerin (arka uç, ROI, sütunlar, build_fn seçenekleri) özetiyle
+kaydedilir; parametreler değiştiyse eski parçalar yeniden kullanılmaz, baştan gönderilir.
+"""
+import os
+import json
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from src.stage_cache import stage_key
+
+# --- AYARLAR ---
+MAX_WORKERS = 4
+FREQUENCIES = {
+    'month': pd.offsets.MonthBegin(1),
+    'week': pd.offsets.Week(1, weekday=0),  # Pazartesi başlangıçlı haftalar
+}
+
+# Manifest durumları (ee.batch.Task durum adlarıyla aynı)
+DONE_STATES = {'COMPLETED'}
+ACTIVE_STATES = {'READY', 'RUNNING', 'SUBMITTED'}
+
+
+def split_date_range(start_date, end_date, freq='month'):
+    """
+    [start_date, end_date) aralığını takvim ayı / haftası sınırlarından böler.
+    Dönüş: [('2021-07-01', '2021-08-01'), ...] (bitiş hariç, filterDate gibi)
+    """
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Bilinmeyen parça sıklığı: {freq} (geçerli: {list(FREQUENCIES)})")
+
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    bounds = [start]
+    current = start
+    while True:
+        current = current + FREQUENCIES[freq]
+        if current >= end:
+            break
+        bounds.append(current)
+    bounds.append(end)
+
+    return [(a.strftime('%Y-%m-%d'), b.strftime('%Y-%m-%d')) for a, b in zip(bounds[:-1], bounds[1:]) if a < b]
+
+
+def chunk_description(description, start, end):
+    # GEE açıklamaları yalnızca harf, rakam, '_' ve '-' içerebilir
+    return f"{description}_{start.replace('-', '')}_{end.replace('-', '')}"
+
+
+def build_fingerprint(backend, selectors=None, params=None):
+    """Parçanın içeriğini belirleyen parametrelerin kısa özeti (manifestte parça başına saklanır)."""
+    return stage_key('export', params={'backend': backend.name, 'selectors': selectors, 'build': params or {},
+                                       'roi_bounds': getattr(backend, 'roi_bounds', None)})
+
+
+class ExportManifest:
+    """Parça durumlarını JSON dosyasında tutan, thread-safe kayıt."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.chunks = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.chunks = json.load(f).get('chunks', {})
+
+    def get(self, key):
+        return self.chunks.get(key)
+
+    def update(self, key, **fields):
+        with self._lock:
+            entry = self.chunks.setdefault(key, {})
+            entry.update(fields)
+            entry['updated'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+            self._save()
+
+    def discard(self, key):
+        with self._lock:
+            self.chunks.pop(key, None)
+            self._save()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'chunks': self.chunks}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)  # Yarım yazılmış manifest kalmasın
+
+    def pending(self, keys):
+        return [k for k in keys if (self.chunks.get(k) or {}).get('state') not in DONE_STATES]
+
+
+def refresh_states(backend, manifest):
+    """Önceki çalıştırmadan kalan aktif görevlerin güncel durumunu arka uçtan sorgular."""
+    for key, entry in list(manifest.chunks.items()):
+        if entry.get('state') in ACTIVE_STATES and entry.get('task_id'):
+            try:
+                manifest.update(key, state=backend.task_state(entry['task_id']))
+            except Exception as e:
+                print(f"⚠️ {key} durumu okunamadı: {e}")
+
+
+def export_chunked(backend, build_fn, start_date, end_date, description,
+                   freq='month', max_workers=MAX_WORKERS, manifest_path=None, selectors=None, params=None):
+    """
+    build_fn(backend, start, end) -> koleksiyon. Her parça için koleksiyon kurulur
+    ve backend.export_table ile ayrı bir görev olarak başlatılır.
+    selectors: dışa aktarılacak sütunlar (None: arka ucun varsayılanı, EXPORT_SELECTORS)
+    params: build_fn'in parçanın içeriğini değiştiren seçenekleri (örn. kovalama ayarları).
+        Manifestteki parça farklı parametrelerle kurulduysa yeniden gönderilir; o parça
+        hâlâ çalışıyorsa karışık tablo üretmemek için RuntimeError verilir.
+
+    Dönüş: ExportManifest (parça anahtarı -> durum, görev kimliği, açıklama)
+    """
+    if manifest_path is None:
+        manifest_path = os.path.join('data', 'exports', f'{description}_manifest.json')
+    manifest = ExportManifest(manifest_path)
+    refresh_states(backend, manifest)
+
+    windows = split_date_range(start_date, end_date, freq)
+    keys = {f'{a}_{b}': (a, b) for a, b in windows}
+
+    fingerprint = build_fingerprint(backend, selectors, params)
+    stale = [key for key in keys if key in manifest.chunks
+             and manifest.chunks[key].get('fingerprint') != fingerprint]
+    running = [key for key in stale if manifest.chunks[key].get('state') in ACTIVE_STATES]
+    if running:
+        raise RuntimeError(f"Şu parçalar farklı parametrelerle hâlâ çalışıyor: {', '.join(running)}. "
+                           f"Bitmelerini bekleyin ya da başka bir açıklama (description) kullanın.")
+    if stale:
+        print(f"♻️ {len(stale)} parça farklı parametrelerle (ROI / sütunlar / kovalama) kurulmuş, "
+              f"yeniden gönderilecek.")
+        for key in stale:
+            manifest.discard(key)
+
+    todo = []
+    for key in manifest.pending(keys):
+        entry = manifest.get(key) or {}
+        if entry.get('state') in ACTIVE_STATES:
+            print(f"⏳ {key} hâlâ çalışıyor, tekrar gönderilmiyor.")
+            continue
+        todo.append(key)
+
+    print(f"🧩 {len(windows)} parça | tamamlanan: {len(windows) - len(manifest.pending(keys))} | "
+          f"gönderilecek: {len(todo)} | işçi sayısı: {max_workers}")
+
+    def submit(key):
+        start, end = keys[key]
+        chunk_name = chunk_description(description, start, end)
+        collection = build_fn(backend, start, end)
+        if selectors is None:
+            task = backend.export_table(collection, chunk_name)
+        else:
+            task = backend.export_table(collection, chunk_name, selectors=selectors)
+        status = task.status()
+        manifest.update(key, start=start, end=end, description=chunk_name, fingerprint=fingerprint,
+                        task_id=status.get('id'), state=status.get('state', 'SUBMITTED'),
+                        destination_uris=status.get('destination_uris', []))
+        return key, status.get('state')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(submit, key): key for key in todo}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                _, state = future.result()
+                print(f"✅ {key}: {state}")
+            except Exception as e:
+                manifest.update(key, start=keys[key][0], end=keys[key][1], fingerprint=fingerprint,
+                                state='FAILED', error=str(e))
+                print(f"❌ {key}: {e}")
+
+    return manifest
@@ -0,0 +1,142 @@
+"""
+Görev Takibi ve İndirme Aşaması
+
+Dışa aktarma görevleri başlatıldıktan sonra:
+1. Görev durumları artan bekleme süreleriyle (exponential backoff) sorgulanır,
+2. Tamamlanan tablolar arka uçtan (Drive ya da yerel export klasörü) data/ altına indirilir,
+3. Parçalı dışa aktarmalarda parçalar tek CSV'de birleştirilir.
+
+Her aşamanın süresi StageTimer ile raporlanır.
+"""
+import os
+import time
+
+import pandas as pd
+
+from src.timing import StageTimer
+
+# --- AYARLAR ---
+DATA_FOLDER = 'data'
+CHUNK_FOLDER = os.path.join(DATA_FOLDER, 'chunks')
+
+INITIAL_DELAY = 5.0   # sn
+MAX_DELAY = 120.0     # sn
+BACKOFF_FACTOR = 2.0
+
+TERMINAL_STATES = {'COMPLETED', 'FAILED', 'CANCELLED'}
+
+
+def poll_tasks(backend, task_ids, initial_delay=INITIAL_DELAY, max_delay=MAX_DELAY,
+               factor=BACKOFF_FACTOR, timeout=None):
+    """
+    Tüm görevler bitene (COMPLETED / FAILED / CANCELLED) kadar durumları sorgular.
+    Bekleme süresi her turda `factor` ile çarpılır ve `max_delay` ile sınırlanır.
+
+    Dönüş: {görev kimliği: son durum}
+    """
+    states = {task_id: None for task_id in task_ids}
+    delay = initial_delay
+    t0 = time.monotonic()
+
+    while True:
+        for task_id, state in states.items():
+            if state not in TERMINAL_STATES:
+                states[task_id] = backend.task_state(task_id)
+
+        waiting = [t for t, s in states.items() if s not in TERMINAL_STATES]
+        done = len(states) - len(waiting)
+        print(f"🔎 Görevler: {done}/{len(states)} bitti")
+        if not waiting:
+            return states
+
+        if timeout is not None and time.monotonic() - t0 + delay > timeout:
+            raise TimeoutError(f"{len(waiting)} görev {timeout} sn içinde bitmedi: {waiting}")
+
+        time.sleep(delay)
+        delay = min(delay * factor, max_delay)
+
+
+def fetch_tables(backend, entries, destination_folder):
+    """
+    entries: [{'task_id', 'description', 'state'}] (manifest kayıtları ya da task.status())
+    Tamamlanan görevlerin tablolarını destination_folder/<description>.csv olarak indirir.
+    """
+    os.makedirs(destination_folder, exist_ok=True)
+    paths = []
+    for entry in entries:
+        if entry.get('state') != 'COMPLETED':
+            print(f"⚠️ {entry.get('description')} atlandı (durum: {entry.get('state')})")
+            continue
+        path = os.path.join(destination_folder, f"{entry['description']}.csv")
+        backend.fetch_table(entry['description'], path)
+        paths.append(path)
+    return paths
+
+
+def merge_tables(paths, output_path):
+    """
+    Parça CSV'lerini tek tabloda birleştirir (boş parçalar atlanır).
+    Hiç parça yoksa mevcut tablonun üzerine boş tablo yazılmaz, ValueError verilir.
+    """
+    if not paths:
+        raise ValueError(f"Birleştirilecek parça yok, {output_path} değiştirilmedi.")
+    frames = [pd.read_csv(p) for p in sorted(paths)]
+    non_empty = [df for df in frames if len(df)] or frames[:1]
+    merged = pd.concat(non_empty, ignore_index=True)
+    merged.to_csv(output_path, index=False)
+    return merged
+
+
+def collect_task(backend, task, output_path=None, timer=None, **poll_kwargs):
+    """Tek bir dışa aktarma görevini bekler ve tabloyu data/ altına indirir."""
+    timer = timer or StageTimer()
+    status = task.status()
+    output_path = output_path or os.path.join(DATA_FOLDER, f"{status['description']}.csv")
+
+    with timer.stage('görev bekleme'):
+        state = poll_tasks(backend, [status['id']], **poll_kwargs)[status['id']]
+    if state != 'COMPLETED':
+        raise RuntimeError(f"Görev başarısız: {status['description']} ({state})")
+
+    with timer.stage('indirme'):
+        backend.fetch_table(status['description'], output_path)
+
+    print(f"📥 Tablo indirildi: {output_path}")
+    return output_path
+
+
+def collect_manifest(backend, manifest, output_path, keys=None, timer=None, **poll_kwargs):
+    """
+    Parçalı dışa aktarmanın görevlerini bekler, parçaları data/chunks/ altına indirir
+    ve output_path'te tek CSV olarak birleştirir. keys verilirse yalnızca o parçalar alınır.
+
+    İstenen parçalardan biri bile tamamlanmadıysa (FAILED / CANCELLED ya da hiç gönderilmemiş)
+    output_path yazılmaz ve RuntimeError verilir: eksik tablo --incremental ile eklenirse
+    sonraki pencere son ACQ_DATE'ten başlar ve eksik aylar bir daha çekilmez.
+    Tamamlanan parçalar data/chunks/ altına yine indirilir; tekrar çalıştırmada manifest
+    yalnızca eksik parçaları yeniden gönderir.
+    """
+    timer = timer or StageTimer()
+    keys = list(manifest.chunks) if keys is None else list(keys)
+    entries = {key: manifest.chunks[key] for key in keys
+               if key in manifest.chunks and manifest.chunks[key].get('task_id')}
+
+    with timer.stage('görev bekleme'):
+        states = poll_tasks(backend, [e['task_id'] for e in entries.values()], **poll_kwargs)
+    for key, entry in entries.items():
+        manifest.update(key, state=states[entry['task_id']])
+
+    with timer.stage('indirme'):
+        paths = fetch_tables(backend, [manifest.chunks[key] for key in entries], CHUNK_FOLDER)
+
+    missing = [key for key in keys if (manifest.get(key) or {}).get('state') != 'COMPLETED']
+    if missing or not paths:
+        raise RuntimeError(f"{len(missing)} parça tamamlanmadı, {output_path} yazılmadı: "
+                           f"{', '.join(missing) or 'parça yok'}. Eksik parçaları yeniden "
+                           f"göndermek için komutu tekrar çalıştırın.")
+
+    with timer.stage('birleştirme'):
+        merged = merge_tables(paths, output_path)
+
+    print(f"📥 {len(paths)} parça birleştirildi: {output_path} ({len(merged)} satır)")
+    return output_path
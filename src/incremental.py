@@ -0,0 +1,68 @@
+"""
+Artımlı (Incremental) Veri Çekme
+
+data/ altındaki mevcut tablodaki en büyük ACQ_DATE okunur ve yalnızca bu tarihten
+sonraki pencere istenir. Yeni satırlar mevcut tabloya eklenir, tekrar eden satırlar atılır.
+Böylece yangın sezonunda günlük güncelleme tüm aralığı baştan çekmez.
+"""
+import os
+
+import pandas as pd
+
+from src.raster_backend import SELECTORS, DAY_MS
+
+
+def latest_acq_date(path):
+    """Tablodaki en büyük ACQ_DATE (ms). Dosya yoksa ya da boşsa None."""
+    if not os.path.exists(path):
+        return None
+    dates = pd.read_csv(path, usecols=['ACQ_DATE'])['ACQ_DATE']
+    return int(dates.max()) if len(dates) else None
+
+
+def next_window(path, end_date, default_start):
+    """
+    Çekilmesi gereken yeni [başlangıç, bitiş) aralığını 'YYYY-MM-DD' olarak döndürür.
+    FIRMS görüntüleri günlük olduğundan başlangıç, son tarihin ertesi günüdür.
+    Tablo güncelse None döner.
+    """
+    latest = latest_acq_date(path)
+    if latest is None:
+        start = pd.Timestamp(default_start)
+    else:
+        start = pd.Timestamp(latest // DAY_MS * DAY_MS + DAY_MS, unit='ms')
+
+    end = pd.Timestamp(end_date)
+    if start >= end:
+        return None
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+def append_dedup(path, new_rows, subset=SELECTORS):
+    """
+    new_rows (DataFrame ya da CSV yolu) satırlarını path tablosuna ekler,
+    subset sütunlarına göre tekrar edenleri atar (mevcut satırların sırası korunur).
+    Şemalar farklıysa (ör. --no-binning ile kova istatistikleri olmayan ekleme) sütunların
+    birleşimi yazılır; bir tarafta olmayan sütunlar boş kalır.
+    Dönüş: (eklenen satır sayısı, toplam satır sayısı)
+    """
+    if not isinstance(new_rows, pd.DataFrame):
+        new_rows = pd.read_csv(new_rows)
+
+    if new_rows.empty and os.path.exists(path):
+        return 0, len(pd.read_csv(path, usecols=['ACQ_DATE']))
+
+    if os.path.exists(path):
+        existing = pd.read_csv(path)
+        combined = pd.concat([existing, new_rows], ignore_index=True, sort=False)
+    else:
+        existing = new_rows.iloc[0:0]
+        combined = new_rows
+
+    combined = combined.drop_duplicates(subset=subset).reset_index(drop=True)
+
+    tmp_path = path + '.tmp'
+    combined.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)  # Yarıda kalırsa eski tablo bozulmasın
+
+    return len(combined) - len(existing), len(combined)
@@ -0,0 +1,267 @@
+"""
+Toplu (Batch) Tahmin Motoru
+
+Eğitilmiş LSTM (models/fire_prediction_model.h5) ve scaler (models/scaler.pkl)
+bir kez yüklenir; büyük diziler ya da dosyalar parça parça puanlanır:
+
+- Girdi: (n, 3) anlık [LST, NDVI, elevation] satırları ya da (n, T, 3) geçmiş
+  tensörü (model zaman serisiyle eğitildiyse, bkz. models/model_config.json).
+  Dosya olarak .npy (mmap), .csv ya da sütunlu depo klasörü (data/store/...).
+- Batch boyutu küçük bir örnek üzerinde denenerek seçilir (--batch-size auto).
+- Olasılıklar batch batch çıktıya akıtılır (.csv ya da sütunlu depo); tüm sonuç
+  bellekte tutulmaz.
+- Rapor: toplam satır/sn ve batch gecikmesi yüzdelikleri (p50 / p95 / p99).
+
+    python -m src.inference data/store/Antalya_Merged_Dataset --output data/store/risk_scores
+"""
+import os
+import json
+import time
+import argparse
+
+import numpy as np
+
+from src.dataset_store import read_arrays, StoreWriter, exists as store_exists
+from src.prepared_data import FEATURES
+
+# --- AYARLAR ---
+MODEL_PATH = 'models/fire_prediction_model.h5'
+SCALER_PATH = 'models/scaler.pkl'
+MODEL_CONFIG_PATH = 'models/model_config.json'
+BATCH_CANDIDATES = [256, 1024, 4096, 16384]
+DEFAULT_BATCH_SIZE = 4096
+READ_CHUNK_ROWS = 200_000   # Dosyadan bir seferde okunan satır
+PROB_COLUMN = 'fire_risk'
+
+
+class InferenceStats:
+    """Batch başına (satır, süre) kaydı; throughput ve gecikme yüzdelikleri."""
+
+    def __init__(self):
+        self.batch_rows = []
+        self.batch_seconds = []
+        self.wall_start = time.perf_counter()
+
+    def record(self, rows, seconds):
+        self.batch_rows.append(rows)
+        self.batch_seconds.append(seconds)
+
+    @property
+    def rows(self):
+        return int(np.sum(self.batch_rows)) if self.batch_rows else 0
+
+    def summary(self):
+        wall = time.perf_counter() - self.wall_start
+        latencies = np.asarray(self.batch_seconds) * 1000
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+        return {'rows': self.rows, 'batches': len(self.batch_rows), 'wall_seconds': wall,
+                'rows_per_second': self.rows / wall if wall > 0 else float('nan'),
+                'model_rows_per_second': self.rows / np.sum(self.batch_seconds) if self.batch_rows else float('nan'),
+                'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99)}
+
+    def report(self):
+        s = self.summary()
+        print(f"\n⏱️ {s['rows']} satır, {s['batches']} batch, {s['wall_seconds']:.2f} sn")
+        print(f"⚡ Throughput: {s['rows_per_second']:,.0f} satır/sn (yalnızca model: "
+              f"{s['model_rows_per_second']:,.0f} satır/sn)")
+        print(f"📶 Batch gecikmesi: p50 {s['p50_ms']:.2f} ms | p95 {s['p95_ms']:.2f} ms | p99 {s['p99_ms']:.2f} ms")
+        return s
+
+
+class FireRiskScorer:
+    """Model + scaler'ı bir kez yükler; ham öznitelik dizilerini olasılığa çevirir."""
+
+    def __init__(self, model_path=MODEL_PATH, scaler_path=SCALER_PATH, config_path=MODEL_CONFIG_PATH):
+        import joblib
+        from tensorflow.keras.models import load_model
+
+        self.model = load_model(model_path)
+        self.scaler = joblib.load(scaler_path)
+        self.config = {'sequence_steps': 1}
+        if os.path.exists(config_path):
+            with open(config_path) as f:
+                self.config = json.load(f)
+        self.batch_size = DEFAULT_BATCH_SIZE
+
+    @property
+    def steps(self):
+        return self.config['sequence_steps']
+
+    def prepare(self, X):
+        """Ham (n, 3) ya da (n, T, 3) girdiyi ölçekler ve (n, T, 3) float32 yapar."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 2:
+            if self.steps > 1:
+                raise ValueError(f"Model {self.steps} adımlık geçmiş bekliyor; (n, {self.steps}, 3) girdi verin.")
+            X = X[:, None, :]
+        if X.shape[1:] != (self.steps, len(FEATURES)):
+            raise ValueError(f"Girdi şekli {X.shape}, beklenen (n, {self.steps}, {len(FEATURES)})")
+        return self._scale(X)
+
+    def _scale(self, X):
+        flat = self.scaler.transform(X.reshape(-1, len(FEATURES)))
+        return flat.reshape(X.shape).astype(np.float32)
+
+    def predict_prepared(self, X_prepared):
+        # predict_on_batch: model.predict'in callback / adım kurulumu yükü olmadan tek çağrı.
+        # Eksik (son) batch, batch boyutuna sıfırla tamamlanır: her yeni şekil grafın yeniden
+        # izlenmesi (retrace, yüzlerce ms) demek; birkaç fazla satırı puanlamak daha ucuz.
+        n = len(X_prepared)
+        if n < self.batch_size:
+            X_prepared = np.concatenate([X_prepared, np.zeros((self.batch_size - n,) + X_prepared.shape[1:],
+                                                              dtype=X_prepared.dtype)])
+        return np.asarray(self.model.predict_on_batch(X_prepared)).reshape(-1)[:n]
+
+    def warmup(self, batch_size=None):
+        """Verilen batch şekli için grafı önceden kurar (ilk istek gecikmesi ölçüme girmesin)."""
+        self.predict_prepared(np.zeros((batch_size or self.batch_size, self.steps, len(FEATURES)),
+                                       dtype=np.float32))
+
+    def iter_scores(self, X, batch_size=None, stats=None):
+        """X'i batch batch puanlar ve her batch'in olasılıklarını üretir (generator)."""
+        batch_size = batch_size or self.batch_size
+        for start in range(0, len(X), batch_size):
+            batch = self.prepare(X[start:start + batch_size])
+            t0 = time.perf_counter()
+            probs = self.predict_prepared(batch)
+            if stats is not None:
+                stats.record(len(batch), time.perf_counter() - t0)
+            yield probs
+
+    def score(self, X, batch_size=None, stats=None):
+        """Tüm X için olasılık dizisi (bellekte)."""
+        parts = list(self.iter_scores(X, batch_size, stats))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.float32)
+
+    def tune_batch_size(self, X_sample, candidates=BATCH_CANDIDATES, repeats=3):
+        """Örnek üzerinde her aday batch boyutunun satır/sn değerini ölçer, en hızlısını seçer."""
+        prepared = self.prepare(X_sample)
+        best, best_rate = self.batch_size, 0.0
+        for size in candidates:
+            if size > len(prepared):
+                break
+            self.batch_size = size
+            batch = prepared[:size]
+            self.predict_prepared(batch)  # Bu şekil için ısınma (graf kurulumu)
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                self.predict_prepared(batch)
+            rate = size * repeats / (time.perf_counter() - t0)
+            print(f"   batch {size:>6}: {rate:,.0f} satır/sn")
+            if rate > best_rate:
+                best, best_rate = size, rate
+        self.batch_size = best
+        self.warmup()
+        print(f"🎯 Seçilen batch boyutu: {best}")
+        return best
+
+
+def resolve_runtime(runtime='auto', model_path=MODEL_PATH, scaler_path=SCALER_PATH):
+    """
+    'auto' / 'tflite' / 'keras' -> gerçekte yüklenecek çalışma zamanı ('tflite' ya da 'keras').
+    Model yüklenmeden önce bilinmesi gerekir: TF iş parçacığı ayarları yalnızca TF çalışma
+    zamanı başlamadan yapılabilir (bkz. risk_map._init_worker).
+    """
+    if runtime in ('auto', 'tflite'):
+        from src.lite_model import lite_path_for, is_fresh
+        lite_path = lite_path_for(model_path)
+        if is_fresh(lite_path, model_path, scaler_path):
+            return 'tflite'
+        if runtime == 'tflite':
+            raise ValueError(f"{lite_path} yok ya da {model_path} / {scaler_path} ile güncel değil. "
+                             f"Önce 'python -m src.lite_model export --model {model_path} --scaler {scaler_path}' çalıştırın.")
+    return 'keras'
+
+
+def load_scorer(runtime='auto', model_path=MODEL_PATH, scaler_path=SCALER_PATH,
+                config_path=MODEL_CONFIG_PATH):
+    """
+    runtime: 'keras' (FireRiskScorer), 'tflite' (LiteScorer, bkz. src/lite_model.py) ya da
+    'auto' -> güncel bir .tflite dışa aktarımı varsa o, yoksa Keras.
+    .tflite yolu model_path'ten türetilir (models/x.h5 -> models/x.tflite); 'tflite' istenip
+    dışa aktarım bu model / scaler ile güncel değilse başka bir modelle puanlamak yerine hata verilir.
+    """
+    if resolve_runtime(runtime, model_path, scaler_path) == 'tflite':
+        from src.lite_model import LiteScorer, lite_path_for
+        return LiteScorer(lite_path_for(model_path))
+    return FireRiskScorer(model_path, scaler_path, config_path)
+
+
+def iter_input_chunks(path, chunk_rows=READ_CHUNK_ROWS):
+    """Dosyadan ham öznitelik parçaları: .npy (n,3)/(n,T,3), .csv ya da sütunlu depo."""
+    import pandas as pd
+
+    if path.endswith('.npy'):
+        X = np.load(path, mmap_mode='r')
+        for start in range(0, len(X), chunk_rows):
+            yield X[start:start + chunk_rows]
+    elif path.endswith('.csv'):
+        for chunk in pd.read_csv(path, usecols=FEATURES, chunksize=chunk_rows):
+            yield chunk[FEATURES].to_numpy(dtype=np.float32)
+    elif store_exists(path):
+        arrays = read_arrays(path, FEATURES)
+        n = len(arrays[FEATURES[0]])
+        for start in range(0, n, chunk_rows):
+            yield np.column_stack([arrays[c][start:start + chunk_rows] for c in FEATURES])
+    else:
+        raise FileNotFoundError(f"Girdi bulunamadı ya da desteklenmiyor: {path}")
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.path, self.header = path, True
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def append(self, df):
+        df.to_csv(self.path, mode='w' if self.header else 'a', header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        return self.path
+
+
+def score_file(scorer, input_path, output_path, batch_size='auto', chunk_rows=READ_CHUNK_ROWS):
+    """
+    Girdi dosyasını parça parça puanlar ve olasılıkları output_path'e akıtır
+    (.csv ya da sütunlu depo klasörü). Satır sırası korunur.
+    """
+    import pandas as pd
+
+    stats = None
+    sink = _CsvSink(output_path) if output_path.endswith('.csv') else StoreWriter(output_path)
+    for chunk in iter_input_chunks(input_path, chunk_rows):
+        if stats is None:
+            if batch_size == 'auto':
+                print("🔧 Batch boyutu ayarlanıyor...")
+                scorer.tune_batch_size(chunk[:max(BATCH_CANDIDATES) * 2])
+            else:
+                scorer.batch_size = int(batch_size)
+                scorer.warmup()
+            stats = InferenceStats()  # Ayar süresi throughput'a katılmaz
+        for probs in scorer.iter_scores(chunk, stats=stats):
+            sink.append(pd.DataFrame({PROB_COLUMN: probs.astype(np.float32)}))
+    sink.close()
+    print(f"💾 Olasılıklar yazıldı: {output_path}")
+    return stats.report() if stats else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eğitilmiş LSTM ile toplu yangın riski tahmini.")
+    parser.add_argument('input', help="Girdi: .npy, .csv ya da sütunlu depo klasörü")
+    parser.add_argument('--output', required=True, help="Çıktı: .csv ya da sütunlu depo klasörü")
+    parser.add_argument('--batch-size', default='auto', help="Sayı ya da 'auto'")
+    parser.add_argument('--chunk-rows', type=int, default=READ_CHUNK_ROWS)
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--scaler', default=SCALER_PATH)
+    parser.add_argument('--runtime', choices=['auto', 'keras', 'tflite'], default='auto',
+                        help="auto: güncel .tflite varsa onu kullan (bkz. src/lite_model.py)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        scorer = load_scorer(args.runtime, args.model, args.scaler)
+    except (ValueError, FileNotFoundError) as e:
+        raise SystemExit(f"❌ HATA: {e}")
+    print(f"✅ Model ve scaler yüklendi ({type(scorer).__name__}, {time.perf_counter() - t0:.2f} sn, "
+          f"{scorer.steps} zaman adımı)")
+    score_file(scorer, args.input, args.output, args.batch_size, args.chunk_rows)
@@ -0,0 +1,19 @@
+"""
+Veri Alma (Ingestion) Paketi
+
+Yangın noktaları (label=1), yangın olmayan noktalar (label=0) ve statik katmanlar
+(yükseklik, eğim) için import edilebilir, yan etkisiz fonksiyonlar. Modüller import
+edilirken kimlik doğrulama, koleksiyon kurma ya da dışa aktarma yapılmaz. Arka uç
+(Earth Engine ya da yerel rasterlar) ilk kullanımda, süreç başına bir kez kurulur
+(get_client).
+
+    python -m src.ingest fire --from 2021-07-01 --to 2021-08-30
+    python -m src.ingest nonfire --count 500 --wait
+    python -m src.ingest static
+    python -m src.ingest fire nonfire static --backend local --wait   # eşzamanlı işler
+"""
+from src.ingest.client import get_client
+from src.ingest.fire import build_fire_dataset, ingest_fire
+from src.ingest.nonfire import build_non_fire_dataset, ingest_nonfire
+from src.ingest.static import ingest_static
+from src.ingest.cli import JOBS, run_jobs
@@ -0,0 +1,3 @@
+from src.ingest.cli import main
+
+main()
@@ -0,0 +1,102 @@
+"""
+FIRMS Tespitlerinin (Hücre, Gün) Bazında Birleştirilmesi
+
+process_fire_image her görüntüyü 1 km'lik merkezlere çevirir. Aynı güne ait birden
+fazla görüntü ve çok günlü yangınlar aynı hücre için neredeyse aynı satırları üretir.
+Her satır öznitelik çıkarımına (get_features) ayrı girer, eğitim süresini şişirir ve
+komşu günlerin satırları eğitim / test bölmesinin iki tarafına düşerek sızıntı yaratır.
+
+Bu aşama tespitleri öznitelik çıkarımından önce (ızgara hücresi, gün kovası)
+anahtarlarına indirger:
+- cell_pixels : hücre kenarı, 1 km'lik piksel sayısı (yerel ızgara / SCALE ile hizalı)
+- bin_days    : gün kovası uzunluğu (1 = aynı gün; >1 çok günlü yangını tek satıra indirir)
+- Her kova için: tespit sayısı, T21 parlaklık sıcaklığı ortalaması / en büyüğü ve
+  (Earth Engine'de) FIRMS güven değeri ortalaması. ACQ_DATE kovadaki ilk tespit günüdür,
+  konum hücre merkezidir.
+"""
+import numpy as np
+import pandas as pd
+
+from src.raster_backend import DAY_MS, SCALE
+
+# --- AYARLAR ---
+CELL_PIXELS = 1
+BIN_DAYS = 1
+BIN_COLUMNS = ['detections', 'brightness_mean', 'brightness_max', 'confidence_mean']
+
+
+def bin_detections(points, west, north, cell_size, bin_days=BIN_DAYS):
+    """
+    points: lon, lat, ACQ_DATE (ms) ve isteğe bağlı brightness / confidence sütunlu DataFrame
+    west, north, cell_size: ızgara başlangıcı ve hücre kenarı (derece)
+    Dönüş: kova başına bir satır (lon, lat, label=1, ACQ_DATE + BIN_COLUMNS)
+    """
+    if points.empty:
+        return pd.DataFrame(columns=['lon', 'lat', 'label', 'ACQ_DATE'] + BIN_COLUMNS)
+    points = points.assign(
+        row=np.floor((north - points['lat'].to_numpy()) / cell_size).astype(np.int64),
+        col=np.floor((points['lon'].to_numpy() - west) / cell_size).astype(np.int64),
+        bin=points['ACQ_DATE'].to_numpy(dtype=np.int64) // DAY_MS // bin_days,
+    )
+    for column in ['brightness', 'confidence']:
+        if column not in points:
+            points[column] = np.nan
+
+    bins = points.groupby(['bin', 'row', 'col'], sort=True).agg(
+        ACQ_DATE=('ACQ_DATE', 'min'),
+        detections=('ACQ_DATE', 'size'),
+        brightness_mean=('brightness', 'mean'),
+        brightness_max=('brightness', 'max'),
+        confidence_mean=('confidence', 'mean'),
+    ).reset_index()
+    bins['lon'] = west + (bins['col'] + 0.5) * cell_size
+    bins['lat'] = north - (bins['row'] + 0.5) * cell_size
+    bins['label'] = 1
+    return bins[['lon', 'lat', 'label', 'ACQ_DATE'] + BIN_COLUMNS]
+
+
+def _ee_binned(backend, start_date, end_date, cell_pixels, bin_days):
+    """
+    Her gün kovası için FIRMS görüntüleri tek kompozite indirgenir (sayı, T21, güven) ve
+    cell_pixels x SCALE ölçeğinde örneklenir: her yangınlı hücreden tek nokta (hücre merkezi).
+    """
+    ee = backend.ee
+    firms = ee.ImageCollection('FIRMS').filterDate(start_date, end_date).filterBounds(backend.roi)
+    n_bins = int(np.ceil((pd.Timestamp(end_date) - pd.Timestamp(start_date)).days / bin_days))
+    offsets = ee.List.sequence(0, max(n_bins - 1, 0)).map(lambda i: ee.Number(i).multiply(bin_days))
+
+    def per_bin(offset):
+        day = ee.Date(start_date).advance(offset, 'day')
+        window = firms.filterDate(day, day.advance(bin_days, 'day'))
+        t21 = window.select('T21')
+        image = t21.count().rename('detections') \
+            .addBands(t21.mean().rename('brightness_mean')) \
+            .addBands(t21.max().rename('brightness_max')) \
+            .addBands(window.select('confidence').mean().rename('confidence_mean'))
+        # Kovadaki ilk tespit günü: her görüntünün tarihi, yangın pikselleriyle maskelenip en küçüğü
+        first = window.map(lambda img: ee.Image.constant(img.date().millis()).toDouble()
+                           .updateMask(img.select('T21').mask()).rename('ACQ_DATE')).min()
+        samples = image.addBands(first).sample(region=backend.roi, scale=SCALE * cell_pixels,
+                                               geometries=True, dropNulls=True)
+        samples = samples.map(lambda f: f.set({
+            'label': 1,
+            'ACQ_DATE': ee.Number(f.get('ACQ_DATE')).toLong(),
+            'lon': f.geometry().coordinates().get(0),
+            'lat': f.geometry().coordinates().get(1),
+        }))
+        # Görüntüsü olmayan kovada kompozitin bandı olmaz; boş koleksiyon döndür
+        return ee.Algorithms.If(window.size().gt(0), samples, ee.FeatureCollection([]))
+
+    return ee.FeatureCollection(offsets.map(per_bin)).flatten()
+
+
+def binned_fire_points(backend, start_date, end_date, cell_pixels=CELL_PIXELS, bin_days=BIN_DAYS):
+    """backend.fire_points ile aynı aralık, (hücre, gün kovası) başına tek satır."""
+    if backend.name == 'ee':
+        return _ee_binned(backend, start_date, end_date, cell_pixels, bin_days)
+
+    detections = backend.fire_points(start_date, end_date)
+    bins = bin_detections(detections, backend.west, backend.north, backend.pixel_size * cell_pixels, bin_days)
+    print(f"🧮 {len(detections):,} tespit -> {len(bins):,} (hücre, gün) kovası "
+          f"({cell_pixels} piksel, {bin_days} gün)")
+    return bins
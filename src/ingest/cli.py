@@ -0,0 +1,117 @@
+"""
+Tek Giriş Noktası: python -m src.ingest <iş> [<iş> ...]
+
+İşler (fire, nonfire, static) aynı süreçte, tek bir paylaşılan istemciyle
+(get_client) iş parçacığı havuzunda eşzamanlı çalışır. Earth Engine çağrıları
+ağ beklemesi olduğundan iş parçacıkları yeterlidir.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.raster_backend import LOCAL_RASTER_FOLDER, ROI_BOUNDS
+from src.export_chunks import FREQUENCIES, MAX_WORKERS
+from src.ingest.client import get_client
+from src.ingest.fire import ingest_fire
+from src.ingest.binning import CELL_PIXELS, BIN_DAYS
+from src.ingest.nonfire import ingest_nonfire, POINT_COUNT, SAMPLERS
+from src.ingest.negatives import ALLOCATIONS, BUFFER_KM, BUFFER_DAYS
+from src.ingest.static import ingest_static
+from src.timing import StageTimer
+
+JOBS = {
+    'fire': ingest_fire,
+    'nonfire': ingest_nonfire,
+    'static': ingest_static,
+}
+
+
+def job_kwargs(name, args):
+    """CLI argümanlarından ilgili işin parametreleri."""
+    if name == 'fire':
+        return {'start_date': args.start, 'end_date': args.end, 'chunk': args.chunk,
+                'workers': args.workers, 'wait': args.wait, 'incremental': args.incremental,
+                'binning': args.binning, 'cell_pixels': args.cell_pixels, 'bin_days': args.bin_days}
+    if name == 'nonfire':
+        kwargs = {'point_count': args.count, 'start_date': args.start, 'end_date': args.end,
+                  'wait': args.wait, 'incremental': args.incremental, 'sampler': args.sampler}
+        if args.sampler == 'stratified':
+            kwargs.update(allocation=args.allocation, buffer_km=args.buffer_km, buffer_days=args.buffer_days)
+        return kwargs
+    return {'wait': args.wait}
+
+
+def run_jobs(jobs, backend, max_jobs=None):
+    """
+    jobs: [(iş adı, parametreler)]. Her iş JOBS[ad](backend, **parametreler) olarak
+    eşzamanlı çalışır; bir işin hatası diğerlerini durdurmaz.
+    Dönüş: {iş adı: sonuç ya da Exception}
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_jobs or len(jobs)) as pool:
+        futures = {pool.submit(JOBS[name], backend, **kwargs): name for name, kwargs in jobs}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+                print(f"✅ {name} tamamlandı")
+            except Exception as e:
+                results[name] = e
+                print(f"❌ {name}: {e}")
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src.ingest',
+                                     description="Yangın / yangın olmayan / statik veri alma işleri.")
+    parser.add_argument('jobs', nargs='+', choices=list(JOBS), help="Çalıştırılacak işler (eşzamanlı)")
+    parser.add_argument('--backend', choices=['ee', 'local'], default='ee')
+    parser.add_argument('--raster-folder', default=LOCAL_RASTER_FOLDER,
+                        help="Yerel arka uç için raster klasörü")
+    parser.add_argument('--from', '--start', dest='start', default=None, help="Başlangıç tarihi (YYYY-MM-DD)")
+    parser.add_argument('--to', '--end', dest='end', default=None,
+                        help="Bitiş tarihi, hariç (varsayılan: işe göre; --incremental ile bugün)")
+    parser.add_argument('--roi', nargs=4, type=float, default=ROI_BOUNDS,
+                        metavar=('BATI', 'GÜNEY', 'DOĞU', 'KUZEY'))
+    parser.add_argument('--chunk', choices=['none'] + list(FREQUENCIES), default='month',
+                        help="fire: dışa aktarmayı aylık/haftalık parçalara böl ('none': tek görev)")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help="fire: eşzamanlı gönderilecek en fazla parça sayısı")
+    parser.add_argument('--cell-pixels', type=int, default=CELL_PIXELS,
+                        help="fire: tespitlerin birleştirildiği hücre kenarı (1 km'lik piksel sayısı)")
+    parser.add_argument('--bin-days', type=int, default=BIN_DAYS,
+                        help="fire: tespitlerin birleştirildiği gün kovası uzunluğu")
+    parser.add_argument('--no-binning', dest='binning', action='store_false',
+                        help="fire: ham FIRMS merkezlerini kullan (hücre / gün kovalaması yapma)")
+    parser.add_argument('--count', type=int, default=POINT_COUNT, help="nonfire: nokta sayısı")
+    parser.add_argument('--sampler', choices=SAMPLERS, default='uniform',
+                        help="nonfire: 'stratified' -> ay / yükseklik / arazi örtüsü katmanlı örnekleme")
+    parser.add_argument('--allocation', choices=ALLOCATIONS, default='proportional',
+                        help="nonfire --sampler stratified: kotaların katmanlara dağıtımı")
+    parser.add_argument('--buffer-km', type=float, default=BUFFER_KM,
+                        help="nonfire --sampler stratified: FIRMS tespitleri çevresinde dışlanan yarıçap")
+    parser.add_argument('--buffer-days', type=int, default=BUFFER_DAYS,
+                        help="nonfire --sampler stratified: tespitlerden önce / sonra dışlanan gün sayısı")
+    parser.add_argument('--wait', action='store_true',
+                        help="Görevlerin bitmesini bekle ve tabloları data/ altına indir")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Yalnızca mevcut tablodaki son ACQ_DATE'ten sonrasını çek ve ekle")
+    parser.add_argument('--jobs', dest='max_jobs', type=int, default=None,
+                        help="Eşzamanlı iş sayısı (varsayılan: iş sayısı)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    jobs = list(dict.fromkeys(args.jobs))  # Aynı iş iki kez verilirse bir kez çalışır
+
+    timer = StageTimer('Veri Alma')
+    with timer.stage('istemci'):
+        backend = get_client(args.backend, args.raster_folder, args.roi)
+    with timer.stage(', '.join(jobs)):
+        results = run_jobs([(name, job_kwargs(name, args)) for name in jobs], backend, args.max_jobs)
+    if len(jobs) > 1:
+        timer.report()
+    failed = [name for name, result in results.items() if isinstance(result, Exception)]
+    if failed:
+        raise SystemExit(f"❌ Başarısız işler: {', '.join(failed)}")
+    return results
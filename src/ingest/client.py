@@ -0,0 +1,23 @@
+"""
+Süreç Başına Tek Arka Uç İstemcisi
+
+get_client aynı (arka uç, raster klasörü, ROI) için her zaman aynı nesneyi döndürür.
+Earth Engine kimlik doğrulaması nesnenin ilk kullanımında bir kez yapılır
+(EarthEngineBackend.ee), yerel rasterlar bir kez bellek eşlemeli açılır. Eşzamanlı
+işler istemciyi paylaşır; işçi süreçleri kendi istemcilerini ilk çağrıda kurar.
+"""
+import os
+import threading
+
+from src.raster_backend import get_backend, LOCAL_RASTER_FOLDER, ROI_BOUNDS
+
+_CLIENTS = {}
+_LOCK = threading.Lock()
+
+
+def get_client(backend='ee', raster_folder=LOCAL_RASTER_FOLDER, roi=ROI_BOUNDS):
+    key = (backend, os.path.abspath(raster_folder) if backend == 'local' else None, tuple(roi))
+    with _LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = get_backend(backend, raster_folder=raster_folder, roi_bounds=list(roi))
+        return _CLIENTS[key]
@@ -0,0 +1,134 @@
+"""
+Yangın Noktaları (label=1)
+
+FIRMS tespitleri noktaya çevrilir, uydu öznitelikleriyle eşlenir ve tablo olarak
+dışa aktarılır. Uzun aralıklar aylık / haftalık parçalara bölünebilir (export_chunks),
+--incremental ile yalnızca mevcut tablodaki son ACQ_DATE'ten sonrası çekilir.
+
+Varsayılan olarak tespitler öznitelik çıkarımından önce (hücre, gün) kovalarına
+indirgenir (bkz. binning.py); binning=False ham FIRMS merkezlerini kullanır.
+"""
+import os
+from datetime import date
+from functools import partial
+
+from src.raster_backend import EXPORT_SELECTORS, FEATURE_PROPERTIES
+from src.export_chunks import export_chunked, split_date_range, MAX_WORKERS
+from src.export_tasks import collect_task, collect_manifest, DATA_FOLDER, CHUNK_FOLDER
+from src.incremental import next_window, append_dedup
+from src.ingest.binning import binned_fire_points, BIN_COLUMNS, CELL_PIXELS, BIN_DAYS
+from src.timing import StageTimer
+
+# --- AYARLAR ---
+START_DATE = '2021-07-01'  # Yangınların yoğun olduğu yaz dönemi
+END_DATE = '2021-08-30'
+EXPORT_NAME = 'Antalya_Yangin_Verisi_Tam'
+
+
+def build_fire_dataset(backend, start_date=START_DATE, end_date=END_DATE,
+                       binning=True, cell_pixels=CELL_PIXELS, bin_days=BIN_DAYS):
+    """
+    Yangın noktalarını (label=1) oluşturur ve uydu öznitelikleriyle eşler.
+    Arka uç Earth Engine ya da yerel rasterlar olabilir (bkz. src/raster_backend.py).
+    binning=True: tespitler (cell_pixels hücre, bin_days gün) kovalarına indirgenir.
+    """
+    print("🔥 Yangın verileri işleniyor...")
+    if binning:
+        # Aynı hücre / gün kovasındaki tespitler tek satır (sayı + parlaklık / güven istatistikleri)
+        dataset = binned_fire_points(backend, start_date, end_date, cell_pixels, bin_days)
+    else:
+        # FIRMS görüntüleri process_fire_image ile noktalara çevrilir (ACQ_DATE + label=1)
+        dataset = backend.fire_points(start_date, end_date)
+
+    print("🛰️ Uydu görüntüleri (Sıcaklık, NDVI, Yükseklik) eşleştiriliyor...")
+    # Her tarih için tek kompozit + toplu örnekleme (nokta başına kompozit kurmak yerine)
+    # Kova istatistikleri de taşınır (Earth Engine sampleRegions yalnızca istenen özellikleri korur)
+    properties = FEATURE_PROPERTIES + BIN_COLUMNS if binning else FEATURE_PROPERTIES
+    dataset_processed = backend.get_features(dataset, properties=properties)
+
+    # Boş verileri temizle
+    return backend.drop_nulls(dataset_processed)
+
+
+def export_selectors(binning=True):
+    """Kovalama açıksa tabloya kova istatistikleri de yazılır."""
+    return EXPORT_SELECTORS + BIN_COLUMNS if binning else EXPORT_SELECTORS
+
+
+def export_fire_dataset(backend, start_date=START_DATE, end_date=END_DATE, description=EXPORT_NAME,
+                        binning=True, **bin_options):
+    dataset_final = build_fire_dataset(backend, start_date, end_date, binning, **bin_options)
+
+    # Dışa Aktar (Earth Engine: Drive, yerel: data/exports)
+    print("🚀 Dışa aktarma görevi başlatılıyor...")
+    return backend.export_table(dataset_final, description, selectors=export_selectors(binning))
+
+
+def export_fire_dataset_chunked(backend, start_date=START_DATE, end_date=END_DATE,
+                                description=EXPORT_NAME, freq='month', max_workers=MAX_WORKERS,
+                                binning=True, **bin_options):
+    """
+    Uzun tarih aralıkları için: aralığı aylık/haftalık parçalara böler ve her parçayı
+    ayrı görev olarak paralel gönderir. Manifest sayesinde yarıda kalan çalışma devam ettirilir.
+    Kovalar parça içinde kurulur; bin_days > 1 ise parça sınırındaki yangın iki kovaya bölünebilir.
+    """
+    build_fn = partial(build_fire_dataset, binning=binning, **bin_options)
+    return export_chunked(backend, build_fn, start_date, end_date, description,
+                          freq=freq, max_workers=max_workers, selectors=export_selectors(binning),
+                          params={'binning': binning, **bin_options})
+
+
+def ingest_fire(backend, start_date=None, end_date=None, chunk='month', workers=MAX_WORKERS,
+                wait=False, incremental=False, description=EXPORT_NAME,
+                binning=True, cell_pixels=CELL_PIXELS, bin_days=BIN_DAYS):
+    """
+    Yangın tablosunu dışa aktarır; wait=True ise data/<description>.csv olarak indirir.
+    chunk: 'month' / 'week' ya da 'none' (tek görev).
+    binning / cell_pixels / bin_days: tespitlerin (hücre, gün) kovalarına indirgenmesi.
+    Dönüş: indirilen tablonun yolu (wait yoksa None)
+    """
+    start_date = start_date or START_DATE
+    if end_date is None:
+        end_date = date.today().isoformat() if incremental else END_DATE
+
+    final_path = os.path.join(DATA_FOLDER, f'{description}.csv')
+    output_path = final_path
+    if incremental:
+        window = next_window(final_path, end_date, start_date)
+        if window is None:
+            print(f"✅ {final_path} zaten güncel ({end_date} öncesi tüm günler mevcut).")
+            return final_path
+        start_date, end_date = window
+        # Yeni satırlar önce ayrı dosyaya indirilir, sonra mevcut tabloya eklenir
+        wait = True
+        output_path = os.path.join(CHUNK_FOLDER, f'{description}_{start_date}_{end_date}.csv')
+        os.makedirs(CHUNK_FOLDER, exist_ok=True)
+
+    print(f"📍 Bölge: {backend.roi_bounds} | Tarih: {start_date} - {end_date}")
+    bin_options = {'binning': binning, 'cell_pixels': cell_pixels, 'bin_days': bin_days}
+    timer = StageTimer('Yangın Verisi - Aşama Süreleri')
+
+    if chunk != 'none':
+        with timer.stage('gönderim'):
+            manifest = export_fire_dataset_chunked(backend, start_date, end_date, description,
+                                                   freq=chunk, max_workers=workers, **bin_options)
+        print(f"\n📒 Manifest: {manifest.path}")
+        if wait:
+            keys = [f'{a}_{b}' for a, b in split_date_range(start_date, end_date, chunk)]
+            collect_manifest(backend, manifest, output_path, keys=keys, timer=timer)
+    else:
+        with timer.stage('gönderim'):
+            task = export_fire_dataset(backend, start_date, end_date, description, **bin_options)
+        print("\n✅ GÖREV BAŞARIYLA GÖNDERİLDİ!")
+        if wait:
+            collect_task(backend, task, output_path, timer=timer)
+
+    if incremental:
+        with timer.stage('ekleme'):
+            added, total = append_dedup(final_path, output_path)
+        print(f"➕ {added} yeni satır eklendi | {final_path}: {total} satır")
+
+    if not wait and backend.name == 'ee':
+        print("Task Manager: https://code.earthengine.google.com/tasks")
+    timer.report()
+    return final_path if wait else None
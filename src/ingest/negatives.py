@@ -0,0 +1,318 @@
+"""
+Katmanlı (Stratified) Negatif Örnekleme
+
+Düzgün dağılımlı randomPoints + notNull yerine istenen sayıda (100k+) yangın olmayan
+nokta üretir:
+
+- Katmanlar: ay x yükseklik bandı x arazi örtüsü. Kota katmanın büyüklüğüyle orantılı
+  (piksel sayısı x gün, 'proportional') ya da eşit ('equal') dağıtılır.
+- FIRMS tespitlerinin çevresi dışlanır: buffer_km yarıçapında ve ± buffer_days gün içinde
+  yangın olan (piksel, gün) adayları atılır.
+- Boş (NaN) öznitelikli adaylar düşeceği için fazladan aday çekilir (oversample). Yerel
+  modda turlar halinde eksik katmanlar için yeniden çekilir, böylece kota tutturulur.
+- Yerel mod tamamen vektöreldir: adaylar piksel indeksleriyle üretilir, yangın tamponu ay
+  başına kümülatif toplamla O(1) sorgulanır, öznitelikler point_sampler ile toplu okunur.
+
+Earth Engine modunda her ay için stratifiedSample sunucu tarafında çalışır (tek tur).
+Buradaki yangın tamponu (piksel, gün) bazında değil ay bazındadır: [ay başı - buffer_days,
+ay sonu + buffer_days) içinde herhangi bir gün yangın görmüş pikselin tamponu o ayın tüm
+günleri için dışlanır. Bu yerel moddan daha katıdır (yangına uzak günler de atılır), gevşek
+değildir. Kota her katmana ayrı uygulanır; oversample yetmezse katman eksik kalabilir.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.raster_backend import DAY_MS, METERS_PER_DEGREE, SCALE, RANDOM_START_MS, RANDOM_SPAN_MS
+
+# --- AYARLAR ---
+ELEVATION_BANDS = [0, 250, 500, 1000, 1500]  # Bant alt sınırları (m); son bant üstü açık
+BUFFER_KM = 5.0
+BUFFER_DAYS = 7
+OVERSAMPLE = 1.5   # İlk turda kotanın bu katı aday çekilir
+MAX_ROUNDS = 10
+ALLOCATIONS = ('proportional', 'equal')
+
+
+def month_windows(start_ms, end_ms):
+    """[start_ms, end_ms) aralığını takvim aylarına böler: [(ay başı gün, ay sonu gün, 'YYYY-MM')]"""
+    start, end = pd.Timestamp(start_ms, unit='ms').normalize(), pd.Timestamp(end_ms, unit='ms').normalize()
+    bounds = [start] + list(pd.date_range(start, end, freq='MS', inclusive='neither')) + [end]
+    return [(a.value // 1_000_000 // DAY_MS, b.value // 1_000_000 // DAY_MS, a.strftime('%Y-%m'))
+            for a, b in zip(bounds[:-1], bounds[1:]) if a < b]
+
+
+def elevation_band(elevation, bands=ELEVATION_BANDS):
+    """Yükseklik -> bant indeksi (0, 1, ...). NaN -> -1. Deniz seviyesi altı ilk banda girer."""
+    elevation = np.asarray(elevation, dtype=np.float64)
+    band = np.clip(np.searchsorted(bands, elevation, side='right') - 1, 0, None)
+    band[np.isnan(elevation)] = -1
+    return band
+
+
+def allocate(count, weights):
+    """count'u ağırlıklara göre tam sayılara böler (en büyük kalan yöntemi)."""
+    weights = np.asarray(weights, dtype=np.float64)
+    exact = count * weights / weights.sum()
+    quota = np.floor(exact).astype(np.int64)
+    quota[np.argsort(exact - quota)[::-1][:count - quota.sum()]] += 1
+    return quota
+
+
+def _footprint(radius_rows, radius_cols):
+    """Elips şeklinde tampon için (dy, dx) kaydırmaları."""
+    ry, rx = max(radius_rows, 1e-9), max(radius_cols, 1e-9)
+    return [(dy, dx) for dy in range(-int(ry), int(ry) + 1) for dx in range(-int(rx), int(rx) + 1)
+            if (dy / ry) ** 2 + (dx / rx) ** 2 <= 1]
+
+
+def _dilate(mask, offsets):
+    """(k, H, W) bool maskeyi verilen kaydırmalarla genişletir (ikili dilation, yalnızca NumPy)."""
+    out = mask.copy()
+    h, w = mask.shape[1:]
+    for dy, dx in offsets:
+        if dy == 0 and dx == 0:
+            continue
+        out[:, max(dy, 0):h + min(dy, 0), max(dx, 0):w + min(dx, 0)] |= \
+            mask[:, max(-dy, 0):h + min(-dy, 0), max(-dx, 0):w + min(-dx, 0)]
+    return out
+
+
+class FireExclusion:
+    """
+    [ilk gün, son gün) penceresindeki yangın görüntülerinin tamponlanmış maskeleri.
+    near(row, col, day): ± buffer_days içinde o pikselin tamponunda yangın var mı?
+    Kümülatif toplam sayesinde her sorgu iki dizi okumasıdır.
+    """
+
+    def __init__(self, backend, first_day, last_day, buffer_km=BUFFER_KM, buffer_days=BUFFER_DAYS):
+        self.buffer_days = buffer_days
+        self.days = np.empty(0, dtype=np.int64)
+        self.cumulative = None
+        if backend.fire is None:
+            return
+        fire_days = backend.fire_dates // DAY_MS
+        selected = np.flatnonzero((fire_days >= first_day - buffer_days) & (fire_days < last_day + buffer_days))
+        if len(selected) == 0:
+            return
+        selected = selected[np.argsort(fire_days[selected], kind='stable')]
+        frames = np.nan_to_num(np.asarray(backend.fire[selected], dtype=np.float32)) > 0
+
+        # Piksel kenarı (m): enlem yönünde sabit, boylam yönünde cos(enlem) ile daralır
+        _, lat = backend.pixel_center(np.arange(backend.shape[0]), 0)
+        pixel_m = backend.pixel_size * METERS_PER_DEGREE
+        radius_rows = buffer_km * 1000 / pixel_m
+        radius_cols = buffer_km * 1000 / (pixel_m * np.cos(np.radians(np.mean(lat))))
+        frames = _dilate(frames, _footprint(radius_rows, radius_cols))
+
+        self.days = fire_days[selected]
+        self.cumulative = np.zeros((len(selected) + 1,) + backend.shape, dtype=np.int32)
+        np.cumsum(frames, axis=0, out=self.cumulative[1:])
+
+    def near(self, row, col, day):
+        if self.cumulative is None:
+            return np.zeros(len(row), dtype=bool)
+        lo = np.searchsorted(self.days, day - self.buffer_days, side='left')
+        hi = np.searchsorted(self.days, day + self.buffer_days, side='right')
+        return self.cumulative[hi, row, col] - self.cumulative[lo, row, col] > 0
+
+
+def _pixel_strata(backend, bands=ELEVATION_BANDS):
+    """Her piksel için (yükseklik bandı, arazi örtüsü) katman indeksi; geçersiz -1."""
+    band = elevation_band(backend.elevation, bands).ravel()
+    if backend.landcover is not None:
+        landcover = np.asarray(backend.landcover).ravel()
+        classes, lc_index = np.unique(landcover, return_inverse=True)
+    else:
+        classes, lc_index = np.array([-1]), np.zeros(band.shape, dtype=np.int64)
+    strata = np.where(band >= 0, band * len(classes) + lc_index, -1)
+    return strata, classes
+
+
+def _group_ranks(keys):
+    """Her elemanın kendi anahtar grubundaki sırası (0, 1, ...), ilk görülme sırasına göre."""
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.r_[0, np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1]
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys)) - np.repeat(starts, np.diff(np.r_[starts, len(keys)]))
+    return ranks
+
+
+def _local_negatives(backend, count, start_ms, end_ms, allocation, buffer_km, buffer_days,
+                     oversample, seed, bands, max_rounds):
+    from src.point_sampler import sample_points
+
+    rng = np.random.default_rng(seed)
+    h, w = backend.shape
+    pixel_strata, classes = _pixel_strata(backend, bands)
+    n_pixel_strata = (len(bands)) * len(classes)
+    pixel_order = np.argsort(pixel_strata, kind='stable')
+    sizes = np.bincount(pixel_strata[pixel_strata >= 0], minlength=n_pixel_strata)
+    offsets = np.searchsorted(pixel_strata[pixel_order], np.arange(n_pixel_strata))
+
+    months = month_windows(start_ms, end_ms)
+    # Katman = (ay, piksel katmanı); ağırlık = piksel sayısı x gün (orantılı) ya da 1 (eşit)
+    month_idx, pix_idx = np.nonzero(np.ones((len(months), n_pixel_strata), dtype=bool) & (sizes > 0))
+    days = np.array([b - a for a, b, _ in months])
+    weights = sizes[pix_idx] * days[month_idx] if allocation == 'proportional' else np.ones(len(pix_idx))
+    quota = allocate(count, weights)
+
+    stats = {'drawn': 0, 'near_fire': 0, 'null': 0, 'duplicate': 0, 'rounds': 0}
+    accepted = []
+    for m, (first_day, last_day, label) in enumerate(months):
+        in_month = np.flatnonzero(month_idx == m)
+        need = quota[in_month].copy()
+        if need.sum() == 0:
+            continue
+        exclusion = FireExclusion(backend, first_day, last_day, buffer_km, buffer_days)
+        rate = np.full(len(in_month), 1 / oversample)  # Katman başına kabul oranı tahmini
+        drawn_total = np.zeros(len(in_month))
+        kept_total = np.zeros(len(in_month))
+        taken = np.empty(0, dtype=np.int64)
+
+        for round_ in range(max_rounds):
+            if need.sum() == 0:
+                break
+            stats['rounds'] = max(stats['rounds'], round_ + 1)
+            draws = np.ceil(need / np.maximum(rate, 0.02) * 1.1).astype(np.int64) * (need > 0)
+            stratum = np.repeat(np.arange(len(in_month)), draws)
+            pix = pix_idx[in_month][stratum]
+            pixel = pixel_order[offsets[pix] + (rng.random(len(pix)) * sizes[pix]).astype(np.int64)]
+            row, col = pixel // w, pixel % w
+            day = first_day + (rng.random(len(pix)) * (last_day - first_day)).astype(np.int64)
+            stats['drawn'] += len(pix)
+
+            ok = ~exclusion.near(row, col, day)
+            stats['near_fire'] += int((~ok).sum())
+            # Aynı (piksel, gün) iki kez alınmasın: bu turda ve önceki turlarda
+            key = (day * h + row) * w + col
+            _, first = np.unique(key, return_index=True)
+            unique = np.zeros(len(key), dtype=bool)
+            unique[first] = True
+            unique &= ~np.isin(key, taken)
+            stats['duplicate'] += int((ok & ~unique).sum())
+            ok &= unique
+
+            idx = np.flatnonzero(ok)
+            lon, lat = backend.pixel_center(row[idx], col[idx])
+            jitter = (rng.random((2, len(idx))) - 0.5) * backend.pixel_size  # Piksel içinde sürekli konum
+            lon, lat = lon + jitter[0], lat + jitter[1]
+            table = sample_points(backend, lon, lat, day[idx] * DAY_MS)
+            valid = table[['LST', 'NDVI', 'elevation']].notna().all(axis=1).to_numpy()
+            stats['null'] += int((~valid).sum())
+
+            idx, table = idx[valid], table[valid]
+            keep = _group_ranks(stratum[idx]) < need[stratum[idx]]
+            idx, table = idx[keep], table[keep].copy()
+
+            np.add.at(drawn_total, stratum, 1)
+            np.add.at(kept_total, stratum[idx], 1)
+            rate = np.where(drawn_total > 0, kept_total / np.maximum(drawn_total, 1), rate)
+            need -= np.bincount(stratum[idx], minlength=len(in_month))
+            taken = np.concatenate([taken, key[idx]])
+
+            lon_lat = np.column_stack([lon, lat])[valid][keep]
+            table['lon'], table['lat'] = lon_lat[:, 0], lon_lat[:, 1]
+            table['month'] = label
+            table['elevation_band'] = pix_idx[in_month][stratum[idx]] // len(classes)
+            table['land_cover'] = classes[pix_idx[in_month][stratum[idx]] % len(classes)]
+            accepted.append(table)
+
+        if need.sum() > 0:
+            print(f"⚠️ {label}: {int(need.sum())} nokta eksik kaldı (tampon / boş veri çok fazla)")
+
+    columns = ['lon', 'lat', 'label', 'LST', 'NDVI', 'elevation', 'ACQ_DATE',
+               'month', 'elevation_band', 'land_cover']
+    dataset = pd.concat(accepted, ignore_index=True)[columns] if accepted else pd.DataFrame(columns=columns)
+    return backend.drop_nulls(dataset), stats
+
+
+def _month_quotas(count, months, sizes, allocation):
+    """
+    (ay, katman) kotaları: count önce ayların gün sayısına göre, sonra her ay içinde katman
+    ağırlıklarına göre en büyük kalan yöntemiyle bölünür; toplam her zaman count'tur.
+    """
+    days = np.array([b - a for a, b, _ in months])
+    weights = sizes if allocation == 'proportional' else np.ones(len(sizes))
+    return np.array([allocate(int(n), weights) for n in allocate(count, days)], dtype=np.int64)
+
+
+def _ee_negatives(backend, count, start_ms, end_ms, allocation, buffer_km, buffer_days,
+                  oversample, seed, bands):
+    """
+    Her ay için stratifiedSample (sunucu tarafı, tek tur; boş veri için oversample ile çekilir).
+    Yangın tamponu ay bazındadır (bkz. modül açıklaması).
+    """
+    ee = backend.ee
+    elevation = ee.Image('USGS/SRTMGL1_003').select('elevation')
+    band = elevation.gte(ee.Image.constant(bands[1:])).reduce(ee.Reducer.sum())
+    year = pd.Timestamp(start_ms, unit='ms').year
+    landcover = ee.ImageCollection('MODIS/061/MCD12Q1').filterDate(f'{year}-01-01', f'{year + 1}-01-01') \
+        .first().select('LC_Type1')
+    strata = band.multiply(100).add(landcover).rename('stratum').toInt()
+
+    # Katman büyüklükleri tek bir sunucu çağrısıyla (kaba ölçekte) alınır
+    histogram = strata.reduceRegion(ee.Reducer.frequencyHistogram(), backend.roi, SCALE * 5,
+                                    maxPixels=1e10).get('stratum').getInfo()
+    classes = np.array(sorted(int(k) for k in histogram))
+    sizes = np.array([histogram[str(c)] for c in classes], dtype=np.float64)
+
+    months = month_windows(start_ms, end_ms)
+    quotas = _month_quotas(count, months, sizes, allocation)
+    collections = []
+    for m, (first_day, last_day, label) in enumerate(months):
+        days = last_day - first_day
+        month_quota = quotas[m]
+        fires = ee.ImageCollection('FIRMS') \
+            .filterDate(ee.Date((first_day - buffer_days) * DAY_MS), ee.Date((last_day + buffer_days) * DAY_MS)) \
+            .filterBounds(backend.roi).select('T21').max().unmask(0).gt(0)
+        near = fires.focal_max(radius=buffer_km * 1000, kernelType='circle', units='meters')
+        points = strata.updateMask(near.Not()).stratifiedSample(
+            numPoints=0, classBand='stratum', region=backend.roi, scale=SCALE, seed=seed + m,
+            classValues=classes.tolist(),
+            classPoints=np.ceil(month_quota * oversample).astype(int).tolist(),
+            geometries=True)
+        points = points.randomColumn('random_val', seed + m)
+        sampled = backend.drop_nulls(backend.add_data(points, first_day * DAY_MS, days * DAY_MS))
+        # add_data yalnızca label / ACQ_DATE taşır: katman kimliği noktanın pikselinden geri okunur
+        sampled = strata.reduceRegions(sampled, ee.Reducer.first().setOutputs(['stratum']), SCALE)
+        sampled = sampled.randomColumn('order', seed + m)
+        # Kota her katmana ayrı uygulanır; ay toplamıyla kesmek kalabalık katmanları kayırırdı
+        collections += [sampled.filter(ee.Filter.eq('stratum', int(value))).limit(int(quota), 'order')
+                        for value, quota in zip(classes, month_quota) if quota > 0]
+    merged = ee.FeatureCollection(collections).flatten() if collections else ee.FeatureCollection([])
+    return merged, {'months': len(months)}
+
+
+def sample_negatives(backend, count, start_ms=RANDOM_START_MS, end_ms=None, allocation='proportional',
+                     buffer_km=BUFFER_KM, buffer_days=BUFFER_DAYS, oversample=OVERSAMPLE, seed=0,
+                     bands=ELEVATION_BANDS, max_rounds=MAX_ROUNDS):
+    """
+    count adet label=0 nokta (LST, NDVI, elevation dolu). Tarihler [start_ms, end_ms) içinde.
+    Dönüş: yerel arka uçta DataFrame (+ month, elevation_band, land_cover sütunları),
+    Earth Engine'de ee.FeatureCollection.
+    """
+    if allocation not in ALLOCATIONS:
+        raise ValueError(f"Bilinmeyen dağıtım: {allocation} (geçerli: {', '.join(ALLOCATIONS)})")
+    end_ms = end_ms or start_ms + RANDOM_SPAN_MS
+    print(f"🎯 {count:,} negatif nokta | ay x yükseklik bandı x arazi örtüsü ({allocation}) | "
+          f"yangın tamponu: {buffer_km} km, ±{buffer_days} gün")
+
+    t0 = time.perf_counter()
+    if backend.name == 'ee':
+        dataset, _ = _ee_negatives(backend, count, start_ms, end_ms, allocation, buffer_km, buffer_days,
+                                   oversample, seed, bands)
+        return dataset
+
+    dataset, stats = _local_negatives(backend, count, start_ms, end_ms, allocation, buffer_km,
+                                      buffer_days, oversample, seed, bands, max_rounds)
+    elapsed = time.perf_counter() - t0
+    print(f"✅ {len(dataset):,} nokta {elapsed:.2f} sn içinde ({stats['rounds']} tur, "
+          f"{stats['drawn']:,} aday: {stats['near_fire']:,} yangın tamponunda, {stats['null']:,} boş, "
+          f"{stats['duplicate']:,} tekrar)")
+    if len(dataset):
+        print("📊 Ay başına:", dataset['month'].value_counts().sort_index().to_dict())
+        print("📊 Yükseklik bandı başına:", dataset['elevation_band'].value_counts().sort_index().to_dict())
+    return dataset
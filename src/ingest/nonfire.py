@@ -0,0 +1,109 @@
+"""
+Yangın Olmayan Noktalar (label=0)
+
+ROI içinde rastgele noktalar üretilir, her birine [başlangıç, bitiş) aralığından rastgele
+bir tarih atanır ve uydu öznitelikleriyle eşlenir. --incremental ile yalnızca mevcut
+tablodaki son ACQ_DATE'ten sonraki pencere için yeni noktalar üretilip eklenir.
+
+sampler='stratified' ile ay / yükseklik / arazi örtüsü katmanlı, yangın tamponu dışında
+ve boş veri sonrası tam sayıya tamamlanan örnekleme kullanılır (bkz. negatives.py).
+"""
+import os
+from datetime import date
+
+import pandas as pd
+
+from src.raster_backend import RANDOM_START_MS, RANDOM_SPAN_MS, DAY_MS
+from src.export_tasks import collect_task, DATA_FOLDER, CHUNK_FOLDER
+from src.incremental import latest_acq_date, append_dedup
+from src.ingest.negatives import sample_negatives
+from src.timing import StageTimer
+
+# --- AYARLAR ---
+POINT_COUNT = 500
+SAMPLERS = ('uniform', 'stratified')
+EXPORT_NAME = 'Antalya_NonFire_Verisi_Final'
+
+
+def _date_ms(value):
+    return pd.Timestamp(value).value // 1_000_000
+
+
+def build_non_fire_dataset(backend, point_count=POINT_COUNT, seed=0,
+                           start_ms=RANDOM_START_MS, span_ms=RANDOM_SPAN_MS, sampler='uniform', **options):
+    """
+    ROI içinde rastgele 'Yangın Olmayan' noktalar (label=0) üretir.
+    Her noktaya [start_ms, start_ms + span_ms) arasında rastgele bir tarih atanır (add_data).
+    Varsayılan aralık 2021 Temmuz-Ağustos.
+    sampler='stratified': sample_negatives (options: allocation, buffer_km, buffer_days, oversample)
+    """
+    if sampler == 'stratified':
+        return sample_negatives(backend, point_count, start_ms, start_ms + span_ms, seed=seed, **options)
+    if sampler != 'uniform':
+        raise ValueError(f"Bilinmeyen örnekleyici: {sampler} (geçerli: {', '.join(SAMPLERS)})")
+
+    print(f"📍 Rastgele {point_count} adet 'Yangın Olmayan' nokta üretiliyor...")
+    # randomPoints ile noktaları oluştur, sonra her birine bir 'random' sütunu ekle
+    points = backend.random_points(point_count, seed=seed)
+
+    print("🛰️ Uydu görüntüleri işleniyor (Label=0)...")
+    return backend.drop_nulls(backend.add_data(points, start_ms, span_ms))
+
+
+def export_non_fire_dataset(backend, point_count=POINT_COUNT, description=EXPORT_NAME, **kwargs):
+    dataset_final = build_non_fire_dataset(backend, point_count, **kwargs)
+
+    # Dışa Aktar (Earth Engine: Drive, yerel: data/exports)
+    print("🚀 Dışa aktarma görevi başlatılıyor...")
+    return backend.export_table(dataset_final, description)
+
+
+def ingest_nonfire(backend, point_count=POINT_COUNT, start_date=None, end_date=None,
+                   wait=False, incremental=False, description=EXPORT_NAME, sampler='uniform', **options):
+    """
+    Yangın olmayan noktaları dışa aktarır; wait=True ise data/<description>.csv olarak indirir.
+    start_date / end_date verilirse noktaların tarihleri bu aralıktan çekilir
+    (varsayılan: 2021 Temmuz-Ağustos; --incremental ile son tarihten bugüne).
+    sampler / options: build_non_fire_dataset'e aktarılır.
+    Dönüş: indirilen tablonun yolu (wait yoksa None)
+    """
+    final_path = os.path.join(DATA_FOLDER, f'{description}.csv')
+    output_path = final_path
+    window = {}
+    if start_date is not None or end_date is not None:
+        start_ms = _date_ms(start_date) if start_date else RANDOM_START_MS
+        end_ms = _date_ms(end_date) if end_date else start_ms + RANDOM_SPAN_MS
+        window = {'start_ms': start_ms, 'span_ms': end_ms - start_ms}
+
+    if incremental:
+        latest = latest_acq_date(final_path)
+        # Son tarihin ertesi gününden başla (aynı gün tekrar çalıştırılırsa nokta eklenmez)
+        start_ms = RANDOM_START_MS if latest is None else latest // DAY_MS * DAY_MS + DAY_MS
+        end_ms = _date_ms(end_date or date.today().isoformat())
+        if start_ms >= end_ms:
+            print(f"✅ {final_path} zaten güncel.")
+            return final_path
+        # Farklı pencereler farklı rastgele noktalar üretsin
+        window = {'start_ms': start_ms, 'span_ms': end_ms - start_ms, 'seed': start_ms // DAY_MS}
+        wait = True
+        description = f'{description}_{start_ms}_{end_ms}'
+        output_path = os.path.join(CHUNK_FOLDER, f'{description}.csv')
+        os.makedirs(CHUNK_FOLDER, exist_ok=True)
+
+    timer = StageTimer('Yangın Olmayan Veri - Aşama Süreleri')
+    with timer.stage('gönderim'):
+        task = export_non_fire_dataset(backend, point_count, description, sampler=sampler,
+                                       **window, **options)
+    print("\n✅ GÖREV BAŞARIYLA GÖNDERİLDİ!")
+
+    if wait:
+        collect_task(backend, task, output_path, timer=timer)
+    elif backend.name == 'ee':
+        print("Task Manager: https://code.earthengine.google.com/tasks")
+
+    if incremental:
+        with timer.stage('ekleme'):
+            added, total = append_dedup(final_path, output_path)
+        print(f"➕ {added} yeni satır eklendi | {final_path}: {total} satır")
+    timer.report()
+    return final_path if wait else None
@@ -0,0 +1,34 @@
+"""
+Statik Katmanlar (Yükseklik, Eğim)
+
+SRTM yüksekliği ve ondan türetilen eğim (derece) ROI için tek bir görüntü olarak
+dışa aktarılır: Earth Engine'de Drive'a GeoTIFF, yerel arka uçta data/exports/<ad>.npz.
+Bu katmanlar tarihe bağlı olmadığından bir kez alınması yeterlidir.
+"""
+from src.export_tasks import poll_tasks
+from src.timing import StageTimer
+
+# --- AYARLAR ---
+EXPORT_NAME = 'Antalya_Statik_Katmanlar'
+
+
+def ingest_static(backend, wait=False, description=EXPORT_NAME):
+    """Dönüş: görev durumu ({'id', 'state', 'description', ...})"""
+    timer = StageTimer('Statik Katmanlar - Aşama Süreleri')
+    print("⛰️ Statik katmanlar (yükseklik, eğim) hazırlanıyor...")
+    with timer.stage('gönderim'):
+        task = backend.export_image(backend.static_layers(), description)
+    status = task.status()
+    print(f"✅ GÖREV BAŞARIYLA GÖNDERİLDİ: {description}")
+
+    if wait:
+        with timer.stage('görev bekleme'):
+            state = poll_tasks(backend, [status['id']])[status['id']]
+        if state != 'COMPLETED':
+            raise RuntimeError(f"Görev başarısız: {description} ({state})")
+        status['state'] = state
+        print(f"📥 Statik katmanlar hazır: {status.get('destination_uris') or 'Google Drive'}")
+    elif backend.name == 'ee':
+        print("Task Manager: https://code.earthengine.google.com/tasks")
+    timer.report()
+    return status
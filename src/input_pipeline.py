@@ -0,0 +1,86 @@
+"""
+tf.data Girdi Boru Hattı
+
+model.fit'e NumPy dizilerini doğrudan vermek yerine tf.data.Dataset kullanılır:
+- cache()    : ilk epoch'tan sonra veri bellekteki tensörlerden okunur
+- shuffle()  : her epoch yeniden karıştırılır (cache'ten SONRA)
+- batch()    : yapılandırılabilir batch boyutu
+- prefetch() : veri hazırlığı ile model hesaplaması örtüşür (AUTOTUNE)
+
+EpochTimer callback'i epoch sürelerini ölçer; benchmark_input_pipelines iki yolu
+(NumPy dizisi / tf.data) aynı model üzerinde karşılaştırır.
+"""
+import time
+
+import numpy as np
+import tensorflow as tf
+
+# --- AYARLAR ---
+BATCH_SIZE = 32
+SHUFFLE_BUFFER = 10_000
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+def make_dataset(X, y, batch_size=BATCH_SIZE, shuffle=True, cache=True, seed=42):
+    """(X, y) dizilerinden (mmap olabilir) eğitim / doğrulama için tf.data.Dataset kurar."""
+    dataset = tf.data.Dataset.from_tensor_slices((np.asarray(X, dtype=np.float32),
+                                                  np.asarray(y, dtype=np.float32)))
+    if cache:
+        dataset = dataset.cache()
+    if shuffle:
+        dataset = dataset.shuffle(min(len(X), SHUFFLE_BUFFER), seed=seed, reshuffle_each_iteration=True)
+    return dataset.batch(batch_size).prefetch(AUTOTUNE)
+
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    """Her epoch'un duvar saati süresini kaydeder."""
+
+    def __init__(self):
+        super().__init__()
+        self.times = []
+
+    def on_train_begin(self, logs=None):
+        self.times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._t0 = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.times.append(time.perf_counter() - self._t0)
+
+    @property
+    def steady_mean(self):
+        """İlk epoch (graf derleme / cache doldurma) hariç ortalama süre."""
+        times = self.times[1:] or self.times
+        return float(np.mean(times)) if times else float('nan')
+
+
+def benchmark_input_pipelines(build_model, X_train, y_train, X_val, y_val,
+                              batch_size=BATCH_SIZE, epochs=3):
+    """
+    Aynı mimariyi iki girdi yoluyla `epochs` epoch eğitir ve epoch sürelerini raporlar.
+    build_model: derlenmiş yeni bir model döndüren fonksiyon
+    """
+    results = {}
+    for name in ['array', 'tfdata']:
+        model = build_model()
+        timer = EpochTimer()
+        if name == 'array':
+            model.fit(X_train, y_train, epochs=epochs, batch_size=batch_size,
+                      validation_data=(X_val, y_val), verbose=0, callbacks=[timer])
+        else:
+            model.fit(make_dataset(X_train, y_train, batch_size), epochs=epochs,
+                      validation_data=make_dataset(X_val, y_val, batch_size, shuffle=False),
+                      verbose=0, callbacks=[timer])
+        results[name] = {'first_epoch': timer.times[0], 'steady_epoch': timer.steady_mean}
+
+    print(f"\n⏱️ Girdi Boru Hattı Karşılaştırması (batch={batch_size}, {epochs} epoch)")
+    print("-" * 55)
+    print(f"{'Yol':<10} | {'1. epoch (sn)':<15} | {'Ortalama epoch (sn)':<20}")
+    print("-" * 55)
+    for name, r in results.items():
+        print(f"{name:<10} | {r['first_epoch']:<15.3f} | {r['steady_epoch']:<20.3f}")
+    speedup = results['array']['steady_epoch'] / results['tfdata']['steady_epoch']
+    print("-" * 55)
+    print(f"⚡ tf.data hızlanma: x{speedup:.2f}")
+    return results
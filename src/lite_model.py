@@ -0,0 +1,222 @@
+"""
+Hafif Çalışma Zamanı (TFLite) Dışa Aktarımı
+
+Her puanlama işinde TensorFlow'u import edip .h5 modeli yüklemek saniyeler sürer ve
+Keras predict çağrısı küçük batch'lerde pahalıdır. Bu modül:
+
+- Modeli ve MinMaxScaler'ı tek bir TFLite grafiğine dönüştürür. Scaler,
+  x * scale_ + min_ olarak bir Rescaling katmanına gömülür; girdi ham
+  [LST, NDVI, elevation] değerleridir.
+- LSTM katmanları unroll=True ile yeniden kurulur (ağırlıklar aynı). Zaman adımı
+  az olduğu için döngü düz matris çarpımlarına açılır ve yalnızca yerleşik TFLite
+  operatörleri kalır (Select TF ops / TensorList gerekmez, batch boyutu değişken kalır).
+- LiteScorer, FireRiskScorer ile aynı arayüzü sunar (score / iter_scores / warmup).
+  Yorumlayıcı ai_edge_litert ya da tflite_runtime varsa oradan, yoksa
+  tensorflow.lite'tan yüklenir. İlk ikisi TensorFlow'u hiç import etmez.
+
+    python -m src.lite_model export
+    python -m src.lite_model benchmark
+"""
+import os
+import json
+import time
+import argparse
+
+import numpy as np
+
+from src.inference import FireRiskScorer, MODEL_PATH, SCALER_PATH, MODEL_CONFIG_PATH, DEFAULT_BATCH_SIZE
+from src.prepared_data import FEATURES
+from src.timing import report_cold_starts
+
+# --- AYARLAR ---
+LITE_MODEL_PATH = 'models/fire_prediction_model.tflite'  # lite_path_for(MODEL_PATH)
+BENCHMARK_BATCHES = [1, 8, 64, 512, 4096]
+TOLERANCE = 1e-4   # Dışa aktarım doğrulaması: Keras ile en büyük mutlak fark
+
+
+def lite_path_for(model_path=MODEL_PATH):
+    """Keras modelinin .tflite dışa aktarımının yolu: models/x.h5 -> models/x.tflite"""
+    return os.path.splitext(model_path)[0] + '.tflite'
+
+
+def metadata_path(lite_path):
+    return f'{lite_path}.json'
+
+
+def _source_hashes(model_path, scaler_path):
+    from src.stage_cache import file_hash
+    return {'model_hash': file_hash(model_path), 'scaler_hash': file_hash(scaler_path)}
+
+
+def is_fresh(lite_path=LITE_MODEL_PATH, model_path=MODEL_PATH, scaler_path=SCALER_PATH):
+    """Dışa aktarım var ve kaynak model / scaler değişmemiş mi?"""
+    if not os.path.exists(lite_path) or not os.path.exists(metadata_path(lite_path)):
+        return False
+    with open(metadata_path(lite_path)) as f:
+        meta = json.load(f)
+    return all(meta.get(k) == v for k, v in _source_hashes(model_path, scaler_path).items())
+
+
+def _interpreter_class():
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+    return Interpreter
+
+
+def export_tflite(model_path=MODEL_PATH, scaler_path=SCALER_PATH, config_path=MODEL_CONFIG_PATH,
+                  output_path=None):
+    """Model + scaler -> .tflite (+ .json metadata). Çıktı Keras ile karşılaştırılarak doğrulanır."""
+    import joblib
+    import tensorflow as tf
+
+    output_path = output_path or lite_path_for(model_path)
+    model = tf.keras.models.load_model(model_path)
+    scaler = joblib.load(scaler_path)
+    steps = model.input_shape[1]
+
+    def unrolled(layer):
+        config = layer.get_config()
+        if isinstance(layer, tf.keras.layers.LSTM):
+            config['unroll'] = True
+        return layer.__class__.from_config(config)
+
+    inference_model = tf.keras.models.clone_model(model, clone_function=unrolled)
+    inference_model.set_weights(model.get_weights())
+
+    # MinMaxScaler: x_scaled = x * scale_ + min_  ->  Rescaling(scale, offset)
+    inputs = tf.keras.Input((steps, len(FEATURES)), name='features')
+    scaled = tf.keras.layers.Rescaling(scale=scaler.scale_.astype(np.float32).tolist(),
+                                       offset=scaler.min_.astype(np.float32).tolist())(inputs)
+    wrapper = tf.keras.Model(inputs, inference_model(scaled))
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(wrapper)
+    flatbuffer = converter.convert()
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(flatbuffer)
+
+    # Doğrulama: aynı ham girdiyle Keras (ayrı scaler) ve TFLite çıktıları
+    rng = np.random.default_rng(0)
+    low, high = scaler.data_min_, scaler.data_max_
+    X = rng.uniform(low, high, size=(256, steps, len(FEATURES))).astype(np.float32)
+    expected = np.asarray(model.predict_on_batch(
+        scaler.transform(X.reshape(-1, len(FEATURES))).reshape(X.shape).astype(np.float32))).ravel()
+    config = {'sequence_steps': steps}
+    if os.path.exists(config_path):
+        with open(config_path) as f:
+            config = {**json.load(f), 'sequence_steps': steps}
+    meta = {**config, **_source_hashes(model_path, scaler_path), 'scaler_folded': True}
+    with open(metadata_path(output_path), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    lite = LiteScorer(output_path)
+    lite.batch_size = len(X)
+    diff = float(np.abs(lite.score(X) - expected).max())
+    if diff > TOLERANCE:
+        os.remove(output_path)
+        os.remove(metadata_path(output_path))
+        raise ValueError(f"TFLite çıktısı Keras'tan farklı (en büyük fark {diff:.2e}); dışa aktarım silindi.")
+
+    print(f"💾 TFLite modeli kaydedildi: {output_path} ({len(flatbuffer) / 1024:.1f} KB, "
+          f"Keras ile en büyük fark {diff:.1e})")
+    return output_path
+
+
+class LiteScorer(FireRiskScorer):
+    """FireRiskScorer arayüzü, TFLite yorumlayıcısı ile. Scaler modele gömülü."""
+
+    def __init__(self, lite_path=LITE_MODEL_PATH):
+        if not os.path.exists(lite_path):
+            raise FileNotFoundError(f"{lite_path} yok. Önce 'python -m src.lite_model export' çalıştırın.")
+        with open(metadata_path(lite_path)) as f:
+            self.config = json.load(f)
+        self.interpreter = _interpreter_class()(model_path=lite_path)
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+        self.allocated_shape = None
+        self.batch_size = DEFAULT_BATCH_SIZE
+
+    def _scale(self, X):
+        return np.ascontiguousarray(X, dtype=np.float32)  # Ölçekleme grafın içinde
+
+    def predict_prepared(self, X_prepared):
+        # Eksik batch tamamlanır: her yeni şekil resize + allocate_tensors demek
+        n = len(X_prepared)
+        if n < self.batch_size:
+            X_prepared = np.concatenate([X_prepared, np.zeros((self.batch_size - n,) + X_prepared.shape[1:],
+                                                              dtype=np.float32)])
+        if X_prepared.shape != self.allocated_shape:
+            self.interpreter.resize_tensor_input(self.input_index, X_prepared.shape)
+            self.interpreter.allocate_tensors()
+            self.allocated_shape = X_prepared.shape
+        self.interpreter.set_tensor(self.input_index, X_prepared)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output_index).reshape(-1)[:n].copy()
+
+
+# Yeni süreçte import + yükleme + ilk tahmin
+_COLD_START_CODE = """
+import numpy as np
+from src.inference import load_scorer
+scorer = load_scorer({runtime!r})
+scorer.batch_size = 1
+scorer.score(np.array([[[14500.0, 4000.0, 300.0]] * scorer.steps], dtype=np.float32))
+"""
+
+
+def batch_latency_ms(scorer, batch_size, steps, repeats=20):
+    """Sabit batch için predict_prepared gecikmesi (medyan, ms)."""
+    rng = np.random.default_rng(0)
+    X = scorer.prepare(rng.uniform([13000, -2000, 0], [16000, 9000, 2500],
+                                   size=(batch_size, steps, len(FEATURES))).astype(np.float32))
+    scorer.batch_size = batch_size
+    scorer.predict_prepared(X)  # Isınma
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        scorer.predict_prepared(X)
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1000
+
+
+def benchmark(batch_sizes=BENCHMARK_BATCHES):
+    from src.inference import load_scorer
+
+    paths = {runtime: _COLD_START_CODE.format(runtime=runtime) for runtime in ['keras', 'tflite']}
+    cold = report_cold_starts(paths, title='Soğuk başlangıç: import + yükleme + ilk tahmin')
+
+    scorers = {'keras': load_scorer('keras'), 'tflite': load_scorer('tflite')}
+    steps = scorers['tflite'].steps
+    print(f"\n📶 Batch gecikmesi (medyan)")
+    print("-" * 55)
+    print(f"{'Batch':<8} | {'Keras (ms)':<12} | {'TFLite (ms)':<12} | {'Hızlanma':<8}")
+    print("-" * 55)
+    rows = []
+    for size in batch_sizes:
+        keras_ms = batch_latency_ms(scorers['keras'], size, steps)
+        lite_ms = batch_latency_ms(scorers['tflite'], size, steps)
+        rows.append({'batch': size, 'keras_ms': keras_ms, 'tflite_ms': lite_ms})
+        print(f"{size:<8} | {keras_ms:<12.3f} | {lite_ms:<12.3f} | x{keras_ms / lite_ms:.1f}")
+    return {'cold_start': cold, 'batches': rows}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LSTM'i TFLite'a aktarır ve Keras ile karşılaştırır.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    export_parser = sub.add_parser('export', help="Model + scaler -> .tflite")
+    export_parser.add_argument('--model', default=MODEL_PATH)
+    export_parser.add_argument('--scaler', default=SCALER_PATH)
+    export_parser.add_argument('--output', default=None,
+                               help="Varsayılan: modelin yanında aynı adla .tflite")
+    sub.add_parser('benchmark', help="Soğuk başlangıç ve batch gecikmesi: Keras vs TFLite")
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        export_tflite(args.model, args.scaler, output_path=args.output)
+    else:
+        benchmark()
@@ -0,0 +1,193 @@
+"""
+Eğitim / Değerlendirme İçin Hazır Veri
+
+train_model.py ve evaluate_models.py'nin ortak kullandığı adımlar. Her adımın
+çıktısı StageCache ile girdi özetlerine göre önbelleğe alınır:
+
+- scale_fit       : MinMaxScaler'ı verinin tamamına uydurur (eğitim)
+- scale_transform : kayıtlı scaler.pkl ile dönüştürür (değerlendirme)
+- split           : eğitim / test indeksleri (train_test_split ile aynı sonuç; strategy ile
+                    mekânsal / zamansal blok bölme, bkz. block_cv.py)
+- sequence_fit / sequence_transform : (n, T, 3) zaman serisi tensörleri (bkz. sequence_builder)
+
+Eğitimde kullanılan indeksler ayrıca models/split_indices.npz olarak saklanır
+(save_split) ve değerlendirme bunları yükler (load_split).
+"""
+import os
+
+import numpy as np
+
+from src.dataset_store import read_arrays
+from src.stage_cache import StageCache, stage_key, path_hash
+
+FEATURES = ['LST', 'NDVI', 'elevation']
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+
+def load_features(data_path):
+    """Sütunlu depodan X (n, 3) ve y (n,) dizilerini okur."""
+    arrays = read_arrays(data_path, FEATURES + ['label'])
+    X = np.column_stack([arrays[c] for c in FEATURES])
+    y = np.asarray(arrays['label'])
+    return X, y
+
+
+def fit_scaled(data_path, cache=None):
+    """
+    Veriyi MinMaxScaler ile 0-1 arasına getirir.
+    Dönüş: {'X_scaled', 'y', 'scaler'}
+    """
+    cache = cache or StageCache()
+    params = {'features': FEATURES, 'scaler': 'MinMaxScaler'}
+
+    def compute():
+        from sklearn.preprocessing import MinMaxScaler
+
+        X, y = load_features(data_path)
+        scaler = MinMaxScaler()
+        return {'X_scaled': scaler.fit_transform(X).astype(np.float32), 'y': y, 'scaler': scaler}
+
+    return cache.get_or_compute('scale_fit', stage_key('scale_fit', [data_path], params), compute)
+
+
+def transform_scaled(data_path, scaler_path, cache=None):
+    """
+    Kayıtlı scaler (scaler_path) ile veriyi dönüştürür.
+    Dönüş: {'X_scaled', 'y'}
+    """
+    import joblib
+
+    cache = cache or StageCache()
+    params = {'features': FEATURES}
+
+    def compute():
+        X, y = load_features(data_path)
+        scaler = joblib.load(scaler_path)
+        return {'X_scaled': scaler.transform(X).astype(np.float32), 'y': y}
+
+    key = stage_key('scale_transform', [data_path, scaler_path], params)
+    return cache.get_or_compute('scale_transform', key, compute)
+
+
+def split_indices(data_path, n_rows, test_size=TEST_SIZE, random_state=RANDOM_STATE, cache=None,
+                  strategy='random', **block_options):
+    """
+    Eğitim / test indeksleri. train_test_split yalnızca satır sayısına bağlı karıştırma
+    yaptığından, dizilerin kendisini bölmekle aynı sonucu verir.
+    strategy: 'random' ya da block_cv.STRATEGIES'ten bir blok stratejisi
+    (block_options: tile_degrees, block_days, buffer).
+    Dönüş: {'train_idx', 'test_idx'}
+    """
+    cache = cache or StageCache()
+    params = {'test_size': test_size, 'random_state': random_state}
+    if strategy != 'random':
+        from src.block_cv import TILE_DEGREES, BLOCK_DAYS, BUFFER
+
+        block_options = {'tile_degrees': TILE_DEGREES, 'block_days': BLOCK_DAYS, 'buffer': BUFFER,
+                         **block_options}
+        params.update(strategy=strategy, **block_options)
+
+    def compute():
+        from sklearn.model_selection import train_test_split
+
+        if strategy != 'random':
+            from src.block_cv import holdout_split
+            return holdout_split(data_path, n_rows, strategy, test_size, random_state, **block_options)
+
+        train_idx, test_idx = train_test_split(np.arange(n_rows), test_size=test_size,
+                                               random_state=random_state)
+        return {'train_idx': train_idx, 'test_idx': test_idx}
+
+    return cache.get_or_compute('split', stage_key('split', [data_path], params), compute)
+
+
+def save_split(path, split, data_path):
+    """
+    Eğitim / test indekslerini modelin yanına kaydeder. Verinin içerik özeti de
+    yazılır; değerlendirme farklı (örn. yeniden sıralanmış) veriyle çalışırsa fark edilir.
+    """
+    np.savez(path, train_idx=np.asarray(split['train_idx']), test_idx=np.asarray(split['test_idx']),
+             data_hash=np.array(path_hash(data_path)))
+    return path
+
+
+def load_split(path, data_path):
+    """
+    Kayıtlı indeksleri yükler. Veri, eğitimdekiyle aynı değilse ValueError verir
+    (aksi halde eğitim satırları test metriklerine sızabilir).
+    """
+    with np.load(path) as saved:
+        if str(saved['data_hash']) != path_hash(data_path):
+            raise ValueError(f"{path} farklı bir veri setiyle oluşturulmuş. "
+                             "Veri değiştiyse modeli yeniden eğitin (src/train_model.py).")
+        return {'train_idx': saved['train_idx'], 'test_idx': saved['test_idx']}
+
+
+def input_fingerprint(data_path, scaler_path=None, split_path=None):
+    """
+    Bir modelin hangi girdilerle eğitildiğini gösteren özetler. Dosya yoksa değer None
+    (örn. scaler kaydedilmemişse). Kayıtlı modelin metadata'sı bununla karşılaştırılır.
+    """
+    def optional_hash(path):
+        return path_hash(path) if path and os.path.exists(path) else None
+
+    return {'data_hash': path_hash(data_path), 'scaler_hash': optional_hash(scaler_path),
+            'split_hash': optional_hash(split_path)}
+
+
+# Zaman serisi anahtarına giren kaynak raster dosyaları (*_series.npy türetilmiş olduğu için hariç)
+RASTER_INPUTS = ['lst.npy', 'lst_dates.npy', 'ndvi.npy', 'ndvi_dates.npy', 'elevation.npy', 'grid.json']
+
+
+def _build_sequences(data_path, raster_folder, steps):
+    from src.sequence_builder import PixelTimeSeries
+
+    arrays = read_arrays(data_path)
+    if 'lon' not in arrays or 'lat' not in arrays:
+        raise ValueError("Veri setinde 'lon' / 'lat' sütunları yok. Zaman serisi için veriyi "
+                         "koordinatlarla yeniden oluşturun (python -m src.ingest fire nonfire).")
+    series = PixelTimeSeries.from_directory(raster_folder)
+    X_seq, valid = series.build(arrays['lon'], arrays['lat'], arrays['ACQ_DATE'], steps)
+    return X_seq, valid, np.asarray(arrays['label'])
+
+
+def _sequence_key(stage, data_path, raster_folder, steps, extra_inputs=()):
+    inputs = [data_path] + [os.path.join(raster_folder, name) for name in RASTER_INPUTS] + list(extra_inputs)
+    return stage_key(stage, inputs, {'steps': steps, 'features': FEATURES})
+
+
+def fit_sequences(data_path, raster_folder, steps, cache=None):
+    """
+    Her nokta için önceki `steps` kompoziti içeren tensörü kurar ve MinMaxScaler'ı
+    (özellik başına, tüm zaman adımları üzerinden) uydurur.
+    Dönüş: {'X_seq' (n, steps, 3), 'y', 'valid', 'scaler'}
+    """
+    cache = cache or StageCache()
+
+    def compute():
+        from sklearn.preprocessing import MinMaxScaler
+
+        X_seq, valid, y = _build_sequences(data_path, raster_folder, steps)
+        scaler = MinMaxScaler().fit(X_seq[valid].reshape(-1, len(FEATURES)))
+        X_seq = scaler.transform(X_seq.reshape(-1, len(FEATURES))).reshape(X_seq.shape).astype(np.float32)
+        return {'X_seq': X_seq, 'y': y, 'valid': valid, 'scaler': scaler}
+
+    key = _sequence_key('sequence_fit', data_path, raster_folder, steps)
+    return cache.get_or_compute('sequence_fit', key, compute)
+
+
+def transform_sequences(data_path, raster_folder, steps, scaler_path, cache=None):
+    """Kayıtlı scaler ile zaman serisi tensörü. Dönüş: {'X_seq', 'y', 'valid'}"""
+    import joblib
+
+    cache = cache or StageCache()
+
+    def compute():
+        X_seq, valid, y = _build_sequences(data_path, raster_folder, steps)
+        scaler = joblib.load(scaler_path)
+        X_seq = scaler.transform(X_seq.reshape(-1, len(FEATURES))).reshape(X_seq.shape).astype(np.float32)
+        return {'X_seq': X_seq, 'y': y, 'valid': valid}
+
+    key = _sequence_key('sequence_transform', data_path, raster_folder, steps, [scaler_path])
+    return cache.get_or_compute('sequence_transform', key, compute)
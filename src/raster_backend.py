@@ -0,0 +1,593 @@
+"""
+Raster Arka Uçları (Backend)
+
+Öznitelik çıkarımı (get_features, add_data, process_fire_image) iki farklı
+arka uç üzerinden çalışabilir:
+
+- EarthEngineBackend: Canlı Google Earth Engine (MODIS, SRTM, FIRMS). Ağ gerekir.
+- LocalRasterBackend: Diske önceden kaydedilmiş GeoTIFF / NumPy dizileri.
+  Ağ gerektirmez; benchmark ve regresyon testleri için kullanılır.
+
+Her iki arka uç da aynı arayüzü sunar. "Koleksiyon" tipi arka uca özeldir:
+Earth Engine için ee.FeatureCollection, yerel arka uç için pandas DataFrame
+(sütunlar: lon, lat, label, ACQ_DATE [+ LST, NDVI, elevation]).
+"""
+import os
+import json
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+# --- AYARLAR ---
+GEE_PROJECT = 'fire-risk-academic'
+ROI_BOUNDS = [29.2, 36.0, 32.5, 37.5]  # [batı, güney, doğu, kuzey]
+SCALE = 1000  # metre
+
+# Dışa aktarılan tablonun sütunları (data_preprocessing.py bu şemayı bekler)
+SELECTORS = ['label', 'LST', 'NDVI', 'elevation', 'ACQ_DATE']
+FEATURES = ['LST', 'NDVI', 'elevation']
+# Dışa aktarmada ayrıca nokta koordinatları yazılır (zaman serisi / harita için gerekli)
+LOCATION_COLUMNS = ['lon', 'lat']
+EXPORT_SELECTORS = SELECTORS + LOCATION_COLUMNS
+# get_features sonrasında noktalardan korunan özellikler (öznitelikler ve lon / lat ayrıca eklenir)
+FEATURE_PROPERTIES = ['label', 'ACQ_DATE']
+
+DAY_MS = 24 * 60 * 60 * 1000
+METERS_PER_DEGREE = 111_320  # Enlem derecesi başına yaklaşık metre
+# Kompozit pencereleri (gün): [tarih + başlangıç, tarih + bitiş)
+LST_WINDOW = (-10, 2)
+NDVI_WINDOW = (-16, 2)
+
+# Negatif örnekler için varsayılan tarih aralığı (2021 Temmuz-Ağustos)
+# 1625097600000 = 1 Temmuz 2021, 5270400000 = ~2 aylık milisaniye
+RANDOM_START_MS = 1625097600000
+RANDOM_SPAN_MS = 5270400000
+
+LOCAL_RASTER_FOLDER = os.path.join('data', 'rasters')
+LOCAL_EXPORT_FOLDER = os.path.join('data', 'exports')
+
+
+class RasterBackend:
+    """Tüm arka uçların uyması gereken ortak arayüz."""
+
+    name = 'base'
+
+    def fire_points(self, start_date, end_date):
+        """FIRMS tespitlerini label=1 ve ACQ_DATE (ms) ile nokta koleksiyonu olarak döndürür."""
+        raise NotImplementedError
+
+    def process_fire_image(self, image):
+        """Tek bir FIRMS görüntüsünü 1 km çözünürlükte nokta koleksiyonuna çevirir."""
+        raise NotImplementedError
+
+    def random_points(self, count, seed=0):
+        """ROI içinde rastgele nokta koleksiyonu üretir."""
+        raise NotImplementedError
+
+    def add_data(self, points, start_ms=RANDOM_START_MS, span_ms=RANDOM_SPAN_MS):
+        """Noktalara rastgele tarih, label=0 ve uydu özniteliklerini ekler."""
+        raise NotImplementedError
+
+    def get_features(self, points, properties=FEATURE_PROPERTIES):
+        """
+        Noktalara ACQ_DATE'e göre LST, NDVI ve yükseklik değerlerini ekler.
+        properties: çıktıda korunacak nokta sütunları (ör. kova istatistikleri)
+        """
+        raise NotImplementedError
+
+    def drop_nulls(self, points):
+        """LST, NDVI veya yüksekliği boş olan satırları atar."""
+        raise NotImplementedError
+
+    def static_layers(self):
+        """Zamana bağlı olmayan katmanlar: yükseklik (m) ve eğim (derece)."""
+        raise NotImplementedError
+
+    def export_image(self, image, description):
+        """static_layers() çıktısını dışa aktarır ve başlatılmış görevi döndürür."""
+        raise NotImplementedError
+
+    def export_table(self, points, description, selectors=EXPORT_SELECTORS):
+        """Koleksiyonu tablo olarak dışa aktarır ve başlatılmış görevi döndürür."""
+        raise NotImplementedError
+
+    def task_state(self, task_id):
+        """Daha önce başlatılmış bir dışa aktarma görevinin durumunu döndürür (örn. 'COMPLETED')."""
+        raise NotImplementedError
+
+    def fetch_table(self, description, destination):
+        """Tamamlanmış dışa aktarmanın CSV'sini destination yoluna indirir."""
+        raise NotImplementedError
+
+
+# ---------------------------------------------------------
+# A) GOOGLE EARTH ENGINE
+# ---------------------------------------------------------
+class EarthEngineBackend(RasterBackend):
+    """
+    Canlı Earth Engine arka ucu. `ee` modülü ve kimlik doğrulama yalnızca
+    ilk kullanımda yüklenir; modül import edildiğinde ağ çağrısı yapılmaz.
+    """
+
+    name = 'ee'
+    # Aynı istemciyi paylaşan iş parçacıkları Initialize'ı yalnızca bir kez çağırsın
+    _init_lock = threading.Lock()
+
+    def __init__(self, project=GEE_PROJECT, roi_bounds=ROI_BOUNDS):
+        self.project = project
+        self.roi_bounds = roi_bounds
+        self._ee = None
+
+    @property
+    def ee(self):
+        if self._ee is not None:
+            return self._ee
+        with self._init_lock:
+            if self._ee is not None:
+                return self._ee
+            import ee
+
+            print("🔄 Google Earth Engine bağlantısı kontrol ediliyor...")
+            try:
+                ee.Initialize(project=self.project)
+                print("✅ Bağlantı Başarılı!")
+            except Exception:
+                print("⚠️ Yetki yenileniyor...")
+                ee.Authenticate()
+                ee.Initialize(project=self.project)
+            self._ee = ee
+        return self._ee
+
+    @property
+    def roi(self):
+        return self.ee.Geometry.Rectangle(self.roi_bounds)
+
+    def build_composite(self, date):
+        """
+        Verilen tarih için LST, NDVI ve yükseklik bantlarından oluşan görüntü yığınını kurar.
+        Pencere: LST için [tarih-10, tarih+2) gün, NDVI için [tarih-16, tarih+2) gün.
+        """
+        ee = self.ee
+
+        # a) Sıcaklık (LST)
+        lst = ee.ImageCollection('MODIS/006/MOD11A2') \
+            .filterDate(date.advance(LST_WINDOW[0], 'day'), date.advance(LST_WINDOW[1], 'day')) \
+            .mean().select(['LST_Day_1km'], ['LST'])
+
+        # b) Bitki Örtüsü (NDVI)
+        ndvi = ee.ImageCollection('MODIS/006/MOD13A1') \
+            .filterDate(date.advance(NDVI_WINDOW[0], 'day'), date.advance(NDVI_WINDOW[1], 'day')) \
+            .mean().select(['NDVI'])
+
+        # c) Yükseklik - SRTM
+        srtm = ee.Image('USGS/SRTMGL1_003').select(['elevation'])
+
+        return lst.addBands(ndvi).addBands(srtm)
+
+    def process_fire_image(self, img):
+        # Görüntünün tarihini al
+        img_date = img.date()
+
+        # Vektöre çevir (toInt ve select(0) hatayı önler)
+        vectors = img.select(0).toInt().reduceToVectors(
+            geometry=self.roi,
+            scale=SCALE,
+            geometryType='centroid',
+            labelProperty='label'
+        )
+
+        # KİLİT NOKTA: Tarihi (ACQ_DATE) her bir noktaya elle ekle
+        return vectors.map(lambda f: f.set('ACQ_DATE', img_date.millis()))
+
+    def fire_points(self, start_date, end_date):
+        fire_collection = self.ee.ImageCollection('FIRMS') \
+            .filterDate(start_date, end_date) \
+            .filterBounds(self.roi)
+
+        # map() ile her görüntüye uygula ve flatten() ile tek listeye indir
+        dataset = fire_collection.map(self.process_fire_image).flatten()
+
+        # Etiketle: 1 = Yangın
+        return dataset.map(lambda f: f.set('label', 1))
+
+    def random_points(self, count, seed=0):
+        # randomPoints ile noktaları oluştur, sonra her birine bir 'random' sütunu ekle
+        points = self.ee.FeatureCollection.randomPoints(self.roi, count, seed)
+        return points.randomColumn('random_val', seed)
+
+    def add_data(self, points, start_ms=RANDOM_START_MS, span_ms=RANDOM_SPAN_MS):
+        ee = self.ee
+
+        def assign_date(feature):
+            rand_val = ee.Number(feature.get('random_val'))
+            random_time = ee.Number(start_ms).add(rand_val.multiply(span_ms).toInt())
+            return feature.set('label', 0).set('ACQ_DATE', random_time)
+
+        return self.get_features(points.map(assign_date))
+
+    def get_features(self, points, properties=FEATURE_PROPERTIES):
+        """
+        Noktaları ACQ_DATE'e göre gruplar. Her benzersiz tarih (yani tarih penceresi) için
+        kompozit yalnızca BİR kez kurulur ve o güne ait tüm noktalar tek bir
+        sampleRegions çağrısıyla örneklenir.
+        """
+        ee = self.ee
+
+        # Benzersiz tarihler -> kompozit önbelleğinin anahtarları
+        unique_dates = points.aggregate_array('ACQ_DATE').distinct()
+        days = ee.FeatureCollection(unique_dates.map(lambda d: ee.Feature(None, {'ACQ_DATE': d})))
+
+        def sample_day(day):
+            acq_date = day.get('ACQ_DATE')
+            day_points = points.filter(ee.Filter.eq('ACQ_DATE', acq_date))
+            # sampleRegions maskeli (boş) pikselleri zaten atar
+            return self.build_composite(ee.Date(acq_date)).sampleRegions(
+                collection=day_points,
+                properties=list(properties),
+                scale=SCALE,
+                geometries=True
+            )
+
+        def add_coordinates(feature):
+            coords = feature.geometry().coordinates()
+            return feature.set({'lon': coords.get(0), 'lat': coords.get(1)})
+
+        return days.map(sample_day).flatten().map(add_coordinates)
+
+    def drop_nulls(self, points):
+        return points.filter(self.ee.Filter.notNull(FEATURES))
+
+    def static_layers(self):
+        elevation = self.ee.Image('USGS/SRTMGL1_003').select('elevation').clip(self.roi)
+        slope = self.ee.Terrain.slope(elevation)
+        return elevation.addBands(slope).toFloat()
+
+    def export_image(self, image, description):
+        task = self.ee.batch.Export.image.toDrive(
+            image=image,
+            description=description,
+            region=self.roi,
+            scale=SCALE,
+            fileFormat='GeoTIFF',
+            maxPixels=1e10
+        )
+        task.start()
+        return task
+
+    def export_table(self, points, description, selectors=EXPORT_SELECTORS):
+        task = self.ee.batch.Export.table.toDrive(
+            collection=points,
+            description=description,
+            fileFormat='CSV',
+            selectors=selectors
+        )
+        task.start()
+        return task
+
+    def task_state(self, task_id):
+        return self.ee.data.getTaskStatus(task_id)[0]['state']
+
+    def fetch_table(self, description, destination):
+        """
+        Export.table.toDrive çıktısını Google Drive API ile indirir.
+        google-api-python-client ve google-auth, earthengine-api ile birlikte gelir.
+        """
+        import io
+        import google.auth
+        from googleapiclient.discovery import build
+        from googleapiclient.http import MediaIoBaseDownload
+
+        credentials, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/drive.readonly'])
+        drive = build('drive', 'v3', credentials=credentials, cache_discovery=False)
+
+        # Aynı isimde birden fazla dosya varsa en yenisi alınır
+        result = drive.files().list(
+            q=f"name = '{description}.csv' and trashed = false",
+            orderBy='modifiedTime desc',
+            fields='files(id, name)',
+            pageSize=1
+        ).execute()
+        files = result.get('files', [])
+        if not files:
+            raise FileNotFoundError(f"Drive'da bulunamadı: {description}.csv")
+
+        request = drive.files().get_media(fileId=files[0]['id'])
+        with io.FileIO(destination, 'wb') as f:
+            downloader = MediaIoBaseDownload(f, request)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+        return destination
+
+
+# ---------------------------------------------------------
+# B) YEREL RASTER (GeoTIFF / NumPy)
+# ---------------------------------------------------------
+class LocalExportTask:
+    """Yerel dışa aktarma görevi. ee.batch.Task ile aynı status() şeklini taklit eder."""
+
+    def __init__(self, description, path):
+        self.description = description
+        self.path = path
+        self.state = 'READY'
+
+    def start(self):
+        self.state = 'COMPLETED'
+
+    def status(self):
+        return {'id': self.path, 'state': self.state, 'description': self.description,
+                'destination_uris': [self.path]}
+
+
+class LocalRasterBackend(RasterBackend):
+    """
+    Yerel raster yığınları üzerinde çalışan arka uç.
+
+    Tüm rasterlar kuzey-yukarı (north-up) aynı ızgaradadır:
+    piksel (satır, sütun) merkezi = (north - (satır + 0.5) * pixel_size, west + (sütun + 0.5) * pixel_size)
+
+    lst, ndvi, fire : (T, H, W) diziler, tarihleri *_dates (ms) dizilerinde
+    elevation       : (H, W) dizi
+    landcover       : isteğe bağlı (H, W) arazi örtüsü sınıfları (örn. MODIS MCD12Q1 LC_Type1)
+    Boş (maskeli) pikseller NaN olarak saklanır.
+    """
+
+    name = 'local'
+
+    def __init__(self, lst, lst_dates, ndvi, ndvi_dates, elevation, fire=None, fire_dates=None,
+                 west=ROI_BOUNDS[0], north=ROI_BOUNDS[3], pixel_size=0.01,
+                 roi_bounds=ROI_BOUNDS, export_folder=LOCAL_EXPORT_FOLDER, landcover=None):
+        self.lst = lst
+        self.lst_dates = np.asarray(lst_dates, dtype=np.int64)
+        self.ndvi = ndvi
+        self.ndvi_dates = np.asarray(ndvi_dates, dtype=np.int64)
+        self.elevation = elevation
+        self.fire = fire
+        self.fire_dates = None if fire_dates is None else np.asarray(fire_dates, dtype=np.int64)
+        self.landcover = landcover
+        self.west = west
+        self.north = north
+        self.pixel_size = pixel_size
+        self.roi_bounds = roi_bounds
+        self.export_folder = export_folder
+        # Kompozit önbelleği: (pencere başı ms, pencere sonu ms) -> (H, W) ortalama
+        self._composite_cache = {}
+
+    @property
+    def shape(self):
+        return self.elevation.shape
+
+    # --- Yükleme / Kaydetme ---
+    @classmethod
+    def from_directory(cls, folder=LOCAL_RASTER_FOLDER, **kwargs):
+        """
+        Klasördeki .npy dizilerini bellek eşlemeli (mmap) olarak yükler.
+        Beklenen dosyalar: lst.npy, lst_dates.npy, ndvi.npy, ndvi_dates.npy, elevation.npy,
+        grid.json (west, north, pixel_size) ve isteğe bağlı fire.npy, fire_dates.npy, landcover.npy
+        """
+        def load(name, required=True):
+            path = os.path.join(folder, f'{name}.npy')
+            if not os.path.exists(path):
+                if required:
+                    raise FileNotFoundError(f"Raster dosyası bulunamadı: {path}")
+                return None
+            return np.load(path, mmap_mode='r')
+
+        with open(os.path.join(folder, 'grid.json')) as f:
+            grid = json.load(f)
+
+        return cls(
+            lst=load('lst'), lst_dates=load('lst_dates'),
+            ndvi=load('ndvi'), ndvi_dates=load('ndvi_dates'),
+            elevation=load('elevation'),
+            fire=load('fire', required=False), fire_dates=load('fire_dates', required=False),
+            landcover=load('landcover', required=False),
+            west=grid['west'], north=grid['north'], pixel_size=grid['pixel_size'],
+            **kwargs
+        )
+
+    @classmethod
+    def from_geotiff(cls, lst_path, ndvi_path, elevation_path, fire_path=None, **kwargs):
+        """
+        GeoTIFF dosyalarından yükler (rasterio gerekir). Çok bantlı dosyalarda her bandın
+        açıklaması (description) görüntü tarihidir, örn. '2021-07-04' (GEE toBands çıktısı gibi).
+        """
+        try:
+            import rasterio
+        except ImportError:
+            raise ImportError("GeoTIFF okumak için 'rasterio' kurulu olmalı: pip install rasterio")
+
+        def read(path):
+            with rasterio.open(path) as src:
+                data = src.read(masked=True).astype(np.float32).filled(np.nan)
+                dates = pd.to_datetime(list(src.descriptions), errors='coerce')
+                dates_ms = (dates.asi8 // 1_000_000) if len(dates) else np.array([], dtype=np.int64)
+                return data, dates_ms, src.transform
+
+        lst, lst_dates, transform = read(lst_path)
+        ndvi, ndvi_dates, _ = read(ndvi_path)
+        elevation, _, _ = read(elevation_path)
+        fire, fire_dates = (None, None)
+        if fire_path is not None:
+            fire, fire_dates, _ = read(fire_path)
+
+        return cls(
+            lst=lst, lst_dates=lst_dates, ndvi=ndvi, ndvi_dates=ndvi_dates,
+            elevation=elevation[0], fire=fire, fire_dates=fire_dates,
+            west=transform.c, north=transform.f, pixel_size=transform.a,
+            **kwargs
+        )
+
+    def save(self, folder=LOCAL_RASTER_FOLDER):
+        """Rasterları from_directory() ile tekrar okunabilecek şekilde .npy olarak kaydeder."""
+        os.makedirs(folder, exist_ok=True)
+        arrays = {
+            'lst': self.lst, 'lst_dates': self.lst_dates,
+            'ndvi': self.ndvi, 'ndvi_dates': self.ndvi_dates,
+            'elevation': self.elevation,
+        }
+        if self.fire is not None:
+            arrays['fire'] = self.fire
+            arrays['fire_dates'] = self.fire_dates
+        if self.landcover is not None:
+            arrays['landcover'] = self.landcover
+        for name, arr in arrays.items():
+            np.save(os.path.join(folder, f'{name}.npy'), np.asarray(arr))
+        with open(os.path.join(folder, 'grid.json'), 'w') as f:
+            json.dump({'west': self.west, 'north': self.north, 'pixel_size': self.pixel_size}, f)
+
+    # --- Izgara yardımcıları ---
+    def pixel_index(self, lon, lat):
+        """Koordinatları (satır, sütun) indekslerine çevirir. ROI dışı için -1 döner."""
+        h, w = self.shape
+        col = np.floor((np.asarray(lon, dtype=np.float64) - self.west) / self.pixel_size).astype(np.int64)
+        row = np.floor((self.north - np.asarray(lat, dtype=np.float64)) / self.pixel_size).astype(np.int64)
+        outside = (row < 0) | (row >= h) | (col < 0) | (col >= w)
+        row[outside] = -1
+        col[outside] = -1
+        return row, col
+
+    def pixel_center(self, row, col):
+        lon = self.west + (np.asarray(col) + 0.5) * self.pixel_size
+        lat = self.north - (np.asarray(row) + 0.5) * self.pixel_size
+        return lon, lat
+
+    def composite(self, stack, stack_dates, start_ms, end_ms):
+        """[start_ms, end_ms) penceresindeki görüntülerin piksel bazlı ortalaması (önbellekli)."""
+        key = (id(stack), int(start_ms), int(end_ms))
+        if key not in self._composite_cache:
+            selected = (stack_dates >= start_ms) & (stack_dates < end_ms)
+            if selected.any():
+                frames = np.asarray(stack[np.flatnonzero(selected)], dtype=np.float32)
+                with np.errstate(invalid='ignore'):
+                    # Tüm görüntülerde boş olan pikseller NaN kalır (ee mean() davranışı)
+                    counts = np.sum(~np.isnan(frames), axis=0)
+                    totals = np.nansum(frames, axis=0)
+                    mean = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+            else:
+                mean = np.full(self.shape, np.nan, dtype=np.float32)
+            self._composite_cache[key] = mean.astype(np.float32)
+        return self._composite_cache[key]
+
+    # --- Arayüz ---
+    def process_fire_image(self, image):
+        """
+        image: fire yığınındaki görüntünün indeksi. Yangın pikselleri (>0) piksel
+        merkezine (centroid) çevrilir. GEE reduceToVectors'tan farklı olarak aynı
+        değerli komşu pikseller birleştirilmez; FIRMS T21 değerleri pikselden piksele
+        değiştiği için pratikte sonuç aynıdır.
+        """
+        frame = np.asarray(self.fire[image])
+        rows, cols = np.nonzero(np.nan_to_num(frame) > 0)
+        lon, lat = self.pixel_center(rows, cols)
+        return pd.DataFrame({
+            'lon': lon,
+            'lat': lat,
+            'label': frame[rows, cols].astype(np.int64),
+            'ACQ_DATE': np.full(len(rows), self.fire_dates[image], dtype=np.int64),
+            # T21 parlaklık sıcaklığı (K): kovalama istatistikleri için (ingest/binning.py)
+            'brightness': frame[rows, cols].astype(np.float32),
+        })
+
+    def fire_points(self, start_date, end_date):
+        if self.fire is None:
+            raise ValueError("Yerel arka uçta FIRMS (fire) rasterı yok.")
+        start_ms = pd.Timestamp(start_date).value // 1_000_000
+        end_ms = pd.Timestamp(end_date).value // 1_000_000
+        images = np.flatnonzero((self.fire_dates >= start_ms) & (self.fire_dates < end_ms))
+
+        frames = [self.process_fire_image(i) for i in images]
+        if not frames:
+            return pd.DataFrame(columns=['lon', 'lat', 'label', 'ACQ_DATE'])
+        dataset = pd.concat(frames, ignore_index=True)
+        west, south, east, north = self.roi_bounds
+        inside = dataset['lon'].between(west, east) & dataset['lat'].between(south, north)
+        dataset = dataset[inside].reset_index(drop=True)
+
+        # Etiketle: 1 = Yangın
+        dataset['label'] = 1
+        return dataset
+
+    def random_points(self, count, seed=0):
+        rng = np.random.default_rng(seed)
+        west, south, east, north = self.roi_bounds
+        return pd.DataFrame({
+            'lon': rng.uniform(west, east, count),
+            'lat': rng.uniform(south, north, count),
+            'random_val': rng.random(count),
+        })
+
+    def add_data(self, points, start_ms=RANDOM_START_MS, span_ms=RANDOM_SPAN_MS):
+        points = points.copy()
+        points['ACQ_DATE'] = start_ms + (points['random_val'].to_numpy() * span_ms).astype(np.int64)
+        points['label'] = 0
+        return self.get_features(points)
+
+    def get_features(self, points, properties=FEATURE_PROPERTIES):
+        # Vektörel örnekleyici (bkz. src/point_sampler.py); tablo tüm sütunlarını zaten korur
+        from src.point_sampler import sample_points
+
+        sampled = sample_points(
+            self,
+            points['lon'].to_numpy(),
+            points['lat'].to_numpy(),
+            points['ACQ_DATE'].to_numpy(dtype=np.int64),
+            label=points['label'].to_numpy(),
+        )
+        points = points.copy()
+        for column in FEATURES:
+            points[column] = sampled[column].to_numpy()
+        return points
+
+    def drop_nulls(self, points):
+        points = points.dropna(subset=FEATURES).reset_index(drop=True)
+        # SRTM yüksekliği tam sayı metredir (GEE CSV çıktısıyla aynı tip)
+        points['elevation'] = np.round(points['elevation']).astype(np.int64)
+        return points
+
+    def static_layers(self):
+        elevation = np.asarray(self.elevation, dtype=np.float32)
+        # Izgara derece cinsinden: piksel kenarı metreye çevrilir (boylam enleme göre daralır)
+        _, lat = self.pixel_center(np.arange(self.shape[0]), 0)
+        dy = self.pixel_size * METERS_PER_DEGREE
+        dx = dy * np.cos(np.radians(lat))[:, None]
+        grad_row, grad_col = np.gradient(elevation)
+        slope = np.degrees(np.arctan(np.hypot(grad_row / dy, grad_col / dx)))
+        return {'elevation': elevation, 'slope': slope.astype(np.float32)}
+
+    def export_image(self, image, description):
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, f'{description}.npz')
+        np.savez(path, **image)
+        task = LocalExportTask(description, path)
+        task.start()
+        return task
+
+    def export_table(self, points, description, selectors=EXPORT_SELECTORS):
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, f'{description}.csv')
+        points[selectors].to_csv(path, index=False)
+        task = LocalExportTask(description, path)
+        task.start()
+        return task
+
+    def task_state(self, task_id):
+        # Yerel görevler eşzamanlı çalışır; görev kimliği çıktı dosyasının yoludur
+        return 'COMPLETED' if os.path.exists(task_id) else 'FAILED'
+
+    def fetch_table(self, description, destination):
+        source = os.path.join(self.export_folder, f'{description}.csv')
+        if os.path.abspath(source) != os.path.abspath(destination):
+            shutil.copyfile(source, destination)
+        return destination
+
+
+def get_backend(name='ee', raster_folder=LOCAL_RASTER_FOLDER, **kwargs):
+    """İsimden arka uç oluşturur: 'ee' (Earth Engine) veya 'local' (yerel rasterlar)."""
+    if name == 'ee':
+        return EarthEngineBackend(**kwargs)
+    if name == 'local':
+        return LocalRasterBackend.from_directory(raster_folder, **kwargs)
+    raise ValueError(f"Bilinmeyen arka uç: {name} (geçerli: 'ee', 'local')")
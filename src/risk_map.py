@@ -0,0 +1,202 @@
+"""
+Bölgesel Yangın Riski Haritası (Wall-to-Wall)
+
+Modeli yalnızca örneklenmiş noktalarda değil, ROI'nin ([29.2, 36.0, 32.5, 37.5])
+tüm ~1 km'lik ızgarasında puanlar:
+
+1. Yerel rasterlar (LST / NDVI / SRTM, bkz. LocalRasterBackend) TILE_SIZE x TILE_SIZE
+   piksellik karolara bölünür.
+2. Her karo için eğitimdeki nokta öznitelikleriyle aynı tanım kullanılır:
+   tarih çevresindeki LST / NDVI pencere ortalamaları + yükseklik (point_sampler.window_mean),
+   model zaman serisiyle eğitildiyse (n, T, 3) geçmiş tensörü (sequence_builder).
+3. Karolar işçi süreçlerde puanlanır; her işçi modeli bir kez yükler.
+4. Çıktı: .npy (float32, NaN = veri yok) + yanında ızgara bilgisi (.json), ya da
+   .tif uzantısıyla GeoTIFF (rasterio gerekir).
+
+    python -m src.risk_map --date 2021-08-01 --output results/risk_2021-08-01.tif
+"""
+import os
+import json
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.raster_backend import LocalRasterBackend, LOCAL_RASTER_FOLDER, LST_WINDOW, NDVI_WINDOW
+from src.point_sampler import window_mean
+from src.inference import MODEL_PATH, SCALER_PATH, MODEL_CONFIG_PATH
+from src.timing import StageTimer
+
+# --- AYARLAR ---
+RESULTS_FOLDER = 'results'
+TILE_SIZE = 128          # Karo kenarı (piksel); 128 x 128 = 16384 satır
+BATCH_SIZE = 4096
+NODATA = np.nan
+
+# İşçi süreç durumu (initializer ile bir kez doldurulur)
+_WORKER = {}
+
+
+def date_to_ms(date):
+    """'YYYY-MM-DD' -> epoch milisaniye (ACQ_DATE ile aynı birim)."""
+    return int(pd.Timestamp(date).value // 1_000_000)
+
+
+def make_tiles(shape, tile_size=TILE_SIZE):
+    """(satır başı, satır sonu, sütun başı, sütun sonu) listesi."""
+    h, w = shape
+    return [(r0, min(r0 + tile_size, h), c0, min(c0 + tile_size, w))
+            for r0 in range(0, h, tile_size) for c0 in range(0, w, tile_size)]
+
+
+def tile_features(backend, tile, date_ms, steps=1, series=None):
+    """
+    Karodaki her piksel için model girdisi.
+    Dönüş: (X, valid) -> X (n, 3) ya da (n, steps, 3), valid (n,) bool
+    """
+    r0, r1, c0, c1 = tile
+    rows, cols = np.meshgrid(np.arange(r0, r1), np.arange(c0, c1), indexing='ij')
+    rows, cols = rows.ravel(), cols.ravel()
+    dates = np.full(len(rows), date_ms, dtype=np.int64)
+
+    if steps > 1:
+        lon, lat = backend.pixel_center(rows, cols)
+        return series.build(lon, lat, dates, steps)
+
+    X = np.column_stack([
+        window_mean(backend.lst, backend.lst_dates, rows, cols, dates, LST_WINDOW),
+        window_mean(backend.ndvi, backend.ndvi_dates, rows, cols, dates, NDVI_WINDOW),
+        np.asarray(backend.elevation[r0:r1, c0:c1], dtype=np.float64).ravel(),
+    ]).astype(np.float32)
+    return X, ~np.isnan(X).any(axis=1)
+
+
+def _init_worker(raster_folder, model_path, scaler_path, config_path, threads, runtime='auto'):
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(threads)
+
+    from src.inference import load_scorer, resolve_runtime
+    runtime = resolve_runtime(runtime, model_path, scaler_path)
+    if runtime == 'keras':
+        # TF iş parçacığı ayarları model yüklenmeden (TF çalışma zamanı başlamadan) yapılmalı
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    scorer = load_scorer(runtime, model_path, scaler_path, config_path)
+    scorer.batch_size = BATCH_SIZE
+    scorer.warmup()
+    backend = LocalRasterBackend.from_directory(raster_folder)
+    series = None
+    if scorer.steps > 1:
+        from src.sequence_builder import PixelTimeSeries
+        series = PixelTimeSeries(backend, folder=raster_folder)
+    _WORKER.update(scorer=scorer, backend=backend, series=series)
+
+
+def score_tile(tile, date_ms):
+    """Tek karo (işçide): öznitelikler -> olasılık. Geçersiz pikseller NaN."""
+    scorer, backend = _WORKER['scorer'], _WORKER['backend']
+    X, valid = tile_features(backend, tile, date_ms, scorer.steps, _WORKER['series'])
+    risk = np.full(len(valid), NODATA, dtype=np.float32)
+    if valid.any():
+        risk[valid] = scorer.score(X[valid])
+    r0, r1, c0, c1 = tile
+    return tile, risk.reshape(r1 - r0, c1 - c0)
+
+
+def write_risk_map(risk, backend, path, date):
+    """.tif -> GeoTIFF (rasterio), diğer -> .npy + ızgara bilgisi (.json)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if path.endswith(('.tif', '.tiff')):
+        try:
+            import rasterio
+            from rasterio.transform import from_origin
+        except ImportError:
+            raise ImportError("GeoTIFF yazmak için 'rasterio' kurulu olmalı: pip install rasterio "
+                              "(ya da .npy uzantılı çıktı verin)")
+        h, w = risk.shape
+        with rasterio.open(path, 'w', driver='GTiff', height=h, width=w, count=1, dtype='float32',
+                           crs='EPSG:4326', nodata=np.nan, compress='deflate',
+                           transform=from_origin(backend.west, backend.north,
+                                                 backend.pixel_size, backend.pixel_size)) as dst:
+            dst.write(risk, 1)
+            dst.set_band_description(1, f'fire_risk {date}')
+    else:
+        np.save(path, risk)
+        with open(f'{os.path.splitext(path)[0]}.json', 'w') as f:
+            json.dump({'west': backend.west, 'north': backend.north, 'pixel_size': backend.pixel_size,
+                       'date': date, 'nodata': 'NaN'}, f, indent=2)
+    return path
+
+
+def generate_risk_map(date=None, output_path=None, raster_folder=LOCAL_RASTER_FOLDER,
+                      max_workers=None, tile_size=TILE_SIZE, model_path=MODEL_PATH,
+                      scaler_path=SCALER_PATH, config_path=MODEL_CONFIG_PATH, runtime='auto'):
+    timer = StageTimer('Risk Haritası Süreleri')
+    print("🗺️ Bölgesel risk haritası oluşturuluyor...")
+
+    with timer.stage('rasterları açma'):
+        backend = LocalRasterBackend.from_directory(raster_folder)
+        if date is None:
+            date = pd.to_datetime(int(backend.lst_dates.max()), unit='ms').strftime('%Y-%m-%d')
+        date_ms = date_to_ms(date)
+        output_path = output_path or os.path.join(RESULTS_FOLDER, f'risk_map_{date}.npy')
+
+        config = {'sequence_steps': 1}
+        if os.path.exists(config_path):
+            with open(config_path) as f:
+                config = json.load(f)
+        if config['sequence_steps'] > 1:
+            # Piksel zaman serisi indeksi işçilerden önce bir kez kurulur (eşzamanlı yazım olmasın)
+            from src.sequence_builder import PixelTimeSeries
+            PixelTimeSeries(backend, folder=raster_folder)
+
+    tiles = make_tiles(backend.shape, tile_size)
+    cpus = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers or cpus, len(tiles)))
+    threads = max(1, cpus // max_workers)
+    h, w = backend.shape
+    print(f"🧩 {h} x {w} piksel ({h * w:,}), {len(tiles)} karo, {max_workers} işçi | tarih: {date}")
+
+    risk = np.full(backend.shape, NODATA, dtype=np.float32)
+    initargs = (raster_folder, model_path, scaler_path, config_path, threads, runtime)
+    with timer.stage('karoları puanlama'):
+        if max_workers == 1:
+            _init_worker(*initargs)
+            results = (score_tile(tile, date_ms) for tile in tiles)
+            for (r0, r1, c0, c1), tile_risk in results:
+                risk[r0:r1, c0:c1] = tile_risk
+        else:
+            # spawn: TensorFlow fork sonrası güvenli değil
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                     initializer=_init_worker, initargs=initargs) as pool:
+                for (r0, r1, c0, c1), tile_risk in pool.map(score_tile, tiles, [date_ms] * len(tiles)):
+                    risk[r0:r1, c0:c1] = tile_risk
+
+    with timer.stage('yazma'):
+        write_risk_map(risk, backend, output_path, date)
+
+    scored = int(np.sum(~np.isnan(risk)))
+    print(f"✅ {scored:,} piksel puanlandı (ortalama risk: {np.nanmean(risk) if scored else float('nan'):.3f})")
+    print(f"💾 Risk haritası: {output_path}")
+    timer.report()
+    return risk
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ROI genelinde piksel bazlı yangın riski haritası üretir.")
+    parser.add_argument('--date', default=None, help="YYYY-MM-DD (varsayılan: en son LST tarihi)")
+    parser.add_argument('--output', default=None,
+                        help="Çıktı: .npy (varsayılan results/risk_map_<tarih>.npy) ya da .tif")
+    parser.add_argument('--raster-folder', default=LOCAL_RASTER_FOLDER)
+    parser.add_argument('--workers', type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--tile-size', type=int, default=TILE_SIZE)
+    parser.add_argument('--runtime', choices=['auto', 'keras', 'tflite'], default='auto',
+                        help="auto: güncel .tflite varsa onu kullan (bkz. src/lite_model.py)")
+    args = parser.parse_args()
+    generate_risk_map(date=args.date, output_path=args.output, raster_folder=args.raster_folder,
+                      max_workers=args.workers, tile_size=args.tile_size, runtime=args.runtime)
@@ -0,0 +1,435 @@
+"""
+Düşük Gecikmeli HTTP Puanlama Servisi
+
+"Bugün lon/lat noktasında yangın riski nedir?" sorgularını yanıtlar. Model ve scaler
+bir kez yüklenir ve sıcak tutulur; eşzamanlı istekler gecikme bütçesi (MAX_WAIT_MS)
+içinde mikro batch'lerde birleştirilir (tek tek predict çağrısı yerine tek çağrı).
+
+Uç noktalar (yalnızca standart kütüphane, http.server):
+    GET  /score?lon=30.7&lat=36.9[&date=2021-08-01]
+    POST /score   {"points": [{"lon": 30.7, "lat": 36.9, "date": "2021-08-01"}, ...]}
+                  ya da {"features": [[LST, NDVI, elevation], ...]}
+    GET  /metrics p50 / p99 gecikme, istek ve satır/sn sayaçları, batch boyutları
+    GET  /health
+
+    python -m src.scoring_service serve --port 8080
+    python -m src.scoring_service loadtest --url http://127.0.0.1:8080 --concurrency 32 --requests 2000
+"""
+import json
+import time
+import queue
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+from src.raster_backend import LOCAL_RASTER_FOLDER, ROI_BOUNDS
+from src.prepared_data import FEATURES
+
+# --- AYARLAR ---
+HOST = '127.0.0.1'
+PORT = 8080
+MAX_BATCH = 64        # Bir mikro batch'teki en fazla satır
+MAX_WAIT_MS = 5.0     # İlk istek geldikten sonra batch'i doldurmak için beklenecek süre
+LATENCY_WINDOW = 10_000  # Yüzdelikler için tutulan son istek sayısı
+
+
+class ServiceMetrics:
+    """İş parçacığı güvenli sayaçlar: istek gecikmesi, batch boyutu, throughput."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.latencies_ms = deque(maxlen=LATENCY_WINDOW)
+        self.batch_sizes = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+
+    def record_request(self, rows, seconds):
+        with self.lock:
+            self.requests += 1
+            self.rows += rows
+            self.latencies_ms.append(seconds * 1000)
+
+    def record_batch(self, rows):
+        with self.lock:
+            self.batch_sizes.append(rows)
+
+    def record_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self.lock:  # Sayaçlar da kilit altında okunur: anlık görüntü tutarlı kalsın
+            uptime = time.perf_counter() - self.started
+            latencies = np.asarray(self.latencies_ms)
+            batches = np.asarray(self.batch_sizes)
+            requests, rows, errors = self.requests, self.rows, self.errors
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (None, None)
+        return {
+            'uptime_seconds': round(uptime, 1),
+            'requests': requests, 'rows': rows, 'errors': errors,
+            'requests_per_second': round(requests / uptime, 1) if uptime else None,
+            'rows_per_second': round(rows / uptime, 1) if uptime else None,
+            'latency_p50_ms': None if p50 is None else round(float(p50), 2),
+            'latency_p99_ms': None if p99 is None else round(float(p99), 2),
+            'batches': len(batches),
+            'mean_batch_rows': round(float(batches.mean()), 1) if len(batches) else None,
+        }
+
+
+class MicroBatcher:
+    """
+    İstek iş parçacıklarından gelen blokları tek bir arka plan iş parçacığında birleştirir:
+    ilk blok geldikten sonra en fazla max_wait_ms beklenir ya da max_batch satıra
+    ulaşılınca batch hemen işlenir. Nokta sorgularının raster örneklemesi de batch
+    halinde yapılır; model batch başına tek kez çağrılır (tek iş parçacığından).
+
+    Blok türleri:
+        'features': ham (n, 3) ya da (n, T, 3) öznitelik satırları
+        'points'  : (n, 3) [lon, lat, tarih ms] satırları (PointFeatures gerekir)
+    """
+
+    def __init__(self, scorer, metrics, features=None, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.scorer = scorer
+        self.metrics = metrics
+        self.features = features
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, name='micro-batcher', daemon=True)
+        self.thread.start()
+
+    def submit(self, kind, rows):
+        """Dönüş: olasılıklar için Future (geçersiz noktalar NaN)."""
+        future = Future()
+        self.queue.put((kind, np.asarray(rows), future))
+        return future
+
+    def _loop(self):
+        while True:
+            blocks = [self.queue.get()]
+            rows = len(blocks[0][1])
+            deadline = time.perf_counter() + self.max_wait
+            while rows < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    block = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                blocks.append(block)
+                rows += len(block[1])
+            self._process(blocks)
+
+    def _build_points(self, rows):
+        return self.features.build(rows[:, 0], rows[:, 1], rows[:, 2].astype(np.int64))
+
+    def _inputs(self, blocks):
+        """
+        Blok türüne göre model girdisi: blok sırasıyla (X, valid) ya da o bloğun hatası (Exception).
+        Bir bloğun hatası yalnızca o isteğe döner, aynı batch'teki diğer istekler etkilenmez.
+        """
+        inputs = [None] * len(blocks)
+        point_ids = [i for i, (kind, _, _) in enumerate(blocks) if kind == 'points']
+        if point_ids:
+            try:
+                X, valid = self._build_points(np.concatenate([blocks[i][1] for i in point_ids]))
+                offset = 0
+                for i in point_ids:
+                    n = len(blocks[i][1])
+                    inputs[i] = (X[offset:offset + n], valid[offset:offset + n])
+                    offset += n
+            except Exception:
+                # Toplu örnekleme başarısızsa hatalı bloğu bulmak için bloklar tek tek kurulur
+                for i in point_ids:
+                    try:
+                        inputs[i] = self._build_points(blocks[i][1])
+                    except Exception as e:
+                        inputs[i] = e
+        for i, (kind, rows, _) in enumerate(blocks):
+            if kind == 'features':
+                try:
+                    X = rows.astype(np.float32)
+                    inputs[i] = (X, np.ones(len(X), dtype=bool))
+                except Exception as e:
+                    inputs[i] = e
+        return inputs
+
+    def _process(self, blocks):
+        ready = []
+        for block, block_input in zip(blocks, self._inputs(blocks)):
+            if isinstance(block_input, Exception):
+                block[2].set_exception(block_input)
+            else:
+                ready.append((block, block_input))
+        if not ready:
+            return
+        blocks, inputs = zip(*ready)
+        try:
+            X = np.concatenate([X[valid] for X, valid in inputs])
+            probs = self.scorer.score(X) if len(X) else np.empty(0, dtype=np.float32)
+        except Exception as e:
+            for _, _, future in blocks:
+                future.set_exception(e)
+            return
+        self.metrics.record_batch(len(X))
+        offset = 0
+        for (_, _, future), (_, valid) in zip(blocks, inputs):
+            risk = np.full(len(valid), np.nan, dtype=np.float32)
+            n = int(valid.sum())
+            risk[valid] = probs[offset:offset + n]
+            offset += n
+            future.set_result(risk)
+
+
+class PointFeatures:
+    """(lon, lat, tarih) -> model girdisi, yerel rasterlardan (eğitimdeki öznitelik tanımıyla)."""
+
+    def __init__(self, raster_folder, steps):
+        from src.raster_backend import LocalRasterBackend
+        self.backend = LocalRasterBackend.from_directory(raster_folder)
+        self.steps = steps
+        self.last_date_ms = int(self.backend.lst_dates.max())
+        self.series = None
+        if steps > 1:
+            from src.sequence_builder import PixelTimeSeries
+            self.series = PixelTimeSeries(self.backend, folder=raster_folder)
+
+    def resolve_dates(self, dates):
+        """Tarih yoksa bugün; rasterların son tarihinden sonraki günler son tarihe çekilir."""
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        ms = np.array([datetime.strptime(d or today, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp() * 1000
+                       for d in dates], dtype=np.int64)
+        return np.minimum(ms, self.last_date_ms)
+
+    def build(self, lon, lat, dates_ms):
+        """Dönüş: (X, valid)"""
+        from src.point_sampler import sample_points
+        lon, lat = np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+        if self.steps > 1:
+            return self.series.build(lon, lat, dates_ms, self.steps)
+        table = sample_points(self.backend, lon, lat, dates_ms)
+        X = table[['LST', 'NDVI', 'elevation']].to_numpy(dtype=np.float32)
+        return X, ~np.isnan(X).any(axis=1)
+
+
+class ScoringService:
+    def __init__(self, scorer, features=None, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.scorer = scorer
+        self.features = features
+        self.metrics = ServiceMetrics()
+        # Sabit batch şekli: her mikro batch aynı grafı kullanır (bkz. FireRiskScorer)
+        scorer.batch_size = max_batch
+        scorer.warmup()
+        self.batcher = MicroBatcher(scorer, self.metrics, features, max_batch, max_wait_ms)
+
+    def check_features(self, rows):
+        """
+        Ham öznitelik satırlarını kuyruğa girmeden doğrular ve nokta sorgularıyla aynı şekle
+        getirir: 1 adımlı modelde (n, 3), aksi halde (n, T, 3). Geçersiz girdi ValueError verir;
+        böylece tek hatalı istek aynı mikro batch'teki diğer istekleri düşürmez.
+        """
+        n_features, steps = len(FEATURES), self.scorer.steps
+        try:
+            X = np.asarray(rows, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ValueError("'features' sayısal ve dikdörtgen bir liste olmalı")
+        if X.ndim == 3 and steps == 1 and X.shape[1] == 1:
+            X = X[:, 0, :]
+        expected = (n_features,) if steps == 1 else (steps, n_features)
+        if len(X) == 0 or X.shape[1:] != expected:
+            raise ValueError(f"'features' şekli {X.shape}, beklenen (n, {', '.join(map(str, expected))}), n > 0")
+        if not np.isfinite(X).all():
+            raise ValueError("'features' yalnızca sonlu sayılar içermeli (null / NaN / inf yok)")
+        return X
+
+    def score_features(self, rows):
+        return self.batcher.submit('features', self.check_features(rows)).result()
+
+    def score_points(self, points):
+        if self.features is None:
+            raise ValueError("Nokta sorguları için yerel rasterlar gerekli (--raster-folder)")
+        if not isinstance(points, list) or not all(isinstance(p, dict) for p in points):
+            raise ValueError("'points' nesnelerden oluşan bir liste olmalı: [{\"lon\": .., \"lat\": ..}]")
+        dates_ms = self.features.resolve_dates([p.get('date') for p in points])
+        rows = np.column_stack([[float(p['lon']) for p in points], [float(p['lat']) for p in points],
+                                dates_ms.astype(np.float64)])
+        risk = self.batcher.submit('points', rows).result()
+        dates = [datetime.fromtimestamp(ms / 1000, timezone.utc).strftime('%Y-%m-%d') for ms in dates_ms]
+        return [{'lon': p['lon'], 'lat': p['lat'], 'date': d,
+                 'risk': None if np.isnan(r) else round(float(r), 6)}
+                for p, d, r in zip(points, dates, risk)]
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive: yük testinde bağlantı kurulumu gecikmeye girmesin
+
+        def log_message(self, format, *args):
+            pass  # İstek başına log gecikmeyi artırır
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _handle_score(self, payload):
+            t0 = time.perf_counter()
+            try:
+                if 'features' in payload:
+                    probs = service.score_features(payload['features'])
+                    result = {'risk': [round(float(p), 6) for p in probs]}
+                    rows = len(probs)
+                else:
+                    result = {'results': service.score_points(payload['points'])}
+                    rows = len(payload['points'])
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                # Girdi hatası: yalnızca bu istek reddedilir
+                service.metrics.record_error()
+                return self._send(400, {'error': f"{type(e).__name__}: {e}"})
+            except Exception as e:
+                # Beklenmeyen hata da yanıtsız kalmasın (istemci zaman aşımına düşmez)
+                service.metrics.record_error()
+                return self._send(500, {'error': f"{type(e).__name__}: {e}"})
+            service.metrics.record_request(rows, time.perf_counter() - t0)
+            self._send(200, result)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/health':
+                return self._send(200, {'status': 'ok'})
+            if url.path == '/metrics':
+                return self._send(200, service.metrics.snapshot())
+            if url.path == '/score':
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                try:
+                    point = {'lon': float(query['lon']), 'lat': float(query['lat']), 'date': query.get('date')}
+                except (KeyError, ValueError):
+                    return self._send(400, {'error': "lon ve lat sayısal parametreleri gerekli"})
+                return self._handle_score({'points': [point]})
+            self._send(404, {'error': 'bulunamadı'})
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/score':
+                return self._send(404, {'error': 'bulunamadı'})
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                return self._send(400, {'error': 'geçersiz JSON'})
+            self._handle_score(payload)
+
+    return Handler
+
+
+def serve(host=HOST, port=PORT, raster_folder=LOCAL_RASTER_FOLDER, max_batch=MAX_BATCH,
+          max_wait_ms=MAX_WAIT_MS, runtime='auto'):
+    from src.inference import load_scorer
+
+    t0 = time.perf_counter()
+    scorer = load_scorer(runtime)
+    try:
+        features = PointFeatures(raster_folder, scorer.steps)
+    except FileNotFoundError:
+        print(f"⚠️ UYARI: {raster_folder} altında raster yok; yalnızca 'features' sorguları yanıtlanır.")
+        features = None
+    service = ScoringService(scorer, features, max_batch, max_wait_ms)
+    print(f"✅ Model yüklendi ve ısıtıldı ({type(scorer).__name__}, {time.perf_counter() - t0:.2f} sn)")
+
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    print(f"🚀 Servis: http://{host}:{port}  (mikro batch: {max_batch} satır / {max_wait_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {json.dumps(service.metrics.snapshot(), ensure_ascii=False)}")
+
+
+def run_load_test(url=f'http://{HOST}:{PORT}', concurrency=16, n_requests=1000,
+                  bounds=ROI_BOUNDS, date=None, seed=42):
+    """
+    Yerel yük üreteci: `concurrency` iş parçacığı, her biri kalıcı bir bağlantı üzerinden
+    rastgele ROI noktaları için GET /score gönderir. İstemci tarafı p50 / p99 ve istek/sn raporlanır.
+    """
+    import http.client
+
+    target = urlparse(url)
+    rng = np.random.default_rng(seed)
+    west, south, east, north = bounds
+    lons, lats = rng.uniform(west, east, n_requests), rng.uniform(south, north, n_requests)
+    latencies = np.zeros(n_requests)
+    # İstek başına sonuç: her indeks tek bir iş parçacığınca yazılır, paylaşılan sayaç yarışı olmaz
+    failed = np.zeros(n_requests, dtype=bool)
+    local = threading.local()
+
+    def one(i):
+        if not hasattr(local, 'conn'):
+            local.conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+        path = f'/score?lon={lons[i]:.5f}&lat={lats[i]:.5f}' + (f'&date={date}' if date else '')
+        t0 = time.perf_counter()
+        try:
+            local.conn.request('GET', path)
+            response = local.conn.getresponse()
+            response.read()
+            failed[i] = response.status != 200
+        except (OSError, http.client.HTTPException):
+            # Kopan bağlantı hata sayılır; sonraki istek yeni bağlantı açar
+            failed[i] = True
+            local.conn.close()
+            del local.conn
+        latencies[i] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - t0
+    errors = int(failed.sum())
+
+    p50, p99 = np.percentile(latencies * 1000, [50, 99])
+    print(f"\n🔥 Yük testi: {n_requests} istek, {concurrency} eşzamanlı, {elapsed:.2f} sn")
+    print(f"⚡ {n_requests / elapsed:,.0f} istek/sn | p50 {p50:.2f} ms | p99 {p99:.2f} ms | hata: {errors}")
+
+    conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    conn.request('GET', '/metrics')
+    print(f"📊 Sunucu: {conn.getresponse().read().decode()}")
+    return {'requests_per_second': n_requests / elapsed, 'p50_ms': p50, 'p99_ms': p99, 'errors': errors}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yangın riski HTTP puanlama servisi.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = sub.add_parser('serve', help="Servisi başlat")
+    serve_parser.add_argument('--host', default=HOST)
+    serve_parser.add_argument('--port', type=int, default=PORT)
+    serve_parser.add_argument('--raster-folder', default=LOCAL_RASTER_FOLDER)
+    serve_parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    serve_parser.add_argument('--runtime', choices=['auto', 'keras', 'tflite'], default='auto')
+    serve_parser.add_argument('--max-wait-ms', type=float, default=MAX_WAIT_MS,
+                              help="Mikro batch için gecikme bütçesi")
+
+    load_parser = sub.add_parser('loadtest', help="Çalışan servise yerel yük üret")
+    load_parser.add_argument('--url', default=f'http://{HOST}:{PORT}')
+    load_parser.add_argument('--concurrency', type=int, default=16)
+    load_parser.add_argument('--requests', type=int, default=1000)
+    load_parser.add_argument('--date', default=None)
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        serve(args.host, args.port, args.raster_folder, args.max_batch, args.max_wait_ms, args.runtime)
+    else:
+        run_load_test(args.url, args.concurrency, args.requests, date=args.date)
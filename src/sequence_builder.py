@@ -0,0 +1,136 @@
+"""
+Zaman Serisi (Sequence) Oluşturucu
+
+LSTM'e her nokta için tek bir anlık ölçüm (timesteps=1) yerine, o noktanın
+tarihinden önceki N adet MODIS kompozitini verir:
+
+    X[i, k, :] = [LST, NDVI, elevation]   k = 0 (en eski) ... N-1 (en yeni)
+
+- Zaman adımları MOD11A2 (LST, 8 günlük) dönemleridir.
+- Her adım için o dönemde geçerli olan en son MOD13A1 (NDVI, 16 günlük) kompoziti alınır.
+- Yükseklik sabittir, her adıma kopyalanır.
+
+Hız için rasterlar bir kez "piksel öncelikli" (pixel-major) düzene çevrilir:
+series[piksel, zaman]. Böylece bir noktanın geçmişi bellekte bitişik bir dilimdir
+ve tüm noktalar tek bir gelişmiş indeksleme ile toplanır. Bu indeks raster
+klasörüne *_series.npy olarak kaydedilir ve sonraki çalıştırmalarda mmap ile açılır.
+"""
+import os
+
+import numpy as np
+
+from src.raster_backend import LocalRasterBackend, LOCAL_RASTER_FOLDER, LST_WINDOW, DAY_MS
+
+# --- AYARLAR ---
+SEQUENCE_STEPS = 8  # ~64 günlük geçmiş (8 x 8 gün)
+N_FEATURES = 3      # LST, NDVI, elevation
+
+
+def _pixel_major(stack, path, block=64):
+    """(T, H, W) yığınını (H*W, T) düzeninde .npy dosyasına yazar ve mmap ile açar."""
+    t, h, w = stack.shape
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(h * w, t))
+    for start in range(0, t, block):
+        frames = np.asarray(stack[start:start + block], dtype=np.float32)
+        out[:, start:start + len(frames)] = frames.reshape(len(frames), h * w).T
+    out.flush()
+    del out
+    return np.load(path, mmap_mode='r')
+
+
+def _fill_gaps(values):
+    """(n, T) dizide NaN'ları önce ileri, sonra geri doldurur (bulut / eksik kompozit)."""
+    n, t = values.shape
+    valid = ~np.isnan(values)
+
+    idx = np.where(valid, np.arange(t), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = values[np.arange(n)[:, None], idx]
+
+    valid = ~np.isnan(filled)
+    idx = np.where(valid, np.arange(t), t - 1)
+    idx = np.minimum.accumulate(idx[:, ::-1], axis=1)[:, ::-1]
+    return filled[np.arange(n)[:, None], idx]
+
+
+class PixelTimeSeries:
+    """Piksel başına LST / NDVI zaman serisi indeksi."""
+
+    def __init__(self, backend, folder=None):
+        self.backend = backend
+        lst_order = np.argsort(backend.lst_dates, kind='stable')
+        ndvi_order = np.argsort(backend.ndvi_dates, kind='stable')
+        self.lst_dates = backend.lst_dates[lst_order]
+        self.ndvi_dates = backend.ndvi_dates[ndvi_order]
+
+        if folder is not None:
+            self.lst_series = self._load_or_build(backend.lst, lst_order, folder, 'lst')
+            self.ndvi_series = self._load_or_build(backend.ndvi, ndvi_order, folder, 'ndvi')
+        else:
+            h, w = backend.shape
+            self.lst_series = np.asarray(backend.lst, dtype=np.float32)[lst_order].reshape(-1, h * w).T
+            self.ndvi_series = np.asarray(backend.ndvi, dtype=np.float32)[ndvi_order].reshape(-1, h * w).T
+        self.elevation = np.asarray(backend.elevation, dtype=np.float32).reshape(-1)
+
+    @staticmethod
+    def _load_or_build(stack, order, folder, name):
+        """folder/<name>_series.npy varsa ve kaynak (<name>.npy) daha yeni değilse onu açar."""
+        path = os.path.join(folder, f'{name}_series.npy')
+        source = os.path.join(folder, f'{name}.npy')
+        expected = (stack.shape[1] * stack.shape[2], stack.shape[0])
+        fresh = os.path.exists(path) and \
+            (not os.path.exists(source) or os.path.getmtime(path) >= os.path.getmtime(source))
+        if fresh:
+            series = np.load(path, mmap_mode='r')
+            if series.shape == expected:
+                return series
+        print(f"🧮 Piksel zaman serisi indeksi oluşturuluyor: {path}")
+        if np.any(order != np.arange(len(order))):
+            stack = np.asarray(stack)[order]
+        return _pixel_major(stack, path)
+
+    @classmethod
+    def from_directory(cls, folder=LOCAL_RASTER_FOLDER):
+        return cls(LocalRasterBackend.from_directory(folder), folder=folder)
+
+    def build(self, lon, lat, dates, steps=SEQUENCE_STEPS):
+        """
+        Dönüş: (X, valid)
+        X     : (n, steps, 3) float32 -> [LST, NDVI, elevation]
+        valid : (n,) bool -> ROI içinde ve tüm özniteliklerde en az bir geçerli değer var
+        """
+        dates = np.asarray(dates, dtype=np.int64)
+        n = len(dates)
+        row, col = self.backend.pixel_index(lon, lat)
+        inside = row >= 0
+        pixel = np.where(inside, row * self.backend.shape[1] + col, 0)
+
+        # Noktanın LST penceresi sonuna kadar başlamış son `steps` kompozit
+        end = np.searchsorted(self.lst_dates, dates + LST_WINDOW[1] * DAY_MS, side='left')
+        lst_idx = end[:, None] - steps + np.arange(steps)[None, :]
+        lst_ok = lst_idx >= 0
+        lst_idx = np.clip(lst_idx, 0, len(self.lst_dates) - 1)
+
+        # Her LST adımında geçerli olan en son NDVI kompoziti
+        step_dates = self.lst_dates[lst_idx]
+        ndvi_idx = np.searchsorted(self.ndvi_dates, step_dates, side='right') - 1
+        ndvi_ok = ndvi_idx >= 0
+        ndvi_idx = np.clip(ndvi_idx, 0, len(self.ndvi_dates) - 1)
+
+        lst = np.where(lst_ok, self.lst_series[pixel[:, None], lst_idx], np.nan).astype(np.float32)
+        ndvi = np.where(lst_ok & ndvi_ok, self.ndvi_series[pixel[:, None], ndvi_idx], np.nan).astype(np.float32)
+        lst[~inside] = np.nan
+        ndvi[~inside] = np.nan
+
+        lst = _fill_gaps(lst)
+        ndvi = _fill_gaps(ndvi)
+        elevation = np.where(inside, self.elevation[pixel], np.nan).astype(np.float32)
+
+        X = np.empty((n, steps, N_FEATURES), dtype=np.float32)
+        X[:, :, 0] = lst
+        X[:, :, 1] = ndvi
+        X[:, :, 2] = elevation[:, None]
+
+        valid = inside & ~np.isnan(X).any(axis=(1, 2))
+        X[~valid] = 0.0
+        return X, valid
@@ -0,0 +1,169 @@
+"""
+İçerik Özetli (Content-Hashed) Aşama Önbelleği
+
+Her aşamanın çıktısı (birleştirilmiş veri, ölçeklenmiş diziler, eğitim/test indeksleri)
+girdi dosyalarının SHA-256 özetleri ve aşama parametrelerinden üretilen bir anahtar
+altında saklanır. Girdiler değişmediyse aşama yeniden hesaplanmaz, önbellekteki
+(mmap ile açılan) dizi doğrudan kullanılır.
+
+    cache = StageCache()
+    key = stage_key('split', [data_path], {'test_size': 0.2, 'random_state': 42})
+    arrays = cache.get_or_compute('split', key, compute_fn)
+
+Dosya özetleri boyut + değiştirilme zamanına göre data/cache/hashes.json'da tutulur;
+değişmeyen büyük dosyalar her çalıştırmada yeniden okunmaz.
+"""
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+
+# --- AYARLAR ---
+CACHE_FOLDER = os.path.join('data', 'cache')
+HASH_INDEX = 'hashes.json'
+STAMP_FILE = 'stage_key'   # Bir çıktının hangi anahtarla üretildiğini gösteren dosya
+DONE_FILE = '_DONE'
+HASH_BLOCK = 1 << 20
+
+
+def _hash_index_path(folder=CACHE_FOLDER):
+    return os.path.join(folder, HASH_INDEX)
+
+
+def _load_hash_index(folder=CACHE_FOLDER):
+    try:
+        with open(_hash_index_path(folder)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_hash_index(index, folder=CACHE_FOLDER):
+    os.makedirs(folder, exist_ok=True)
+    tmp_path = f'{_hash_index_path(folder)}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, _hash_index_path(folder))
+
+
+def file_hash(path, folder=CACHE_FOLDER):
+    """Dosyanın SHA-256 özeti. (boyut, mtime) değişmediyse kayıtlı özet kullanılır."""
+    stat = os.stat(path)
+    abs_path = os.path.abspath(path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+
+    index = _load_hash_index(folder)
+    entry = index.get(abs_path)
+    if entry and entry['signature'] == signature:
+        return entry['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+
+    index = _load_hash_index(folder)  # Başka süreç bu arada yazmış olabilir
+    index[abs_path] = {'signature': signature, 'sha256': digest.hexdigest()}
+    _save_hash_index(index, folder)
+    return digest.hexdigest()
+
+
+def path_hash(path):
+    """Dosya ya da klasörün (örn. sütunlu depo) içerik özeti. Damga dosyaları hariç tutulur."""
+    if os.path.isfile(path):
+        return file_hash(path)
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name in (STAMP_FILE, DONE_FILE):
+                continue
+            full_path = os.path.join(root, name)
+            digest.update(os.path.relpath(full_path, path).encode())
+            digest.update(file_hash(full_path).encode())
+    return digest.hexdigest()
+
+
+def stage_key(stage, inputs=(), params=None):
+    """Aşama adı + girdi özetleri + parametrelerden kısa bir anahtar üretir."""
+    payload = {
+        'stage': stage,
+        'inputs': [path_hash(p) for p in inputs],
+        'params': params or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def read_stamp(path):
+    """Bir çıktının (klasör) üretildiği anahtarı okur; yoksa None."""
+    try:
+        with open(os.path.join(path, STAMP_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_stamp(path, key):
+    with open(os.path.join(path, STAMP_FILE), 'w') as f:
+        f.write(key)
+
+
+class StageCache:
+    """data/cache/<aşama>/<anahtar>/ altında .npy diziler ve joblib nesneleri saklar."""
+
+    def __init__(self, folder=CACHE_FOLDER):
+        self.folder = folder
+
+    def path(self, stage, key):
+        return os.path.join(self.folder, stage, key)
+
+    def has(self, stage, key):
+        return os.path.exists(os.path.join(self.path(stage, key), DONE_FILE))
+
+    def load(self, stage, key, mmap=True):
+        import joblib
+
+        folder = self.path(stage, key)
+        result = {}
+        for name in sorted(os.listdir(folder)):
+            full_path = os.path.join(folder, name)
+            if name.endswith('.npy'):
+                result[name[:-4]] = np.load(full_path, mmap_mode='r' if mmap else None)
+            elif name.endswith('.pkl'):
+                result[name[:-4]] = joblib.load(full_path)
+        return result
+
+    def save(self, stage, key, values):
+        """values: {ad: numpy dizisi ya da (joblib ile saklanacak) nesne}"""
+        import joblib
+
+        folder = self.path(stage, key)
+        tmp_folder = f'{folder}.{os.getpid()}.tmp'
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        os.makedirs(tmp_folder)
+        for name, value in values.items():
+            if isinstance(value, np.ndarray):
+                np.save(os.path.join(tmp_folder, f'{name}.npy'), value)
+            else:
+                joblib.dump(value, os.path.join(tmp_folder, f'{name}.pkl'))
+        open(os.path.join(tmp_folder, DONE_FILE), 'w').close()
+
+        # Yarım kalan yazım önbellek isabeti sayılmasın
+        shutil.rmtree(folder, ignore_errors=True)
+        os.replace(tmp_folder, folder)
+
+    def get_or_compute(self, stage, key, compute):
+        """Önbellekte varsa yükler, yoksa compute() sonucunu kaydedip döndürür."""
+        if self.has(stage, key):
+            print(f"⚡ Önbellek isabeti: {stage} ({key})")
+            return self.load(stage, key)
+        values = compute()
+        self.save(stage, key, values)
+        return values
+
+    def clear(self, stage=None):
+        shutil.rmtree(os.path.join(self.folder, stage) if stage else self.folder, ignore_errors=True)
@@ -0,0 +1,274 @@
+"""
+Hiperparametre Taraması (Sweep)
+
+LSTM (katman birimleri, dropout, epoch, batch) ve karşılaştırma modelleri
+(Random Forest, Lojistik Regresyon) için ızgara (grid) ya da rastgele arama yapar.
+
+- Denemeler CPU sayısı kadar işçili bir süreç havuzunda (ProcessPoolExecutor) koşar.
+- Her işçiye CPU / işçi sayısı kadar iş parçacığı düşer: TensorFlow intra/inter-op
+  ve BLAS / OpenMP iş parçacıkları buna göre sınırlanır (aşırı abonelik olmaz).
+- Ölçeklenmiş veri ve eğitim/test indeksleri aşama önbelleğinden (data/cache) gelir;
+  her işçi bunları bir kez mmap ile açar, denemeler arasında yeniden hesaplanmaz.
+- Modeller eğitim kümesinden ayrılan doğrulama kümesinde puanlanır; test kümesi
+  model seçiminde kullanılmaz.
+
+Sonuçlar results/sweep_results.csv tablosuna yazılır.
+
+    python -m src.sweep --models lstm random_forest --search random --trials 20
+"""
+import os
+import json
+import time
+import random
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from src.dataset_store import open_dataset
+from src.prepared_data import fit_scaled, fit_sequences, split_indices, FEATURES, RANDOM_STATE
+from src.baselines import fit_predict, score
+from src.raster_backend import LOCAL_RASTER_FOLDER
+
+# --- AYARLAR ---
+DATA_NAME = 'Antalya_Merged_Dataset'
+DATA_PATH = 'data/Antalya_Merged_Dataset.csv'
+RESULTS_FOLDER = 'results'
+SWEEP_RESULTS_PATH = os.path.join(RESULTS_FOLDER, 'sweep_results.csv')
+VAL_SIZE = 0.2        # Eğitim kümesinden ayrılan doğrulama oranı
+PATIENCE = 5          # LSTM denemelerinde erken durdurma sabrı
+
+SEARCH_SPACES = {
+    'lstm': {
+        'units': [[64, 32], [32, 16], [128, 64]],
+        'dropout': [0.1, 0.2, 0.3],
+        'batch_size': [32, 128],
+        'epochs': [50],
+    },
+    'random_forest': {
+        'n_estimators': [100, 300],
+        'max_depth': [None, 10, 20],
+        'min_samples_leaf': [1, 5],
+    },
+    'logistic_regression': {
+        'C': [0.1, 1.0, 10.0],
+    },
+}
+MODELS = list(SEARCH_SPACES)
+
+# İşçi süreç durumu (initializer ile bir kez doldurulur)
+_WORKER = {}
+
+
+def grid_trials(space):
+    """Parametre uzayının tüm kombinasyonları."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_trials(space, n_trials, seed=RANDOM_STATE):
+    """Uzaydan (tekrarsız) n_trials rastgele kombinasyon. Uzay küçükse tüm ızgara döner."""
+    grid = grid_trials(space)
+    if n_trials >= len(grid):
+        return grid
+    return random.Random(seed).sample(grid, n_trials)
+
+
+def build_trials(models, search='grid', n_trials=10, spaces=None, seed=RANDOM_STATE):
+    spaces = spaces or SEARCH_SPACES
+    trials = []
+    for model in models:
+        params_list = grid_trials(spaces[model]) if search == 'grid' else \
+            random_trials(spaces[model], n_trials, seed)
+        trials += [{'model': model, 'params': params} for params in params_list]
+    # Uzun süren LSTM denemeleri önce: havuzun sonunda tek başına çalışan deneme kalmasın
+    return sorted(trials, key=lambda t: t['model'] != 'lstm')
+
+
+def limit_threads(threads, use_tf):
+    """İşçi sürecin BLAS / OpenMP ve (use_tf ise) TensorFlow iş parçacıklarını sınırlar."""
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ['TF_NUM_INTRAOP_THREADS'] = str(threads)
+    os.environ['TF_NUM_INTEROP_THREADS'] = '1'
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(threads)
+
+    if use_tf:
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def _init_worker(data_path, sequence_steps, raster_folder, split, threads, use_tf):
+    """Her işçide bir kez: iş parçacığı sınırları + önbellekten veri (mmap)."""
+    limit_threads(threads, use_tf)
+
+    scaled = fit_scaled(data_path)
+    _WORKER.update(X=scaled['X_scaled'], y=scaled['y'], split=split, threads=threads)
+    if use_tf and sequence_steps > 1:
+        _WORKER['X_seq'] = fit_sequences(data_path, raster_folder, sequence_steps)['X_seq']
+    elif use_tf:
+        _WORKER['X_seq'] = _WORKER['X'].reshape(-1, 1, len(FEATURES))
+
+
+def _scores(y_true, y_prob):
+    return {f'val_{name}': value for name, value in score(y_true, y_prob).items()}
+
+
+def _run_baseline(name, params):
+    X, y, split = _WORKER['X'], _WORKER['y'], _WORKER['split']
+    result = fit_predict(name, X[split['train_idx']], y[split['train_idx']], X[split['val_idx']],
+                         params, n_jobs=_WORKER['threads'])
+    return {**_scores(y[split['val_idx']], result['y_prob']), 'fit_seconds': result['fit_seconds'],
+            'predict_seconds': result['predict_seconds']}
+
+
+def fit_predict_lstm(params, X_train, y_train, X_val, y_val, X_test=None):
+    """
+    LSTM'i (X_val, y_val) üzerinde erken durdurmayla eğitir ve X_test için (verilmezse
+    X_val) olasılık üretir. baselines.fit_predict'in LSTM karşılığı.
+    Dönüş: {'model', 'y_prob', 'fit_seconds', 'predict_seconds', 'epochs_run'}
+    """
+    import tensorflow as tf
+    from src.train_model import build_lstm_model
+    from src.input_pipeline import make_dataset
+
+    X_test = X_val if X_test is None else X_test
+    tf.keras.backend.clear_session()
+    model = build_lstm_model(X_train.shape[1], X_train.shape[2], tuple(params['units']), params['dropout'])
+    stopper = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=PATIENCE,
+                                               restore_best_weights=True)
+    t0 = time.perf_counter()
+    history = model.fit(make_dataset(X_train, y_train, params['batch_size']),
+                        epochs=params['epochs'],
+                        validation_data=make_dataset(X_val, y_val, params['batch_size'], shuffle=False),
+                        callbacks=[stopper], verbose=0)
+    fit_seconds = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    y_prob = model.predict(X_test, batch_size=1024, verbose=0).flatten()
+    predict_seconds = time.perf_counter() - t0
+    return {'model': model, 'y_prob': y_prob, 'fit_seconds': fit_seconds,
+            'predict_seconds': predict_seconds, 'epochs_run': len(history.history['loss'])}
+
+
+def _run_lstm(params):
+    X, y, split = _WORKER['X_seq'], _WORKER['y'], _WORKER['split']
+    y_val = y[split['val_idx']]
+    result = fit_predict_lstm(params, X[split['train_idx']], y[split['train_idx']], X[split['val_idx']], y_val)
+    return {**_scores(y_val, result['y_prob']), 'fit_seconds': result['fit_seconds'],
+            'predict_seconds': result['predict_seconds'], 'epochs_run': result['epochs_run']}
+
+
+def run_trial(trial):
+    """Tek deneme (işçi süreçte). Hata olursa tarama durmaz, satıra yazılır."""
+    row = {'model': trial['model'], 'params': json.dumps(trial['params'], sort_keys=True)}
+    try:
+        if trial['model'] == 'lstm':
+            row.update(_run_lstm(trial['params']))
+        else:
+            row.update(_run_baseline(trial['model'], trial['params']))
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def prepare_sweep_data(data_path, sequence_steps=1, raster_folder=LOCAL_RASTER_FOLDER, use_tf=True):
+    """
+    Önbelleği ana süreçte bir kez doldurur (işçiler yalnızca okur) ve eğitim
+    indekslerinden doğrulama kümesini ayırır. Dönüş: {'train_idx', 'val_idx'}
+    """
+    scaled = fit_scaled(data_path)
+    n_rows = len(scaled['y'])
+    train_idx = split_indices(data_path, n_rows)['train_idx']
+    if use_tf and sequence_steps > 1:
+        # Zaman serisi kurulamayan noktalar tüm modellerden çıkarılır (karşılaştırma aynı satırlarda)
+        valid = fit_sequences(data_path, raster_folder, sequence_steps)['valid']
+        train_idx = train_idx[valid[train_idx]]
+    train_idx, val_idx = train_test_split(np.asarray(train_idx), test_size=VAL_SIZE,
+                                          random_state=RANDOM_STATE)
+    return {'train_idx': train_idx, 'val_idx': val_idx}
+
+
+def run_sweep(models=MODELS, search='grid', n_trials=10, max_workers=None, spaces=None,
+              sequence_steps=1, raster_folder=LOCAL_RASTER_FOLDER, output_path=SWEEP_RESULTS_PATH,
+              seed=RANDOM_STATE):
+    print("🔍 Hiperparametre taraması başlıyor...")
+    try:
+        data_path = open_dataset(DATA_NAME, DATA_PATH)
+    except FileNotFoundError:
+        print(f"❌ HATA: {DATA_PATH} bulunamadı!")
+        return None
+
+    use_tf = 'lstm' in models
+    split = prepare_sweep_data(data_path, sequence_steps, raster_folder, use_tf)
+    trials = build_trials(models, search, n_trials, spaces, seed)
+
+    cpus = os.cpu_count() or 1
+    max_workers = min(max_workers or cpus, len(trials)) or 1
+    threads = max(1, cpus // max_workers)
+    print(f"🧪 {len(trials)} deneme | {max_workers} işçi x {threads} iş parçacığı | "
+          f"eğitim {len(split['train_idx'])} / doğrulama {len(split['val_idx'])}")
+
+    rows = []
+    t0 = time.perf_counter()
+    # spawn: TensorFlow fork sonrası güvenli değil
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                             initargs=(data_path, sequence_steps, raster_folder, split,
+                                       threads, use_tf)) as pool:
+        futures = [pool.submit(run_trial, trial) for trial in trials]
+        for done, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            rows.append(row)
+            status = f"❌ {row['error']}" if 'error' in row else f"AUC {row['val_auc']:.4f}"
+            print(f"  [{done}/{len(trials)}] {row['model']} {row['params']} -> {status}")
+    elapsed = time.perf_counter() - t0
+
+    results = pd.DataFrame(rows)
+    if 'val_auc' in results:
+        results = results.sort_values('val_auc', ascending=False)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    results.to_csv(output_path, index=False)
+
+    print(f"\n🏆 EN İYİ DENEMELER (model başına, doğrulama AUC)")
+    print("=" * 90)
+    if 'val_auc' in results:
+        best = results.dropna(subset=['val_auc']).groupby('model', sort=False).head(1)
+        for _, row in best.iterrows():
+            print(f"{row['model']:<20} | AUC {row['val_auc']:.4f} | F1 {row['val_f1']:.4f} | "
+                  f"fit {row['fit_seconds']:.1f} sn | {row['params']}")
+    print(f"\n⏱️ Toplam süre: {elapsed:.1f} sn")
+    print(f"📁 Sonuç tablosu: {output_path}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LSTM ve karşılaştırma modelleri için hiperparametre taraması.")
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=MODELS)
+    parser.add_argument('--search', choices=['grid', 'random'], default='grid')
+    parser.add_argument('--trials', type=int, default=10,
+                        help="Rastgele aramada model başına deneme sayısı")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--space', default=None,
+                        help="Arama uzayını değiştiren JSON dosyası ({model: {param: [değerler]}})")
+    parser.add_argument('--sequence-steps', type=int, default=1,
+                        help="LSTM denemeleri için zaman adımı sayısı")
+    parser.add_argument('--raster-folder', default=LOCAL_RASTER_FOLDER)
+    parser.add_argument('--seed', type=int, default=RANDOM_STATE)
+    parser.add_argument('--output', default=SWEEP_RESULTS_PATH)
+    args = parser.parse_args()
+
+    spaces = dict(SEARCH_SPACES)
+    if args.space:
+        with open(args.space) as f:
+            spaces.update(json.load(f))
+    run_sweep(models=args.models, search=args.search, n_trials=args.trials, max_workers=args.workers,
+              spaces=spaces, sequence_steps=args.sequence_steps, raster_folder=args.raster_folder,
+              output_path=args.output, seed=args.seed)
@@ -0,0 +1,92 @@
+"""
+Aşama Süre Ölçümü
+
+Boru hattının (pipeline) her aşamasının duvar saati (wall-clock) süresini ölçer:
+
+    timer = StageTimer()
+    with timer.stage('indirme'):
+        ...
+    timer.report()
+
+Giriş noktalarının soğuk başlangıcı (yeni süreçte import + ilk kullanım) için
+cold_start_seconds / report_cold_starts.
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+from contextlib import contextmanager
+
+import numpy as np
+
+_COLD_START_TEMPLATE = """
+import time
+t0 = time.perf_counter()
+{code}
+print(time.perf_counter() - t0)
+"""
+
+
+class StageTimer:
+    def __init__(self, title='Aşama Süreleri'):
+        self.title = title
+        self.stages = []  # [(aşama adı, saniye)]
+
+    @contextmanager
+    def stage(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - t0))
+
+    @property
+    def total(self):
+        return sum(seconds for _, seconds in self.stages)
+
+    def to_dict(self):
+        # Aynı isimli aşamalar toplanır
+        totals = {}
+        for name, seconds in self.stages:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return {name: round(seconds, 3) for name, seconds in totals.items()}
+
+    def report(self, save_path=None):
+        print(f"\n⏱️ {self.title}")
+        print("-" * 40)
+        for name, seconds in self.stages:
+            print(f"{name:<25} | {seconds:8.2f} sn")
+        print("-" * 40)
+        print(f"{'TOPLAM':<25} | {self.total:8.2f} sn")
+
+        if save_path is not None:
+            with open(save_path, 'w') as f:
+                json.dump({'stages': self.to_dict(), 'total': round(self.total, 3)}, f, indent=2)
+
+
+def cold_start_seconds(code, repeats=3):
+    """`code`u her seferinde yeni bir Python sürecinde çalıştırır; medyan süre (sn)."""
+    env = {**os.environ, 'TF_CPP_MIN_LOG_LEVEL': '3'}
+    times = []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, '-c', _COLD_START_TEMPLATE.format(code=code)],
+                                capture_output=True, text=True, env=env)
+        if result.returncode != 0:
+            # Süreç öldürüldüyse (örn. SIGKILL) stderr boş olabilir: çıkış kodu raporlanır
+            lines = result.stderr.strip().splitlines()
+            raise RuntimeError(lines[-1] if lines else f"Süreç {result.returncode} çıkış koduyla sonlandı")
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return float(np.median(times))
+
+
+def report_cold_starts(paths, title='Soğuk Başlangıç', repeats=3):
+    """paths: {ad: kod}. Her yol için cold_start_seconds tablosu; {ad: saniye} döner."""
+    print(f"\n⏱️ {title} (yeni süreç, {repeats} tekrarın medyanı)")
+    print("-" * 40)
+    results = {}
+    for name, code in paths.items():
+        results[name] = cold_start_seconds(code, repeats)
+        print(f"{name:<25} | {results[name]:8.2f} sn")
+    print("-" * 40)
+    return results
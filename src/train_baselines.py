@@ -0,0 +1,133 @@
+"""
+Karşılaştırma Modellerini Eğit ve Kaydet
+
+Lojistik Regresyon ve Random Forest bir kez eğitilir ve LSTM'in yanına kaydedilir:
+
+    models/baselines/logistic_regression.joblib
+    models/baselines/random_forest.joblib
+    models/baselines/metadata.json   (veri / scaler / bölme özetleri, parametreler, eğitim süresi)
+
+evaluate_models.py bu modelleri yükleyip yalnızca tahmin yapar; orman büyüdükçe
+değerlendirme süresi uzamaz. Veri, scaler ya da eğitim/test bölmesi değişirse
+değerlendirme metadata üzerinden bunu fark eder ve yeniden eğitim ister.
+"""
+import os
+import json
+import argparse
+from datetime import datetime, timezone
+
+import sklearn
+
+from src.dataset_store import open_dataset
+from src.prepared_data import fit_scaled, transform_scaled, split_indices, load_split, input_fingerprint
+from src.baselines import (BASELINES, DEFAULT_PARAMS, N_JOBS, CV_FOLDS, fit_predict, score,
+                           cross_validate, summarize, print_cv_table, save_baselines, display_name)
+from src.block_cv import STRATEGIES, block_arrays, block_splits, add_block_arguments
+
+# --- AYARLAR ---
+DATA_NAME = 'Antalya_Merged_Dataset'  # data/store/ altındaki tipli sütunlu depo
+DATA_PATH = 'data/Antalya_Merged_Dataset.csv'  # Depo yoksa buradan içe aktarılır
+SCALER_PATH = 'models/scaler.pkl'
+SPLIT_PATH = 'models/split_indices.npz'
+RESULTS_FOLDER = 'results'
+CV_RESULTS_PATH = os.path.join(RESULTS_FOLDER, 'baseline_cv.csv')
+
+
+def train_baselines(names=tuple(BASELINES), params=None, cv_folds=0, n_jobs=N_JOBS,
+                    cv_strategy='random', block_options=None):
+    print("🚀 Karşılaştırma modelleri eğitiliyor...")
+    params = params or {}
+
+    # 1. Veriyi Yükle (LSTM ile aynı scaler ve aynı eğitim/test bölmesi)
+    try:
+        data_path = open_dataset(DATA_NAME, DATA_PATH)
+    except FileNotFoundError:
+        print(f"❌ HATA: {DATA_PATH} bulunamadı!")
+        return
+
+    if os.path.exists(SCALER_PATH):
+        scaled = transform_scaled(data_path, SCALER_PATH)
+    else:
+        print("⚠️ UYARI: Kayıtlı Scaler bulunamadı, veri üzerinde yeni scaler uyduruluyor...")
+        scaled = fit_scaled(data_path)
+    X_scaled, y = scaled['X_scaled'], scaled['y']
+
+    if os.path.exists(SPLIT_PATH):
+        try:
+            split = load_split(SPLIT_PATH, data_path)
+        except ValueError as e:
+            print(f"❌ HATA: {e}")
+            return
+    else:
+        print(f"⚠️ UYARI: {SPLIT_PATH} bulunamadı, bölme random_state=42 ile hesaplanıyor...")
+        split = split_indices(data_path, len(y))
+    X_train, X_test = X_scaled[split['train_idx']], X_scaled[split['test_idx']]
+    y_train, y_test = y[split['train_idx']], y[split['test_idx']]
+    print(f"📊 Eğitim Verisi: {len(X_train)} adet")
+
+    # 2. Eğit (tüm çekirdeklerle) ve test kümesinde kısa bir kontrol yap
+    fingerprint = input_fingerprint(data_path, SCALER_PATH, SPLIT_PATH)
+    trained_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    models, metadata = {}, {}
+    for name in names:
+        result = fit_predict(name, X_train, y_train, X_test, params.get(name), n_jobs=n_jobs)
+        models[name] = result['model']
+        metadata[name] = {
+            **fingerprint,
+            'params': {**DEFAULT_PARAMS[name], **params.get(name, {})},
+            'fit_seconds': result['fit_seconds'],
+            'n_train': int(len(X_train)),
+            'trained_at': trained_at,
+            'sklearn_version': sklearn.__version__,
+            'test_metrics': score(y_test, result['y_prob']),
+        }
+        print(f"🔹 {display_name(name)}: {result['fit_seconds']:.2f} sn, "
+              f"test AUC {metadata[name]['test_metrics']['auc']:.4f}")
+
+    # 3. (İsteğe bağlı) Eğitim kümesinde K katlı çapraz doğrulama; özet metadata'ya yazılır
+    # cv_strategy: 'random' (StratifiedKFold) ya da mekânsal / zamansal bloklar (block_cv.py)
+    if cv_folds > 1:
+        if cv_strategy == 'random':
+            cv_results = cross_validate(list(names), X_train, y_train, folds=cv_folds, n_jobs=n_jobs,
+                                        params=params)
+        else:
+            try:
+                splits = block_splits(block_arrays(data_path, cv_strategy), y, cv_strategy, cv_folds,
+                                      rows=split['train_idx'], **(block_options or {}))
+            except ValueError as e:
+                print(f"❌ HATA: {e}")
+                return
+            cv_results = cross_validate(list(names), X_scaled, y, n_jobs=n_jobs, params=params, splits=splits)
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        cv_results.to_csv(CV_RESULTS_PATH, index=False)
+        summary = summarize(cv_results)
+        print_cv_table(summary, cv_folds, title=f"ÇAPRAZ DOĞRULAMA [{cv_strategy}]")
+        for name in names:
+            metadata[name]['cv'] = {'folds': cv_folds, 'strategy': cv_strategy, **summary.loc[name].to_dict()}
+
+    folder = save_baselines(models, metadata)
+    print(f"💾 Modeller kaydedildi: {folder}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LR ve RF karşılaştırma modellerini eğitip kaydeder.")
+    parser.add_argument('--models', nargs='+', choices=list(BASELINES), default=list(BASELINES))
+    parser.add_argument('--params', default=None,
+                        help="Varsayılanları değiştiren JSON dosyası ({model: {param: değer}})")
+    parser.add_argument('--cv', type=int, default=0, metavar='K',
+                        help=f"K katlı çapraz doğrulama (örn. {CV_FOLDS}; 0: kapalı)")
+    parser.add_argument('--cv-strategy', choices=STRATEGIES, default='random',
+                        help="Katlar: rastgele ya da mekânsal / zamansal bloklar")
+    add_block_arguments(parser)
+    parser.add_argument('--n-jobs', type=int, default=N_JOBS,
+                        help="Kullanılacak çekirdek sayısı (-1: tümü)")
+    args = parser.parse_args()
+
+    params = None
+    if args.params:
+        with open(args.params) as f:
+            params = json.load(f)
+    train_baselines(names=args.models, params=params, cv_folds=args.cv, n_jobs=args.n_jobs,
+                    cv_strategy=args.cv_strategy,
+                    block_options={'tile_degrees': args.tile_degrees, 'block_days': args.block_days,
+                                   'buffer': args.buffer})
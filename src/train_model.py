@@ -1,90 +1,215 @@
-import pandas as pd
 import numpy as np
 import tensorflow as tf
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import MinMaxScaler
 import joblib
+import json
 import os
+import argparse
+from sklearn.model_selection import train_test_split
+
+from src.dataset_store import open_dataset
+from src.prepared_data import fit_scaled, fit_sequences, split_indices, save_split, FEATURES, RANDOM_STATE
+from src.stage_cache import stage_key
+from src.raster_backend import LOCAL_RASTER_FOLDER
+from src.input_pipeline import make_dataset, EpochTimer, benchmark_input_pipelines
+from src.checkpointing import TrainingCheckpoint, CHECKPOINT_FOLDER, PATIENCE
+from src.block_cv import STRATEGIES, add_block_arguments
 
 # --- AYARLAR ---
-DATA_PATH = 'data/Antalya_Merged_Dataset.csv'
+DATA_NAME = 'Antalya_Merged_Dataset'  # data/store/ altındaki tipli sütunlu depo
+DATA_PATH = 'data/Antalya_Merged_Dataset.csv'  # Depo yoksa buradan içe aktarılır
 MODEL_SAVE_PATH = 'models/fire_prediction_model.h5'
 SCALER_SAVE_PATH = 'models/scaler.pkl'
+SPLIT_SAVE_PATH = 'models/split_indices.npz'
+MODEL_CONFIG_PATH = 'models/model_config.json'
+
+# Zaman adımı sayısı: 1 = anlık veri (her nokta tek ölçüm),
+# >1 = noktanın tarihinden önceki N MODIS kompoziti (yerel rasterlar ve lon/lat gerekir)
+SEQUENCE_STEPS = 1
+
+# Mimari (bkz. src/sweep.py ile arama)
+LSTM_UNITS = (64, 32)
+DROPOUT = 0.2
+
+EPOCHS = 50       # Üst sınır: val_loss PATIENCE epoch iyileşmezse eğitim erken durur
+BATCH_SIZE = 32
+# Erken durdurma / en iyi epoch seçimi için eğitim kümesinden ayrılan doğrulama oranı.
+# Test kümesi yalnızca en sonda, seçilen ağırlıklarla bir kez ölçülür.
+VAL_SIZE = 0.1
 
 # Klasörleri oluştur (Yoksa hata verir)
 os.makedirs('models', exist_ok=True)
 
-def train_lstm_model():
+def build_lstm_model(timesteps, n_features, units=LSTM_UNITS, dropout=DROPOUT):
+    model = Sequential()
+    
+    # Katman 1: LSTM
+    model.add(LSTM(units[0], return_sequences=True, input_shape=(timesteps, n_features)))
+    model.add(Dropout(dropout)) # Ezberlemeyi önlemek için bir kısmını unut (varsayılan %20)
+    
+    # Katman 2: LSTM
+    model.add(LSTM(units[1]))
+    model.add(Dropout(dropout))
+    
+    # Katman 3: Çıktı (Sigmoid: 0 ile 1 arası olasılık verir)
+    model.add(Dense(1, activation='sigmoid'))
+
+    # Modeli Derle
+    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+    return model
+
+def train_lstm_model(sequence_steps=SEQUENCE_STEPS, raster_folder=LOCAL_RASTER_FOLDER,
+                     epochs=EPOCHS, batch_size=BATCH_SIZE, input_pipeline='tfdata', benchmark=False,
+                     patience=PATIENCE, resume=False, units=LSTM_UNITS, dropout=DROPOUT,
+                     split_strategy='random', block_options=None):
     print("🚀 Model eğitimi başlıyor...")
 
-    # 1. Veriyi Yükle
-    if not os.path.exists(DATA_PATH):
+    # 1. Veriyi Yükle (sütunlu depodan, yalnızca gereken sütunlar)
+    try:
+        data_path = open_dataset(DATA_NAME, DATA_PATH)
+    except FileNotFoundError:
         print(f"❌ HATA: {DATA_PATH} bulunamadı!")
         return
-
-    df = pd.read_csv(DATA_PATH)
     
-    # Giriş (X) ve Çıkış (y) olarak ayır
-    # ACQ_DATE'i şimdilik eğitime katmıyoruz (İleride zaman serisi olarak ekleyebiliriz)
-    X = df[['LST', 'NDVI', 'elevation']].values
-    y = df['label'].values
-
     # 2. Veriyi Ölçekle (0-1 arasına getir)
     # LSTM modelleri büyük sayılarla (örn: 15000) zor çalışır, o yüzden küçültüyoruz.
-    scaler = MinMaxScaler()
-    X_scaled = scaler.fit_transform(X)
+    # Giriş (X): LST, NDVI, elevation | Çıkış (y): label
+    # Veri değişmediyse ölçeklenmiş diziler önbellekten (data/cache) gelir.
+    # 3. LSTM İçin Boyutlandır: [Örnek Sayısı, Zaman Adımı, Özellik Sayısı]
+    if sequence_steps > 1:
+        # Gerçek zaman serisi: noktanın ACQ_DATE'inden önceki N kompozit (LST/NDVI)
+        print(f"🧮 Zaman serileri oluşturuluyor ({sequence_steps} adım)...")
+        try:
+            scaled = fit_sequences(data_path, raster_folder, sequence_steps)
+        except (ValueError, FileNotFoundError) as e:
+            print(f"❌ HATA: {e}")
+            return
+        X_reshaped, y, scaler, valid = scaled['X_seq'], scaled['y'], scaled['scaler'], scaled['valid']
+    else:
+        # Anlık veri: Zaman Adımı = 1
+        scaled = fit_scaled(data_path)
+        X_scaled, y, scaler = scaled['X_scaled'], scaled['y'], scaled['scaler']
+        X_reshaped = X_scaled.reshape((X_scaled.shape[0], 1, X_scaled.shape[1]))
+        valid = np.ones(len(y), dtype=bool)
 
     # Scaler'ı kaydet (Daha sonra tahmin yaparken lazım olacak)
     joblib.dump(scaler, SCALER_SAVE_PATH)
     print("✅ Veriler normalize edildi ve Scaler kaydedildi.")
 
-    # 3. LSTM İçin Boyutlandır (Reshape)
-    # LSTM [Örnek Sayısı, Zaman Adımı, Özellik Sayısı] formatı ister.
-    # Bizim verimiz anlık olduğu için Zaman Adımı = 1 diyoruz.
-    X_reshaped = X_scaled.reshape((X_scaled.shape[0], 1, X_scaled.shape[1]))
+    # 4. Eğitim ve Test Setine Ayır (%80 Eğitim, %20 Test, random_state=42; indeksler önbellekli)
+    # split_strategy: 'random' ya da mekânsal / zamansal bloklar (test blokları eğitimde yok)
+    # Zaman serisi kurulamayan noktalar (ROI dışı / geçmişi boş) iki kümeden de çıkarılır.
+    try:
+        split = split_indices(data_path, len(y), strategy=split_strategy, **(block_options or {}))
+    except ValueError as e:
+        print(f"❌ HATA: {e}")
+        return
+    split = {name: idx[valid[idx]] for name, idx in split.items()}
+    # İndeksleri scaler'ın yanına kaydet: değerlendirme AYNI test setini yeniden bölmeden kullanır
+    save_split(SPLIT_SAVE_PATH, split, data_path)
 
-    # 4. Eğitim ve Test Setine Ayır (%80 Eğitim, %20 Test)
-    X_train, X_test, y_train, y_test = train_test_split(X_reshaped, y, test_size=0.2, random_state=42)
+    # Doğrulama kümesi eğitim indekslerinden ayrılır (test kümesi epoch seçiminde kullanılmaz)
+    fit_idx, val_idx = train_test_split(split['train_idx'], test_size=VAL_SIZE, random_state=RANDOM_STATE)
+    X_train, X_val, X_test = X_reshaped[fit_idx], X_reshaped[val_idx], X_reshaped[split['test_idx']]
+    y_train, y_val, y_test = y[fit_idx], y[val_idx], y[split['test_idx']]
 
     print(f"📊 Eğitim Verisi: {X_train.shape[0]} adet")
+    print(f"📊 Doğrulama Verisi: {X_val.shape[0]} adet")
     print(f"📊 Test Verisi: {X_test.shape[0]} adet")
 
     # 5. LSTM Modelini Kur
-    model = Sequential()
-    
-    # Katman 1: LSTM
-    model.add(LSTM(64, return_sequences=True, input_shape=(1, 3)))
-    model.add(Dropout(0.2)) # Ezberlemeyi önlemek için %20'sini unut
-    
-    # Katman 2: LSTM
-    model.add(LSTM(32))
-    model.add(Dropout(0.2))
-    
-    # Katman 3: Çıktı (Sigmoid: 0 ile 1 arası olasılık verir)
-    model.add(Dense(1, activation='sigmoid'))
-
-    # Modeli Derle
-    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+    # Ara kayıtlar yalnızca aynı veri ve ayarlarla eğitilmiş bir çalıştırmadan devam eder
+    run_key = stage_key('train', [data_path], {'sequence_steps': sequence_steps, 'features': FEATURES,
+                                               'raster_folder': raster_folder, 'batch_size': batch_size,
+                                               'units': list(units), 'dropout': dropout,
+                                               'val_size': VAL_SIZE, 'split': split_strategy,
+                                               **(block_options or {})})
+    checkpoint = TrainingCheckpoint(run_key, CHECKPOINT_FOLDER, patience=patience)
+    restored = checkpoint.restore() if resume else None
+    if restored is None:
+        checkpoint.reset()
+        model, initial_epoch = build_lstm_model(sequence_steps, len(FEATURES), units, dropout), 0
+    else:
+        model, initial_epoch = restored
     
     print("\n🧠 Model eğitiliyor... (Bu işlem biraz sürebilir)")
+
+    if benchmark:
+        # Aynı mimariyle NumPy ve tf.data yollarının epoch sürelerini karşılaştır
+        benchmark_input_pipelines(lambda: build_lstm_model(sequence_steps, len(FEATURES), units, dropout),
+                                  X_train, y_train, X_val, y_val, batch_size=batch_size)
     
-    # 6. Eğitimi Başlat
-    history = model.fit(
-        X_train, y_train,
-        epochs=50,          # Veriyi kaç kere baştan sona döneceği
-        batch_size=32,      # Her seferinde kaç veriyi işleyeceği
-        validation_data=(X_test, y_test),
-        verbose=1
-    )
-
-    # 7. Sonuçları Göster ve Kaydet
+    # 6. Eğitimi Başlat (val_loss iyileşmeyi bırakınca durur, her epoch ara kayıt alınır)
+    epoch_timer = EpochTimer()
+    callbacks = [epoch_timer, checkpoint]
+    if checkpoint.stopped or initial_epoch >= epochs:
+        print("ℹ️ Ara kayıttaki eğitim zaten tamamlanmış, eğitim atlanıyor.")
+    elif input_pipeline == 'tfdata':
+        # tf.data: cache + her epoch karıştırma + batch + prefetch (veri hazırlığı ile hesap örtüşür)
+        model.fit(
+            make_dataset(X_train, y_train, batch_size),
+            epochs=epochs,
+            initial_epoch=initial_epoch,
+            validation_data=make_dataset(X_val, y_val, batch_size, shuffle=False),
+            callbacks=callbacks,
+            verbose=1
+        )
+    else:
+        model.fit(
+            X_train, y_train,
+            epochs=epochs,          # Veriyi en fazla kaç kere baştan sona döneceği
+            initial_epoch=initial_epoch,
+            batch_size=batch_size,  # Her seferinde kaç veriyi işleyeceği
+            validation_data=(X_val, y_val),
+            callbacks=callbacks,
+            verbose=1
+        )
+    if epoch_timer.times:
+        print(f"⏱️ {len(epoch_timer.times)} epoch, ortalama epoch süresi ({input_pipeline}): "
+              f"{epoch_timer.steady_mean:.3f} sn")
+
+    # Son epoch yerine en düşük val_loss'lu (doğrulama kümesi) ağırlıklarla devam et
+    model = checkpoint.restore_best(model)
+
+    # 7. Sonuçları Göster ve Kaydet (test kümesi burada ilk kez görülür)
     loss, accuracy = model.evaluate(X_test, y_test)
     print(f"\n🏆 Test Başarısı (Accuracy): %{accuracy * 100:.2f}")
 
     model.save(MODEL_SAVE_PATH)
+    # Değerlendirme ve tahmin aynı girdi şeklini kurabilsin
+    with open(MODEL_CONFIG_PATH, 'w') as f:
+        json.dump({'sequence_steps': sequence_steps, 'features': FEATURES,
+                   'raster_folder': raster_folder, 'units': list(units), 'dropout': dropout}, f, indent=2)
     print(f"💾 Model kaydedildi: {MODEL_SAVE_PATH}")
 
 if __name__ == "__main__":
-    train_lstm_model()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="LSTM yangın riski modelini eğitir.")
+    parser.add_argument('--sequence-steps', type=int, default=SEQUENCE_STEPS,
+                        help="Nokta başına geçmiş kompozit sayısı (1: anlık veri)")
+    parser.add_argument('--raster-folder', default=LOCAL_RASTER_FOLDER,
+                        help="Zaman serileri için yerel raster klasörü")
+    parser.add_argument('--epochs', type=int, default=EPOCHS)
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--input-pipeline', choices=['tfdata', 'array'], default='tfdata',
+                        help="tf.data (cache + prefetch) ya da doğrudan NumPy dizileri")
+    parser.add_argument('--benchmark-input', action='store_true',
+                        help="Eğitimden önce iki girdi yolunun epoch sürelerini karşılaştır")
+    parser.add_argument('--units', type=int, nargs=2, default=list(LSTM_UNITS),
+                        help="İki LSTM katmanının birim sayıları")
+    parser.add_argument('--dropout', type=float, default=DROPOUT)
+    parser.add_argument('--patience', type=int, default=PATIENCE,
+                        help="val_loss bu kadar epoch iyileşmezse eğitimi durdur")
+    parser.add_argument('--resume', action='store_true',
+                        help=f"{CHECKPOINT_FOLDER} altındaki son ara kayıttan devam et")
+    parser.add_argument('--split', choices=STRATEGIES, default='random',
+                        help="Eğitim / test bölmesi: rastgele ya da mekânsal / zamansal bloklar")
+    add_block_arguments(parser)
+    args = parser.parse_args()
+    train_lstm_model(sequence_steps=args.sequence_steps, raster_folder=args.raster_folder,
+                     epochs=args.epochs, batch_size=args.batch_size,
+                     input_pipeline=args.input_pipeline, benchmark=args.benchmark_input,
+                     patience=args.patience, resume=args.resume,
+                     units=tuple(args.units), dropout=args.dropout, split_strategy=args.split,
+                     block_options={'tile_degrees': args.tile_degrees, 'block_days': args.block_days,
+                                    'buffer': args.buffer})
\ No newline at end of file
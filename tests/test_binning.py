@@ -0,0 +1,62 @@
+"""src.ingest.binning.bin_detections: (hücre, gün kovası) birleştirmesi."""
+import numpy as np
+import pandas as pd
+
+from src.ingest.binning import bin_detections, BIN_COLUMNS
+from src.raster_backend import DAY_MS
+
+WEST, NORTH, CELL = 30.0, 37.0, 0.01
+DAY = 19000 * DAY_MS  # Çift gün: bin_days=2 kovasının başı
+
+
+def _points(rows):
+    return pd.DataFrame(rows, columns=['lon', 'lat', 'ACQ_DATE', 'brightness'])
+
+
+def test_same_cell_same_day_collapses_to_first_detection():
+    points = _points([
+        (30.0012, 36.9987, DAY + 5 * 3600_000, 310.0),
+        (30.0047, 36.9951, DAY + 1 * 3600_000, 330.0),   # Aynı hücre, daha erken
+        (30.0095, 36.9905, DAY + 9 * 3600_000, 320.0),
+    ])
+    bins = bin_detections(points, WEST, NORTH, CELL)
+    assert len(bins) == 1
+    row = bins.iloc[0]
+    assert row['ACQ_DATE'] == DAY + 1 * 3600_000
+    assert row['detections'] == 3
+    assert row['brightness_mean'] == 320.0
+    assert row['brightness_max'] == 330.0
+    assert np.isnan(row['confidence_mean'])
+    assert row['label'] == 1
+    # Konum hücre merkezi
+    assert np.isclose(row['lon'], WEST + 0.5 * CELL)
+    assert np.isclose(row['lat'], NORTH - 0.5 * CELL)
+
+
+def test_other_day_or_cell_stays_separate():
+    points = _points([
+        (30.0012, 36.9987, DAY, 310.0),
+        (30.0012, 36.9987, DAY + DAY_MS, 311.0),          # Ertesi gün
+        (30.0112, 36.9987, DAY, 312.0),                   # Komşu hücre
+    ])
+    bins = bin_detections(points, WEST, NORTH, CELL)
+    assert len(bins) == 3
+    assert (bins['detections'] == 1).all()
+    assert list(bins.columns) == ['lon', 'lat', 'label', 'ACQ_DATE'] + BIN_COLUMNS
+
+
+def test_multi_day_bins():
+    points = _points([
+        (30.0012, 36.9987, DAY + DAY_MS, 310.0),
+        (30.0012, 36.9987, DAY, 300.0),
+        (30.0012, 36.9987, DAY + 2 * DAY_MS, 320.0),      # Sonraki 2 günlük kova
+    ])
+    bins = bin_detections(points, WEST, NORTH, CELL, bin_days=2)
+    assert bins['ACQ_DATE'].tolist() == [DAY, DAY + 2 * DAY_MS]
+    assert bins['detections'].tolist() == [2, 1]
+
+
+def test_empty_input():
+    bins = bin_detections(_points([]), WEST, NORTH, CELL)
+    assert bins.empty
+    assert list(bins.columns) == ['lon', 'lat', 'label', 'ACQ_DATE'] + BIN_COLUMNS
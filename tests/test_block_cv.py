@@ -0,0 +1,90 @@
+"""src.block_cv: blok katları ve tampon (TensorFlow gerekmez)."""
+import numpy as np
+import pytest
+
+from src.block_cv import block_splits, block_coordinates, _apply_buffer
+from src.raster_backend import ROI_BOUNDS, DAY_MS
+
+WEST, NORTH = ROI_BOUNDS[0], ROI_BOUNDS[3]
+TILE = 0.05
+
+
+def _dataset(n_cols=40, n_days=40, per_block=6, block_days=1):
+    """Tek enlem şeridinde n_cols karo x n_days gün; her blokta iki sınıf da var."""
+    col, day, k = np.meshgrid(np.arange(n_cols), np.arange(n_days), np.arange(per_block), indexing='ij')
+    col, day, k = col.ravel(), day.ravel(), k.ravel()
+    rng = np.random.default_rng(0)
+    arrays = {
+        'lon': WEST + (col + rng.uniform(0.1, 0.9, len(col))) * TILE,
+        'lat': NORTH - rng.uniform(0.1, 0.9, len(col)) * TILE,
+        'ACQ_DATE': (19000 + day * block_days) * DAY_MS + rng.integers(0, DAY_MS, len(col)),
+    }
+    return arrays, (k % 2).astype(np.int64)
+
+
+def _check_disjoint(arrays, y, strategy, buffer, folds=5):
+    splits = block_splits(arrays, y, strategy, folds=folds, tile_degrees=TILE, block_days=1, buffer=buffer)
+    coords = block_coordinates(arrays, strategy, TILE, 1)
+    assert len(splits) == folds
+    tested = np.concatenate([test_idx for _, test_idx in splits])
+    assert np.array_equal(np.sort(tested), np.arange(len(y)))
+    for train_idx, test_idx in splits:
+        assert len(np.intersect1d(train_idx, test_idx)) == 0
+        # Eğitim bloklarının test bloklarına uzaklığı (her boyutta) tampondan büyük
+        train_blocks = np.unique(coords[train_idx], axis=0)
+        test_blocks = np.unique(coords[test_idx], axis=0)
+        distance = np.abs(train_blocks[:, None, :] - test_blocks[None, :, :]).max(axis=2)
+        assert distance.min() > buffer
+        assert set(np.unique(y[train_idx])) == {0, 1}
+
+
+@pytest.mark.parametrize('strategy', ['spatial', 'temporal', 'spatiotemporal'])
+@pytest.mark.parametrize('buffer', [0, 1])
+def test_blocks_never_shared(strategy, buffer):
+    arrays, y = _dataset()
+    _check_disjoint(arrays, y, strategy, buffer)
+
+
+def test_random_strategy_partitions_rows():
+    arrays, y = _dataset(n_cols=5, n_days=5)
+    splits = block_splits({}, y, 'random', folds=5)
+    tested = np.concatenate([test_idx for _, test_idx in splits])
+    assert np.array_equal(np.sort(tested), np.arange(len(y)))
+    for train_idx, test_idx in splits:
+        assert len(train_idx) + len(test_idx) == len(y)
+
+
+def test_rows_subset():
+    arrays, y = _dataset()
+    rows = np.arange(0, len(y), 3)
+    splits = block_splits(arrays, y, 'spatial', folds=4, rows=rows, tile_degrees=TILE)
+    tested = np.concatenate([test_idx for _, test_idx in splits])
+    assert np.array_equal(np.sort(tested), rows)
+    for train_idx, _ in splits:
+        assert np.isin(train_idx, rows).all()
+
+
+def test_apply_buffer_drops_neighbours():
+    coords = np.arange(10).reshape(-1, 1)
+    train_idx, test_idx = np.array([0, 1, 2, 3, 4, 6, 7, 8, 9]), np.array([5])
+    assert _apply_buffer(train_idx, test_idx, coords, 0).tolist() == train_idx.tolist()
+    assert _apply_buffer(train_idx, test_idx, coords, 1).tolist() == [0, 1, 2, 3, 7, 8, 9]
+    assert _apply_buffer(train_idx, test_idx, coords, 2).tolist() == [0, 1, 2, 8, 9]
+
+
+def test_apply_buffer_2d_includes_diagonals():
+    coords = np.array([[r, c] for r in range(3) for c in range(3)])  # 3x3 blok, orta test
+    train_idx, test_idx = np.delete(np.arange(9), 4), np.array([4])
+    assert len(_apply_buffer(train_idx, test_idx, coords, 1)) == 0
+
+
+def test_too_few_blocks():
+    arrays, y = _dataset(n_cols=2, n_days=1)
+    with pytest.raises(ValueError, match='blok'):
+        block_splits(arrays, y, 'spatial', folds=5, tile_degrees=TILE)
+
+
+def test_spatial_needs_coordinates():
+    arrays, y = _dataset(n_cols=5, n_days=5)
+    with pytest.raises(ValueError, match='lon'):
+        block_splits({'ACQ_DATE': arrays['ACQ_DATE']}, y, 'spatial', tile_degrees=TILE)
@@ -0,0 +1,72 @@
+"""src.checkpointing.TrainingCheckpoint: erken durdurma, en iyi ağırlıklar ve devam durumu."""
+import numpy as np
+import pytest
+
+tf = pytest.importorskip('tensorflow')
+
+from src.checkpointing import TrainingCheckpoint  # noqa: E402
+
+
+def _model(seed=0):
+    tf.keras.utils.set_random_seed(seed)
+    model = tf.keras.Sequential([tf.keras.Input(shape=(3,)), tf.keras.layers.Dense(1)])
+    model.compile(optimizer='adam', loss='mse')
+    return model
+
+
+def _run(checkpoint, model, losses, start=0):
+    """Eğitimsiz: her epoch'ta ağırlıkları değiştirip verilen val_loss ile callback'i çağırır."""
+    checkpoint.set_model(model)
+    for epoch, loss in enumerate(losses, start):
+        model.layers[0].bias.assign([float(epoch)])
+        checkpoint.on_epoch_end(epoch, {'val_loss': loss})
+        if model.stop_training:
+            return epoch
+    return None
+
+
+def test_early_stop_and_restore_best(tmp_path):
+    checkpoint = TrainingCheckpoint('run', str(tmp_path), patience=2)
+    checkpoint.reset()
+    model = _model()
+    stopped_at = _run(checkpoint, model, [1.0, 0.5, 0.6, 0.7, 0.2])
+    assert stopped_at == 3 and checkpoint.stopped
+    assert checkpoint.best_epoch == 1 and checkpoint.best == 0.5
+    checkpoint.restore_best(model)
+    assert model.layers[0].bias.numpy()[0] == 1.0
+
+
+def test_never_improving_loss(tmp_path, capsys):
+    checkpoint = TrainingCheckpoint('run', str(tmp_path), patience=2)
+    checkpoint.reset()
+    model = _model()
+    assert _run(checkpoint, model, [np.nan, np.nan, np.nan]) == 1
+    assert checkpoint.best_epoch is None
+    # En iyi ağırlık hiç kaydedilmedi: son epoch'un ağırlıkları korunur
+    checkpoint.restore_best(model)
+    assert model.layers[0].bias.numpy()[0] == 1.0
+    assert 'hiç' in capsys.readouterr().out
+
+
+def test_resume_restores_state(tmp_path):
+    checkpoint = TrainingCheckpoint('run', str(tmp_path), patience=3)
+    checkpoint.reset()
+    model = _model()
+    _run(checkpoint, model, [1.0, 0.5, 0.6])
+
+    resumed = TrainingCheckpoint('run', str(tmp_path), patience=3)
+    restored, initial_epoch = resumed.restore()
+    assert initial_epoch == 3
+    assert (resumed.best, resumed.best_epoch, resumed.wait, resumed.stopped) == (0.5, 1, 1, False)
+    assert restored.layers[0].bias.numpy()[0] == 2.0
+
+    # Sabır sayacı kaldığı yerden: iki iyileşmeyen epoch daha durdurur
+    assert _run(resumed, restored, [0.7, 0.8], start=initial_epoch) == 4
+
+
+def test_resume_ignores_other_run_key(tmp_path):
+    checkpoint = TrainingCheckpoint('run-a', str(tmp_path))
+    checkpoint.reset()
+    _run(checkpoint, _model(), [1.0])
+    assert TrainingCheckpoint('run-b', str(tmp_path)).restore() is None
+    assert TrainingCheckpoint('run-a', str(tmp_path / 'yok')).restore() is None
@@ -0,0 +1,108 @@
+"""src.export_chunks: tarih parçaları ve manifestle devam ettirme."""
+import json
+
+import pytest
+
+from src.export_chunks import split_date_range, export_chunked, ExportManifest
+
+
+def test_split_by_month():
+    assert split_date_range('2021-07-15', '2021-09-10') == [
+        ('2021-07-15', '2021-08-01'), ('2021-08-01', '2021-09-01'), ('2021-09-01', '2021-09-10')]
+
+
+def test_split_by_week_starts_on_monday():
+    # 2021-07-01 perşembe; sonraki pazartesi 2021-07-05
+    assert split_date_range('2021-07-01', '2021-07-20', 'week') == [
+        ('2021-07-01', '2021-07-05'), ('2021-07-05', '2021-07-12'), ('2021-07-12', '2021-07-19'),
+        ('2021-07-19', '2021-07-20')]
+
+
+def test_split_single_and_empty_range():
+    assert split_date_range('2021-07-01', '2021-07-10') == [('2021-07-01', '2021-07-10')]
+    assert split_date_range('2021-07-10', '2021-07-10') == []
+    with pytest.raises(ValueError):
+        split_date_range('2021-07-01', '2021-08-01', 'day')
+
+
+class FakeTask:
+    def __init__(self, task_id, state):
+        self.task_id, self.state = task_id, state
+
+    def status(self):
+        return {'id': self.task_id, 'state': self.state}
+
+
+class FakeBackend:
+    """Gönderilen parçaları kaydeder; fail içindeki parçalar hata verir."""
+    name = 'fake'
+    roi_bounds = [29.2, 36.0, 32.5, 37.5]
+
+    def __init__(self, state='COMPLETED', fail=()):
+        self.state, self.fail = state, set(fail)
+        self.submitted = []
+
+    def export_table(self, collection, description, selectors=None):
+        if description in self.fail:
+            raise RuntimeError('kota')
+        self.submitted.append(description)
+        return FakeTask(f'task-{description}', self.state)
+
+    def task_state(self, task_id):
+        return self.state
+
+
+def _build(backend, start, end):
+    return (start, end)
+
+
+def _export(backend, tmp_path, **kwargs):
+    return export_chunked(backend, _build, '2021-07-01', '2021-10-01', 'fire',
+                          manifest_path=str(tmp_path / 'manifest.json'), max_workers=2, **kwargs)
+
+
+def test_resume_skips_completed_and_retries_failed(tmp_path):
+    backend = FakeBackend(fail={'fire_20210801_20210901'})
+    manifest = _export(backend, tmp_path)
+    assert sorted(backend.submitted) == ['fire_20210701_20210801', 'fire_20210901_20211001']
+    assert manifest.get('2021-08-01_2021-09-01')['state'] == 'FAILED'
+
+    backend = FakeBackend()
+    manifest = _export(backend, tmp_path)
+    assert backend.submitted == ['fire_20210801_20210901']
+    assert manifest.pending(manifest.chunks) == []
+    with open(tmp_path / 'manifest.json') as f:
+        assert len(json.load(f)['chunks']) == 3
+
+
+def test_running_chunks_are_not_resubmitted(tmp_path):
+    _export(FakeBackend(state='RUNNING'), tmp_path)
+    backend = FakeBackend(state='RUNNING')
+    _export(backend, tmp_path)
+    assert backend.submitted == []
+
+
+def test_changed_parameters_resubmit_completed_chunks(tmp_path):
+    _export(FakeBackend(), tmp_path, selectors=['a'], params={'binning': True, 'cell_pixels': 1})
+    backend = FakeBackend()
+    _export(backend, tmp_path, selectors=['a'], params={'binning': True, 'cell_pixels': 1})
+    assert backend.submitted == []
+
+    for kwargs in [{'selectors': ['a'], 'params': {'binning': True, 'cell_pixels': 2}},
+                   {'selectors': ['a', 'b'], 'params': {'binning': True, 'cell_pixels': 2}}]:
+        backend = FakeBackend()
+        _export(backend, tmp_path, **kwargs)
+        assert len(backend.submitted) == 3
+
+    backend = FakeBackend()
+    backend.roi_bounds = [30.0, 36.0, 31.0, 37.0]
+    _export(backend, tmp_path, selectors=['a', 'b'], params={'binning': True, 'cell_pixels': 2})
+    assert len(backend.submitted) == 3
+
+
+def test_changed_parameters_refuse_while_running(tmp_path):
+    _export(FakeBackend(state='RUNNING'), tmp_path, params={'binning': True})
+    with pytest.raises(RuntimeError, match='hâlâ çalışıyor'):
+        _export(FakeBackend(state='RUNNING'), tmp_path, params={'binning': False})
+    assert set(ExportManifest(str(tmp_path / 'manifest.json')).chunks) == {
+        '2021-07-01_2021-08-01', '2021-08-01_2021-09-01', '2021-09-01_2021-10-01'}
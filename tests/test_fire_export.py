@@ -0,0 +1,81 @@
+"""src.ingest.fire: kovalanmış yangın tablosunun dışa aktarılan sütunları."""
+import numpy as np
+import pandas as pd
+
+from src.ingest.fire import build_fire_dataset, export_fire_dataset, export_selectors
+from src.ingest.binning import BIN_COLUMNS
+from src.raster_backend import LocalRasterBackend, EXPORT_SELECTORS, FEATURES, DAY_MS, ROI_BOUNDS
+
+DAY = pd.Timestamp('2021-07-10').value // 1_000_000
+
+
+def _local_backend(export_folder):
+    fire = np.zeros((2, 4, 4), dtype=np.float32)
+    fire[0, 1, 1] = fire[0, 2, 2] = 320.0
+    fire[1, 1, 1] = 330.0  # Aynı gün, aynı hücre: tek kovaya düşer
+    stack = np.full((1, 4, 4), 300.0, dtype=np.float32)
+    return LocalRasterBackend(stack, [DAY - DAY_MS], stack / 1000, [DAY - DAY_MS],
+                              np.full((4, 4), 100.0, dtype=np.float32), fire=fire,
+                              fire_dates=[DAY, DAY + 3600_000], export_folder=str(export_folder))
+
+
+class SampleRegionsBackend:
+    """
+    Earth Engine get_features davranışı: sampleRegions yalnızca istenen özellikleri korur,
+    öznitelikler ve lon / lat eklenir. Kovalama yerel yoldan (bin_detections) yapılır.
+    """
+    name = 'fake'
+    west, north, pixel_size = ROI_BOUNDS[0], ROI_BOUNDS[3], 0.01
+
+    def __init__(self, detections):
+        self.detections = detections
+        self.exported = None
+
+    def fire_points(self, start_date, end_date):
+        return self.detections
+
+    def get_features(self, points, properties=('label', 'ACQ_DATE')):
+        sampled = points[list(properties)].copy()
+        for column in FEATURES:
+            sampled[column] = 1.0
+        sampled['lon'], sampled['lat'] = points['lon'], points['lat']
+        return sampled
+
+    def drop_nulls(self, points):
+        return points
+
+    def export_table(self, points, description, selectors=EXPORT_SELECTORS):
+        self.exported = points[selectors]
+        return None
+
+
+def _detections():
+    return pd.DataFrame({'lon': [29.2012, 29.2015, 29.2312], 'lat': [37.4987, 37.4985, 37.4987],
+                         'ACQ_DATE': [DAY, DAY + 3600_000, DAY], 'brightness': [310.0, 330.0, 300.0],
+                         'confidence': [80.0, 90.0, 70.0], 'label': 1})
+
+
+def test_binned_export_keeps_statistics_through_sampling():
+    backend = SampleRegionsBackend(_detections())
+    export_fire_dataset(backend, '2021-07-01', '2021-08-01', binning=True)
+    assert list(backend.exported.columns) == EXPORT_SELECTORS + BIN_COLUMNS
+    assert sorted(backend.exported['detections'].tolist()) == [1, 2]
+    assert sorted(backend.exported['confidence_mean'].tolist()) == [70.0, 85.0]
+
+
+def test_unbinned_export_has_base_columns():
+    backend = SampleRegionsBackend(_detections())
+    export_fire_dataset(backend, '2021-07-01', '2021-08-01', binning=False)
+    assert list(backend.exported.columns) == EXPORT_SELECTORS
+    assert len(backend.exported) == 3
+
+
+def test_local_binned_export_columns(tmp_path):
+    backend = _local_backend(tmp_path)
+    dataset = build_fire_dataset(backend, '2021-07-01', '2021-08-01', binning=True)
+    assert len(dataset) == 2
+    export_fire_dataset(backend, '2021-07-01', '2021-08-01', description='fire', binning=True)
+    table = pd.read_csv(tmp_path / 'fire.csv')
+    assert list(table.columns) == export_selectors(True)
+    assert sorted(table['detections'].tolist()) == [1, 2]
+    assert table['brightness_max'].max() == 330.0
@@ -0,0 +1,63 @@
+"""src.incremental: sonraki pencere ve tekrar atan ekleme."""
+import pandas as pd
+
+from src.incremental import next_window, append_dedup
+from src.raster_backend import DAY_MS
+
+DAY = pd.Timestamp('2021-07-10').value // 1_000_000
+
+
+def _table(dates, lst=300.0, **extra):
+    return pd.DataFrame({'label': 1, 'LST': lst, 'NDVI': 0.3, 'elevation': 100, 'ACQ_DATE': dates,
+                         'lon': 30.0, 'lat': 36.5, **extra})
+
+
+def test_next_window_without_table(tmp_path):
+    assert next_window(str(tmp_path / 'yok.csv'), '2021-08-01', '2021-07-01') == ('2021-07-01', '2021-08-01')
+
+
+def test_next_window_starts_after_latest_day(tmp_path):
+    path = str(tmp_path / 'fire.csv')
+    _table([DAY, DAY + 5 * DAY_MS + 3600_000]).to_csv(path, index=False)
+    assert next_window(path, '2021-08-01', '2021-07-01') == ('2021-07-16', '2021-08-01')
+    assert next_window(path, '2021-07-16', '2021-07-01') is None
+
+
+def test_append_dedup_drops_repeats_and_keeps_order(tmp_path):
+    path = str(tmp_path / 'fire.csv')
+    _table([DAY + DAY_MS, DAY]).to_csv(path, index=False)
+    added, total = append_dedup(path, _table([DAY, DAY + 2 * DAY_MS]))
+    assert (added, total) == (1, 3)
+    assert pd.read_csv(path)['ACQ_DATE'].tolist() == [DAY + DAY_MS, DAY, DAY + 2 * DAY_MS]
+
+
+def test_append_dedup_creates_table(tmp_path):
+    path = str(tmp_path / 'fire.csv')
+    new_path = str(tmp_path / 'new.csv')
+    _table([DAY, DAY]).to_csv(new_path, index=False)
+    assert append_dedup(path, new_path) == (1, 1)
+
+
+def test_append_dedup_empty_new_rows(tmp_path):
+    path = str(tmp_path / 'fire.csv')
+    _table([DAY, DAY + DAY_MS]).to_csv(path, index=False)
+    assert append_dedup(path, _table([]).iloc[0:0]) == (0, 2)
+
+
+def test_append_dedup_new_rows_missing_columns(tmp_path):
+    # Kovalanmış tabloya --no-binning ile (kova istatistikleri olmadan) ekleme
+    path = str(tmp_path / 'fire.csv')
+    _table([DAY], detections=3).to_csv(path, index=False)
+    assert append_dedup(path, _table([DAY + DAY_MS])) == (1, 2)
+    table = pd.read_csv(path)
+    assert list(table.columns) == list(_table([DAY], detections=3).columns)
+    assert table['detections'].isna().tolist() == [False, True]
+
+
+def test_append_dedup_new_rows_extra_columns(tmp_path):
+    path = str(tmp_path / 'fire.csv')
+    _table([DAY]).to_csv(path, index=False)
+    assert append_dedup(path, _table([DAY + DAY_MS], detections=2)) == (1, 2)
+    table = pd.read_csv(path)
+    assert list(table.columns)[-1] == 'detections'
+    assert table['detections'].isna().tolist() == [True, False]
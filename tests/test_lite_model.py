@@ -0,0 +1,77 @@
+"""src.lite_model: TFLite dışa aktarımının Keras ile eşliği ve çalışma zamanı seçimi."""
+import json
+
+import joblib
+import numpy as np
+import pytest
+
+tf = pytest.importorskip('tensorflow')
+
+from sklearn.preprocessing import MinMaxScaler  # noqa: E402
+
+from src.inference import FireRiskScorer, load_scorer, resolve_runtime  # noqa: E402
+from src.lite_model import export_tflite, LiteScorer, lite_path_for, is_fresh  # noqa: E402
+from src.train_model import build_lstm_model  # noqa: E402
+
+LOW, HIGH = np.array([13000.0, -2000.0, 0.0]), np.array([16000.0, 9000.0, 2500.0])
+
+
+def _raw(n, steps, seed):
+    return np.random.default_rng(seed).uniform(LOW, HIGH, (n, steps, 3)).astype(np.float32)
+
+
+def _save_scaler(path, seed):
+    joblib.dump(MinMaxScaler().fit(_raw(200, 1, seed)[:, 0]), path)
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Dosya özeti indeksi (data/cache) depoya değil geçici klasöre yazılsın."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(scope='module', params=[1, 3])
+def exported(request, tmp_path_factory):
+    steps = request.param
+    folder = tmp_path_factory.mktemp(f'model_{steps}')
+    tf.keras.utils.set_random_seed(steps)
+    paths = {'model': str(folder / 'model.h5'), 'scaler': str(folder / 'scaler.pkl'),
+             'config': str(folder / 'model_config.json')}
+    build_lstm_model(steps, 3, units=(8, 4)).save(paths['model'])
+    _save_scaler(paths['scaler'], seed=0)
+    with open(paths['config'], 'w') as f:
+        json.dump({'sequence_steps': steps}, f)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.chdir(folder)
+        export_tflite(paths['model'], paths['scaler'], paths['config'])
+    return steps, paths
+
+
+def test_tflite_matches_keras(exported):
+    steps, paths = exported
+    keras = FireRiskScorer(paths['model'], paths['scaler'], paths['config'])
+    lite = LiteScorer(lite_path_for(paths['model']))
+    assert lite.steps == keras.steps == steps
+    X = _raw(50, steps, seed=1)
+    for batch_size in (7, 64):  # Eksik son batch'in doldurulması dahil
+        keras.batch_size = lite.batch_size = batch_size
+        assert np.abs(lite.score(X) - keras.score(X)).max() < 1e-4
+    if steps == 1:
+        assert np.allclose(lite.score(X[:, 0, :]), lite.score(X))
+
+
+def test_runtime_follows_the_requested_model(exported, tmp_path):
+    steps, paths = exported
+    assert is_fresh(lite_path_for(paths['model']), paths['model'], paths['scaler'])
+    assert resolve_runtime('auto', paths['model'], paths['scaler']) == 'tflite'
+    assert isinstance(load_scorer('auto', paths['model'], paths['scaler'], paths['config']), LiteScorer)
+    assert resolve_runtime('keras', paths['model'], paths['scaler']) == 'keras'
+
+    # Başka bir scaler: dışa aktarım bu çift için güncel değil
+    other_scaler = str(tmp_path / 'other_scaler.pkl')
+    _save_scaler(other_scaler, seed=5)
+    assert resolve_runtime('auto', paths['model'], other_scaler) == 'keras'
+    scorer = load_scorer('auto', paths['model'], other_scaler, paths['config'])
+    assert type(scorer) is FireRiskScorer
+    with pytest.raises(ValueError, match='güncel değil'):
+        load_scorer('tflite', paths['model'], other_scaler, paths['config'])
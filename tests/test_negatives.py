@@ -0,0 +1,107 @@
+"""src.ingest.negatives: kota dağıtımı, yangın tamponu ve grup içi sıralar (Earth Engine gerekmez)."""
+import numpy as np
+import pytest
+
+from src.ingest.negatives import allocate, month_windows, FireExclusion, _group_ranks, _month_quotas
+from src.raster_backend import DAY_MS
+
+
+class FakeBackend:
+    """FireExclusion'ın kullandığı alanlar: fire, fire_dates, shape, pixel_size, pixel_center."""
+    name = 'local'
+
+    def __init__(self, fire, fire_dates, west=30.0, north=37.0, pixel_size=0.01):
+        self.fire = fire
+        self.fire_dates = None if fire_dates is None else np.asarray(fire_dates, dtype=np.int64)
+        self.shape = (5, 5) if fire is None else fire.shape[1:]
+        self.west, self.north, self.pixel_size = west, north, pixel_size
+
+    def pixel_center(self, row, col):
+        lon = self.west + (np.asarray(col) + 0.5) * self.pixel_size
+        lat = self.north - (np.asarray(row) + 0.5) * self.pixel_size
+        return lon, lat
+
+
+@pytest.mark.parametrize('count, weights', [
+    (100, [1, 1, 1]),
+    (7, [0.5, 0.3, 0.2]),
+    (1000, [3, 0, 5, 11, 1]),
+    (1, [1, 1, 1, 1]),
+    (0, [2, 3]),
+])
+def test_allocate_sums_to_count(count, weights):
+    quota = allocate(count, weights)
+    assert quota.sum() == count
+    assert (quota >= 0).all()
+    # En büyük kalan: her pay kesin değerinden en fazla 1 sapar
+    exact = count * np.asarray(weights, dtype=np.float64) / np.sum(weights)
+    assert np.all(np.abs(quota - exact) < 1)
+
+
+def test_allocate_gives_nothing_to_zero_weight():
+    quota = allocate(10, [0, 1, 1])
+    assert quota[0] == 0
+    assert quota.tolist() == [0, 5, 5]
+
+
+@pytest.mark.parametrize('count', [1, 7, 100, 12345])
+@pytest.mark.parametrize('allocation', ['proportional', 'equal'])
+def test_month_quotas_sum_to_count(count, allocation):
+    # 2021-07-15 .. 2021-10-03: kısa ilk / son ay; ay başına round() ile count=1 hiç nokta vermezdi
+    months = month_windows(1626307200000, 1633219200000)
+    sizes = np.array([120.0, 3.0, 47.0, 0.5])
+    quotas = _month_quotas(count, months, sizes, allocation)
+    assert quotas.shape == (len(months), len(sizes))
+    assert quotas.sum() == count
+    days = np.array([b - a for a, b, _ in months])
+    assert np.all(np.abs(quotas.sum(axis=1) - count * days / days.sum()) < 1)
+
+
+def _single_fire(day, row=2, col=2, shape=(5, 5)):
+    fire = np.zeros((1,) + shape, dtype=np.float32)
+    fire[0, row, col] = 1
+    return fire, [day * DAY_MS]
+
+
+def test_fire_exclusion_buffer_days():
+    fire, dates = _single_fire(day=100)
+    # Yarıçap bir pikselden küçük: yalnızca yangın pikselinin kendisi tamponlanır
+    exclusion = FireExclusion(FakeBackend(fire, dates), 90, 120, buffer_km=0.5, buffer_days=3)
+    day = np.array([97, 100, 103, 96, 104])
+    near = exclusion.near(np.full(5, 2), np.full(5, 2), day)
+    assert near.tolist() == [True, True, True, False, False]
+    # Komşu piksel yarıçapın dışında
+    assert not exclusion.near(np.array([2]), np.array([3]), np.array([100]))[0]
+
+
+def test_fire_exclusion_buffer_km():
+    fire, dates = _single_fire(day=100)
+    # ~1,1 km piksel, 1,5 km yarıçap: komşu pikseller tamponda, iki piksel ötesi değil
+    exclusion = FireExclusion(FakeBackend(fire, dates), 90, 120, buffer_km=1.5, buffer_days=0)
+    row, col = np.array([1, 3, 2, 2, 0, 2]), np.array([2, 2, 1, 3, 2, 4])
+    near = exclusion.near(row, col, np.full(6, 100))
+    assert near.tolist() == [True, True, True, True, False, False]
+
+
+def test_fire_exclusion_ignores_fires_outside_window():
+    fire, dates = _single_fire(day=200)
+    exclusion = FireExclusion(FakeBackend(fire, dates), 90, 120, buffer_km=0.5, buffer_days=3)
+    assert not exclusion.near(np.array([2]), np.array([2]), np.array([100]))[0]
+
+
+def test_fire_exclusion_without_fire_layer():
+    exclusion = FireExclusion(FakeBackend(None, None), 0, 30)
+    assert not exclusion.near(np.array([0, 1]), np.array([0, 1]), np.array([5, 6])).any()
+
+
+def test_group_ranks():
+    keys = np.array([3, 1, 3, 2, 1, 3])
+    assert _group_ranks(keys).tolist() == [0, 0, 1, 0, 1, 2]
+
+
+def test_group_ranks_limits_each_group():
+    keys = np.random.default_rng(0).integers(0, 4, 200)
+    need = np.array([5, 0, 12, 3])
+    keep = _group_ranks(keys) < need[keys]
+    counts = np.bincount(keys[keep], minlength=4)
+    assert counts.tolist() == np.minimum(need, np.bincount(keys, minlength=4)).tolist()
@@ -0,0 +1,80 @@
+"""src.point_sampler: vektörel örnekleyicinin kompozit (pencere ortalaması) tanımıyla eşliği."""
+import numpy as np
+
+from src.point_sampler import window_mean, sample_points
+from src.raster_backend import LocalRasterBackend, SELECTORS, DAY_MS, LST_WINDOW, NDVI_WINDOW
+
+DAY0 = 18800 * DAY_MS
+
+
+def _backend(seed=0):
+    rng = np.random.default_rng(seed)
+    h, w = 6, 8
+
+    def stack(n, low, high):
+        values = rng.uniform(low, high, (n, h, w)).astype(np.float32)
+        values[rng.random(values.shape) < 0.3] = np.nan  # Bulut / boş pikseller
+        # Karışık sırada tarihler: örnekleyici sıralamaya güvenmemeli
+        return values, DAY0 + rng.permutation(np.arange(n) * 3) * DAY_MS
+
+    lst, lst_dates = stack(15, 280, 320)
+    ndvi, ndvi_dates = stack(10, 0, 1)
+    elevation = rng.uniform(0, 2000, (h, w)).astype(np.float32)
+    return LocalRasterBackend(lst, lst_dates, ndvi, ndvi_dates, elevation, west=30.0, north=37.0,
+                              pixel_size=0.01, roi_bounds=[30.0, 36.94, 30.08, 37.0])
+
+
+def _reference(backend, lon, lat, dates):
+    """Nokta başına: tarih penceresinin kompoziti (backend.composite) + piksel değeri."""
+    rows = []
+    for x, y, d in zip(lon, lat, dates):
+        row, col = (int(v[0]) for v in backend.pixel_index(np.array([x]), np.array([y])))
+        if row < 0:
+            rows.append((np.nan, np.nan, np.nan))
+            continue
+        lst = backend.composite(backend.lst, backend.lst_dates,
+                                d + LST_WINDOW[0] * DAY_MS, d + LST_WINDOW[1] * DAY_MS)
+        ndvi = backend.composite(backend.ndvi, backend.ndvi_dates,
+                                 d + NDVI_WINDOW[0] * DAY_MS, d + NDVI_WINDOW[1] * DAY_MS)
+        rows.append((lst[row, col], ndvi[row, col], backend.elevation[row, col]))
+    return np.array(rows, dtype=np.float64)
+
+
+def test_sample_points_matches_composites():
+    backend = _backend()
+    rng = np.random.default_rng(1)
+    n = 300
+    lon, lat = rng.uniform(29.99, 30.09, n), rng.uniform(36.93, 37.01, n)  # Bir kısmı ROI dışında
+    dates = DAY0 + rng.integers(-5, 50, n) * DAY_MS + rng.integers(0, DAY_MS, n)
+
+    table = sample_points(backend, lon, lat, dates, label=1)
+    assert list(table.columns) == SELECTORS
+    assert (table['label'] == 1).all() and np.array_equal(table['ACQ_DATE'], dates)
+
+    expected = _reference(backend, lon, lat, dates)
+    actual = table[['LST', 'NDVI', 'elevation']].to_numpy(dtype=np.float64)
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    assert np.allclose(actual, expected, equal_nan=True, rtol=1e-5)
+    assert np.isnan(actual).any() and (~np.isnan(actual)).any()
+
+
+def test_window_bounds_are_half_open():
+    stack = np.array([1.0, 2.0, 4.0]).reshape(3, 1, 1)
+    dates = np.array([0, 1, 2]) * DAY_MS
+    row = col = np.zeros(4, dtype=np.int64)
+    points = np.array([0, 1, 2, 10]) * DAY_MS
+    # Pencere [tarih - 1 gün, tarih + 1 gün): başlangıç dahil, bitiş hariç
+    result = window_mean(stack, dates, row, col, points, (-1, 1))
+    assert np.allclose(result, [1.0, 1.5, 3.0, np.nan], equal_nan=True)
+
+
+def test_window_mean_skips_nan_and_outside_points():
+    stack = np.array([np.nan, 3.0, np.nan]).reshape(3, 1, 1)
+    dates = np.array([0, 1, 2]) * DAY_MS
+    row = np.array([0, -1, 0])
+    col = np.array([0, -1, 0])
+    points = np.array([1, 1, 0]) * DAY_MS
+    result = window_mean(stack, dates, row, col, points, (-1, 2))
+    assert np.allclose(result, [3.0, np.nan, 3.0], equal_nan=True)
+    # Penceresindeki tüm görüntüler boş olan nokta NaN
+    assert np.isnan(window_mean(stack, dates, row[:1], col[:1], np.array([0]), (0, 1)))[0]
@@ -0,0 +1,115 @@
+"""src.scoring_service: mikro batch hata yalıtımı, girdi doğrulama ve hata sayaçları (model gerekmez)."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from src.scoring_service import ServiceMetrics, MicroBatcher, ScoringService, make_handler, run_load_test
+
+BAD_LON = 31.0  # FakeFeatures bu boylamın doğusundaki noktalarda hata verir
+
+
+class FakeScorer:
+    """Olasılık = LST / 1000; çağrılan batch boyutlarını kaydeder."""
+    steps = 1
+    batch_size = None
+
+    def __init__(self):
+        self.calls = []
+
+    def warmup(self):
+        pass
+
+    def score(self, X):
+        self.calls.append(len(X))
+        return np.asarray(X)[:, 0] / 1000
+
+
+class FakeFeatures:
+    def resolve_dates(self, dates):
+        return np.zeros(len(dates), dtype=np.int64)
+
+    def build(self, lon, lat, dates_ms):
+        if (np.asarray(lon) > BAD_LON).any():
+            raise ValueError('raster dışı')
+        X = np.column_stack([np.asarray(lon) * 10, np.full(len(lon), 0.3), np.full(len(lon), 100.0)])
+        valid = np.asarray(lat) < 37.0  # 37.0 kuzeyi veri yok (NaN)
+        return X.astype(np.float32), valid
+
+
+def _batcher(max_wait_ms=200.0):
+    scorer = FakeScorer()
+    return MicroBatcher(scorer, ServiceMetrics(), FakeFeatures(), max_batch=1000, max_wait_ms=max_wait_ms), scorer
+
+
+def test_bad_point_block_does_not_fail_batch():
+    batcher, scorer = _batcher()
+    good = batcher.submit('points', [[30.0, 36.5, 0], [30.5, 37.2, 0]])
+    bad = batcher.submit('points', [[32.0, 36.5, 0]])
+    features = batcher.submit('features', [[250.0, 0.1, 10.0]])
+    assert np.allclose(good.result(timeout=5), [0.3, np.nan], equal_nan=True)
+    assert np.allclose(features.result(timeout=5), [0.25])
+    with pytest.raises(ValueError, match='raster'):
+        bad.result(timeout=5)
+    assert scorer.calls == [2]  # Geçerli satırlar tek batch'te puanlandı
+
+
+def test_bad_features_block_is_isolated():
+    batcher, _ = _batcher()
+    bad = batcher.submit('features', [['a', 'b', 'c']])
+    good = batcher.submit('features', [[500.0, 0.1, 10.0]])
+    assert np.allclose(good.result(timeout=5), [0.5])
+    with pytest.raises(ValueError):
+        bad.result(timeout=5)
+
+
+def test_scorer_failure_reaches_every_request():
+    batcher, scorer = _batcher()
+    scorer.score = lambda X: (_ for _ in ()).throw(RuntimeError('model'))
+    futures = [batcher.submit('features', [[1.0, 2.0, 3.0]]) for _ in range(3)]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+
+@pytest.mark.parametrize('rows', [[], [[1.0, 2.0]], [[1.0, None, 3.0]], [[1.0, float('inf'), 3.0]], 'abc'])
+def test_check_features_rejects_invalid_input(rows):
+    service = ScoringService(FakeScorer(), FakeFeatures(), max_wait_ms=1.0)
+    with pytest.raises(ValueError):
+        service.check_features(rows)
+
+
+def test_check_features_squeezes_single_step():
+    service = ScoringService(FakeScorer(), FakeFeatures(), max_wait_ms=1.0)
+    assert service.check_features([[[1.0, 2.0, 3.0]]]).shape == (1, 3)
+
+
+def test_metrics_count_concurrent_errors():
+    metrics = ServiceMetrics()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda _: metrics.record_error(), range(5000)))
+    assert metrics.snapshot()['errors'] == 5000
+
+
+def test_load_test_counts_every_error():
+    service = ScoringService(FakeScorer(), FakeFeatures(), max_wait_ms=2.0)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(service))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        # Boylamı BAD_LON'un doğusundaki istekler 400 döner
+        bounds = [30.0, 36.0, 32.0, 36.9]
+        result = run_load_test(f'http://127.0.0.1:{server.server_address[1]}', concurrency=8,
+                               n_requests=120, bounds=bounds, seed=1)
+        lons = np.random.default_rng(1).uniform(30.0, 32.0, 120)
+        expected = int((np.round(lons, 5) > BAD_LON).sum())
+        assert result['errors'] == expected
+        snapshot = service.metrics.snapshot()
+        assert snapshot['errors'] == expected
+        assert snapshot['requests'] == 120 - expected
+    finally:
+        server.shutdown()
+        server.server_close()
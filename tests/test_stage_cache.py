@@ -0,0 +1,99 @@
+"""src.stage_cache ve birleştirme aşamasının damgası (data_preprocessing.run_merge_stage)."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import data_preprocessing
+from src.stage_cache import StageCache, stage_key, read_stamp, DONE_FILE
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Göreli data/ yolları (depo, önbellek, özet indeksi) geçici klasöre yazılsın."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+    return tmp_path
+
+
+def _write_csvs():
+    rows = {'label': [1, 1], 'LST': [300.0, 301.0], 'NDVI': [0.3, 0.4], 'elevation': [100, 200],
+            'ACQ_DATE': [1625097600000, 1625184000000], 'lon': [30.1, 30.2], 'lat': [36.9, 36.8]}
+    pd.DataFrame(rows).to_csv(data_preprocessing.FIRE_DATA_PATH, index=False)
+    pd.DataFrame(rows).assign(label=0, LST=[290.0, 291.0]).to_csv(data_preprocessing.NON_FIRE_DATA_PATH,
+                                                                  index=False)
+
+
+def test_get_or_compute_hit_and_miss(workdir):
+    cache, calls = StageCache(), []
+
+    def compute():
+        calls.append(1)
+        return {'X': np.arange(4), 'meta': {'n': 4}}
+
+    first = cache.get_or_compute('split', 'abc', compute)
+    second = cache.get_or_compute('split', 'abc', compute)
+    assert len(calls) == 1
+    assert np.array_equal(second['X'], first['X']) and second['meta'] == {'n': 4}
+    cache.get_or_compute('split', 'other', compute)
+    assert len(calls) == 2
+
+
+def test_unfinished_entry_is_not_a_hit(workdir):
+    cache = StageCache()
+    cache.save('split', 'abc', {'X': np.arange(3)})
+    os.remove(os.path.join(cache.path('split', 'abc'), DONE_FILE))
+    assert not cache.has('split', 'abc')
+
+
+def test_stage_key_follows_content_and_params(workdir):
+    path = os.path.join('data', 'input.csv')
+    with open(path, 'w') as f:
+        f.write('a\n1\n')
+    key = stage_key('merge', [path], {'streaming': False})
+    assert stage_key('merge', [path], {'streaming': False}) == key
+    assert stage_key('merge', [path], {'streaming': True}) != key
+    with open(path, 'w') as f:
+        f.write('a\n2\n')
+    assert stage_key('merge', [path], {'streaming': False}) != key
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_merge_stage_skips_when_inputs_unchanged(workdir, monkeypatch, streaming):
+    _write_csvs()
+    assert data_preprocessing.run_merge_stage(streaming=streaming)
+    stamp = read_stamp(data_preprocessing.OUTPUT_STORE_PATH)
+    assert stamp is not None
+
+    calls = []
+    original = data_preprocessing.merge_columns
+    monkeypatch.setattr(data_preprocessing, 'merge_columns', lambda *a: calls.append(1) or original(*a))
+    assert data_preprocessing.run_merge_stage(streaming=streaming)
+    assert calls == []
+    assert read_stamp(data_preprocessing.OUTPUT_STORE_PATH) == stamp
+
+
+def test_failed_merge_does_not_stamp_old_store(workdir, monkeypatch):
+    _write_csvs()
+    assert data_preprocessing.run_merge_stage()
+    old_stamp = read_stamp(data_preprocessing.OUTPUT_STORE_PATH)
+
+    # Girdiler değişir ama okuma başarısız olur: eski depo yeni anahtarla damgalanmamalı
+    pd.read_csv(data_preprocessing.FIRE_DATA_PATH).assign(LST=3100.25).to_csv(
+        data_preprocessing.FIRE_DATA_PATH, index=False)
+
+    def fail(*args):
+        raise OSError('okunamadı')
+
+    monkeypatch.setattr(data_preprocessing, 'merge_columns', fail)
+    assert not data_preprocessing.run_merge_stage()
+    assert read_stamp(data_preprocessing.OUTPUT_STORE_PATH) == old_stamp
+
+    # Sonraki çalıştırma önbellek isabeti saymaz, birleştirmeyi yeniden yapar
+    monkeypatch.undo()
+    monkeypatch.chdir(workdir)
+    assert data_preprocessing.run_merge_stage()
+    assert read_stamp(data_preprocessing.OUTPUT_STORE_PATH) != old_stamp
+    merged = data_preprocessing.read_table(data_preprocessing.OUTPUT_STORE_PATH)
+    assert (merged.loc[merged['label'] == 1, 'LST'] == 3100.25).all()
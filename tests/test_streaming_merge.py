@@ -0,0 +1,90 @@
+"""Akış modunda birleştirme: StoreWriter parçalı yazımı ve kovalı karıştırma."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import data_preprocessing
+from src.dataset_store import StoreWriter, read_table, exists
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+    return tmp_path
+
+
+def _frame(start, n):
+    i = np.arange(start, start + n)
+    return pd.DataFrame({'label': i % 2, 'LST': 280.0 + i, 'NDVI': i / 100, 'elevation': i * 10,
+                         'ACQ_DATE': 1625097600000 + i * 86400000})
+
+
+def test_store_writer_round_trip(workdir, monkeypatch):
+    monkeypatch.setattr(StoreWriter, 'BLOCK_ROWS', 3)  # .bin -> .npy kopyası birden çok blokta
+    path = os.path.join('data', 'store', 'table')
+    chunks = [_frame(0, 5), _frame(5, 0), _frame(5, 8)]
+    with StoreWriter(path) as writer:
+        for chunk in chunks:
+            writer.append(chunk)
+    table = read_table(path, mmap=False)
+    expected = pd.concat(chunks, ignore_index=True)
+    assert table.columns.tolist() == expected.columns.tolist()
+    assert np.allclose(table.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64))  # float32 şema
+    assert not any(name.endswith('.bin') for name in os.listdir(path))
+
+    # Aynı yola yeni yazım eski içeriği tamamen değiştirir
+    with StoreWriter(path) as writer:
+        writer.append(_frame(100, 2))
+    assert read_table(path, mmap=False)['LST'].tolist() == [380.0, 381.0]
+
+
+def test_store_writer_failure_leaves_no_table(workdir):
+    path = os.path.join('data', 'store', 'table')
+    with pytest.raises(RuntimeError):
+        with StoreWriter(path) as writer:
+            writer.append(_frame(0, 3))
+            raise RuntimeError('kesildi')
+    assert not exists(path)
+
+
+def _write_inputs(n_fire=40, n_non_fire=55):
+    fire, non_fire = _frame(0, n_fire), _frame(1000, n_non_fire)
+    fire.loc[3, 'NDVI'] = np.nan  # Temizlikte düşer
+    fire.to_csv(data_preprocessing.FIRE_DATA_PATH, index=False)
+    non_fire.to_csv(data_preprocessing.NON_FIRE_DATA_PATH, index=False)
+    return pd.concat([fire.assign(label=1), non_fire.assign(label=0)], ignore_index=True).dropna()
+
+
+def _rows(table):
+    columns = ['label', 'LST', 'NDVI', 'elevation', 'ACQ_DATE']
+    values = table[columns].to_numpy(dtype=np.float64)
+    return values[np.lexsort(values.T[::-1])]
+
+
+def test_streaming_merge_is_a_shuffle_of_the_clean_rows(workdir):
+    expected = _write_inputs()
+    assert data_preprocessing.load_and_process_data_streaming(chunksize=7, n_buckets=4)
+    streamed = read_table(data_preprocessing.OUTPUT_STORE_PATH, mmap=False)
+    assert len(streamed) == len(expected) == 94
+    assert np.allclose(_rows(streamed), _rows(expected))
+    # Karıştırıldı: giriş sırası korunmadı, iki sınıf iç içe
+    assert not np.array_equal(streamed['LST'].to_numpy(), expected['LST'].to_numpy())
+    assert streamed['label'].iloc[:40].nunique() == 2
+
+    # Aynı tohum aynı karışımı verir ve bellekteki birleştirmeyle aynı satırları üretir
+    assert data_preprocessing.load_and_process_data_streaming(chunksize=7, n_buckets=4)
+    again = read_table(data_preprocessing.OUTPUT_STORE_PATH, mmap=False)
+    assert np.array_equal(again.to_numpy(dtype=np.float64), streamed.to_numpy(dtype=np.float64))
+    assert data_preprocessing.load_and_process_data()
+    in_memory = read_table(data_preprocessing.OUTPUT_STORE_PATH, mmap=False)
+    assert np.allclose(_rows(in_memory), _rows(streamed))
+
+
+def test_streaming_merge_cleans_up_buckets(workdir):
+    _write_inputs()
+    data_preprocessing.load_and_process_data_streaming(chunksize=10, n_buckets=3)
+    store_folder = os.path.dirname(data_preprocessing.OUTPUT_STORE_PATH)
+    assert not [name for name in os.listdir(store_folder) if name.startswith('buckets_')]
@@ -0,0 +1,19 @@
+"""src.timing.cold_start_seconds: yeni süreçte süre ölçümü ve hata raporu."""
+import pytest
+
+from src.timing import cold_start_seconds
+
+
+def test_cold_start_returns_seconds():
+    assert cold_start_seconds('x = 1', repeats=1) >= 0
+
+
+def test_cold_start_reports_last_stderr_line():
+    with pytest.raises(RuntimeError, match='ZeroDivisionError'):
+        cold_start_seconds('1 / 0', repeats=1)
+
+
+def test_cold_start_killed_process_reports_exit_code():
+    # Öldürülen süreç stderr'e bir şey yazmaz
+    with pytest.raises(RuntimeError, match='-9'):
+        cold_start_seconds('import os, signal; os.kill(os.getpid(), signal.SIGKILL)', repeats=1)